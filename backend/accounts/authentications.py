@@ -1,12 +1,16 @@
 import jwt
-from django.conf import settings
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth import get_user_model
+from accounts.principal_cache import get_principal
+from accounts.tokens import get_verified_access_token
 
 
 User = get_user_model()
 
+# 요청마다 DB를 조회하지 않도록 캐시하는 인증 관련 필드 (coin_amount, password 등은 접근 시 DB에서 조회)
+USER_PRINCIPAL_FIELDS = ('id', 'name', 'email', 'birth', 'created_at', 'policy', 'marketing', 'is_active')
+
 class CustomAuthentication(BaseAuthentication):
     def authenticate(self, request):
         # 회원가입, 비밀번호 재설정 인증번호 전송 기능은 auth가 필요없음
@@ -20,19 +24,21 @@ class CustomAuthentication(BaseAuthentication):
         token = auth_header.split(' ')[1]
 
         try:
-            decoded_token = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-            user_id = decoded_token.get('user_id')
-            role = decoded_token.get('role')
+            verified_token = get_verified_access_token(request, token)
+            user_id = verified_token.get('user_id')
+            role = verified_token.get('role')
 
             if user_id is None or role != 'host':
                 raise AuthenticationFailed('권한이 없습니다.')
 
-            user = User.objects.get(pk=user_id)
+            user = get_principal(User, user_id, USER_PRINCIPAL_FIELDS)
+            if user is None:
+                raise User.DoesNotExist
 
             if not user.is_active:
                 raise AuthenticationFailed('권한이 없습니다.')
 
-            return (user, None)
+            return (user, verified_token)
 
         except jwt.ExpiredSignatureError:
             raise AuthenticationFailed('토큰이 만료되었습니다.')
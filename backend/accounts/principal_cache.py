@@ -0,0 +1,103 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+
+class LocalLRUCache:
+    # 프로세스 내부에서 redis 조회까지 생략하기 위한 짧은 TTL의 LRU 캐시
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self.items[key]
+                return None
+
+            self.items.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        # ttl을 주면 항목별 만료 시간으로 사용 (토큰 만료 시각까지 캐시하는 경우 등)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        with self.lock:
+            self.items[key] = (time.monotonic() + ttl, value)
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+
+_local_cache = LocalLRUCache(settings.AUTH_PRINCIPAL_LOCAL_CACHE_SIZE, settings.AUTH_PRINCIPAL_LOCAL_CACHE_TTL)
+
+
+def get_principal_cache_key(model, pk):
+    return f"auth:principal:{model._meta.label_lower}:{pk}"
+
+
+def get_principal(model, pk, fields):
+    # 인증에 필요한 필드만 캐시하고, 나머지 필드(적립금, 비밀번호 등)는 deferred로 두어 접근 시 DB에서 조회
+    key = get_principal_cache_key(model, pk)
+
+    values = _local_cache.get(key)
+    if values is None:
+        values = get_shared_cache(key)
+
+        if values is None:
+            values = model.objects.filter(pk=pk).values(*fields).first()
+            if values is None:
+                return None
+            set_shared_cache(key, values)
+
+        _local_cache.set(key, values)
+
+    return model.from_db(DEFAULT_DB_ALIAS, list(values.keys()), list(values.values()))
+
+
+def invalidate_principal(model, pk):
+    key = get_principal_cache_key(model, pk)
+    _local_cache.delete(key)
+    try:
+        cache.delete(key)
+    except Exception as e:
+        logging.error(f"인증 캐시 삭제 실패 {key}: {str(e)}")
+
+
+def get_shared_cache(key):
+    # redis 장애 시에도 인증은 DB 조회로 계속 동작해야 함
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logging.warning(f"인증 캐시 조회 실패 {key}: {str(e)}")
+        return None
+
+
+def set_shared_cache(key, values):
+    if settings.AUTH_PRINCIPAL_CACHE_TTL <= 0:
+        return
+    try:
+        cache.set(key, values, settings.AUTH_PRINCIPAL_CACHE_TTL)
+    except Exception as e:
+        logging.warning(f"인증 캐시 저장 실패 {key}: {str(e)}")
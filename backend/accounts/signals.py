@@ -0,0 +1,13 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from accounts.principal_cache import invalidate_principal
+
+
+User = get_user_model()
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_principal(sender, instance, **kwargs):
+    # is_active 등 인증 관련 필드가 바뀔 수 있으므로 저장/삭제 시 캐시된 인증 정보 삭제
+    invalidate_principal(User, instance.pk)
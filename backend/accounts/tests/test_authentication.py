@@ -0,0 +1,301 @@
+import os
+import jwt
+import time
+import unittest
+from unittest.mock import patch
+from django.test import TestCase, RequestFactory
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from accounts.authentications import CustomAuthentication
+from accounts.tokens import clear_token_cache
+
+
+User = get_user_model()
+
+# 캐시된 토큰/사용자로 인증할 때 요청당 허용하는 인증 처리 시간(초)
+# 실행 환경에 따라 달라지므로 AUTH_BENCHMARK=1로 실행할 때만 확인
+AUTH_BENCHMARK = os.environ.get('AUTH_BENCHMARK') == '1'
+AUTH_OVERHEAD_BUDGET_SECONDS = 0.001
+BENCHMARK_ITERATIONS = 1000
+
+class CommenTestSetUp(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            name='test',
+            email='test@test.com',
+            password='password!',
+            birth='2024-10-14',
+            coin_amount=1000,
+            policy=True,
+            marketing=True
+        )
+        self.url = '/api/coin/'
+        clear_token_cache()
+
+    def get_token(self, user, role):
+        token = AccessToken.for_user(user)
+        token['role'] = role
+        return token
+
+    def get_updated_columns(self, queries):
+        # 사용자 테이블 UPDATE 쿼리마다 SET 절의 컬럼 목록
+        user_table = connection.ops.quote_name(User._meta.db_table)
+        return [
+            [column.split('=')[0].strip().strip('"`') for column in query['sql'].split(' SET ')[1].split(' WHERE ')[0].split(', ')]
+            for query in queries if query['sql'].startswith(f'UPDATE {user_table}')
+        ]
+
+    def count_user_queries(self, queries):
+        user_table = connection.ops.quote_name(User._meta.db_table)
+        return len([query for query in queries if f'FROM {user_table}' in query['sql']])
+
+class CustomAuthenticationCacheTestCase(CommenTestSetUp):
+    def test_cached_principal(self):
+        '''
+        같은 사용자의 두 번째 요청부터는 인증 시 사용자 테이블을 조회하지 않는다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 적립금은 캐시하지 않고 접근 시 조회 (1회)
+        self.assertEqual(self.count_user_queries(queries), 1)
+
+    def test_cached_principal_reads_fresh_coin_amount(self):
+        '''
+        캐시된 사용자라도 적립금은 항상 최신 값을 반환한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+        User.objects.filter(id=self.user.id).update(coin_amount=500)
+
+        # when
+        response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json().get('coin'), 500)
+
+    def test_cached_principal_invalidated_on_deactivate(self):
+        '''
+        캐시된 사용자가 탈퇴하면 다음 요청은 401 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+        self.user.is_active = False
+        self.user.save()
+
+        # when
+        response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json().get('message'), '권한이 없습니다.')
+
+    def test_cached_principal_invalidated_on_delete(self):
+        '''
+        캐시된 사용자가 삭제되면 다음 요청은 401 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+        self.user.delete()
+
+        # when
+        response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json().get('message'), '유저를 찾을 수 없습니다.')
+
+    def test_cached_principal_invalidated_on_withdraw(self):
+        '''
+        회원 탈퇴 API는 is_active만 저장하고 캐시된 인증 정보를 삭제해 다음 요청은 401 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            self.client.patch('/api/users/', **headers)
+        # 다음 요청 시작 시 쿼리 기록이 초기화되므로 먼저 확인
+        updated_columns = self.get_updated_columns(queries)
+        response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(updated_columns, [['is_active']])
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_update_marketing_keeps_other_fields(self):
+        '''
+        캐시된 사용자로 마케팅 수신 여부를 수정해도 그 사이 바뀐 다른 필드를 캐시된 값으로 덮어쓰지 않는다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+        User.objects.filter(id=self.user.id).update(name='changed')
+
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put('/api/users/', {'marketing': False}, content_type='application/json', **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_updated_columns(queries), [['marketing']])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.name, 'changed')
+        self.assertFalse(self.user.marketing)
+
+    def test_cached_principal_invalidated_on_password_change(self):
+        '''
+        비밀번호를 변경하면 password만 저장하고 캐시된 인증 정보를 삭제한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+        data = {'password1': 'newpassword!', 'password2': 'newpassword!'}
+
+        # when
+        with patch('accounts.views.invalidate_principal') as mock_invalidate, \
+                CaptureQueriesContext(connection) as queries:
+            response = self.client.put('/api/users/password/', data, content_type='application/json', **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_updated_columns(queries), [['password']])
+        mock_invalidate.assert_called_once_with(User, self.user.id)
+
+
+class TokenCacheTestCase(CommenTestSetUp):
+    def test_token_decoded_once_for_repeated_requests(self):
+        '''
+        같은 토큰으로 반복 요청하면 서명 검증/디코딩은 한 번만 수행한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+        # when
+        with patch('accounts.tokens.jwt.decode', wraps=jwt.decode) as mock_decode:
+            for _ in range(3):
+                response = self.client.get(self.url, **headers)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # then
+        self.assertEqual(mock_decode.call_count, 1)
+
+    def test_cached_token_expired(self):
+        '''
+        캐시된 토큰이라도 만료 시각이 지나면 401 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+
+        # when
+        with patch('accounts.tokens.time.time', return_value=token['exp'] + 1):
+            response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json().get('message'), '토큰이 만료되었습니다.')
+
+    def test_reissue_token_decodes_refresh_token_once(self):
+        '''
+        accessToken 재발급 시 refresh 토큰은 한 번만 디코딩한다
+        '''
+        # given
+        refresh = RefreshToken.for_user(self.user)
+        refresh['role'] = 'host'
+
+        # when
+        # simplejwt 토큰 백엔드도 jwt.decode를 사용하므로 모듈 함수를 감싸 전체 디코딩 횟수를 셈
+        with patch('jwt.decode', wraps=jwt.decode) as mock_decode:
+            response = self.client.patch('/api/users/login/', {'refresh': str(refresh)}, content_type='application/json')
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.json())
+        self.assertEqual(mock_decode.call_count, 1)
+
+    def test_reissue_token_with_access_token(self):
+        '''
+        refresh 대신 access 토큰으로 재발급을 요청하면 400 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user, 'host')
+
+        # when
+        response = self.client.patch('/api/users/login/', {'refresh': str(token)}, content_type='application/json')
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json().get('message'), '토큰 오류가 발생했습니다. 다시 시도해 주세요.')
+
+
+class CachedAuthenticationTestCase(CommenTestSetUp):
+    def setUp(self):
+        super().setUp()
+        token = self.get_token(self.user, 'host')
+        factory = RequestFactory()
+        self.authentication = CustomAuthentication()
+        self.requests = [
+            Request(factory.get(self.url, HTTP_AUTHORIZATION=f'Bearer {token}'))
+            for _ in range(BENCHMARK_ITERATIONS + 1)
+        ]
+
+    def test_cached_authentication_skips_decode_and_queries(self):
+        '''
+        토큰과 사용자가 캐시된 상태에서는 서명 검증/디코딩과 DB 조회 없이 인증한다
+        '''
+        # given
+        with patch('jwt.decode', wraps=jwt.decode) as mock_decode:
+            self.authentication.authenticate(self.requests[0])
+
+            # when
+            with CaptureQueriesContext(connection) as queries:
+                results = [self.authentication.authenticate(request) for request in self.requests[1:10]]
+
+        # then
+        self.assertEqual(mock_decode.call_count, 1)
+        self.assertEqual(len(queries), 0)
+        self.assertTrue(all(user.id == self.user.id for user, _ in results))
+
+    @unittest.skipUnless(AUTH_BENCHMARK, 'AUTH_BENCHMARK=1일 때만 실행')
+    def test_auth_overhead_per_request(self):
+        '''
+        토큰과 사용자가 캐시된 상태에서 요청당 인증 처리 시간이 상한 이내
+        '''
+        # given
+        self.authentication.authenticate(self.requests[0])
+
+        # when
+        started_at = time.perf_counter()
+        for request in self.requests[1:]:
+            self.authentication.authenticate(request)
+        elapsed = (time.perf_counter() - started_at) / BENCHMARK_ITERATIONS
+
+        # then
+        self.assertLess(elapsed, AUTH_OVERHEAD_BUDGET_SECONDS)
@@ -0,0 +1,66 @@
+import time
+import hashlib
+import jwt
+from django.conf import settings
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.utils import aware_utcnow
+
+from accounts.principal_cache import LocalLRUCache
+
+
+# 검증이 끝난 토큰의 claims를 토큰 만료 시각까지 보관 (같은 토큰으로 반복 요청 시 서명 검증/디코딩 생략)
+_claims_cache = LocalLRUCache(settings.AUTH_TOKEN_CACHE_SIZE, settings.AUTH_TOKEN_CACHE_MAX_TTL)
+
+
+def get_token_cache_key(token):
+    if isinstance(token, str):
+        token = token.encode()
+    return hashlib.sha256(token).hexdigest()
+
+
+def decode_token(token):
+    # 만료/위조 시 PyJWT 예외(ExpiredSignatureError, InvalidTokenError)를 그대로 전달
+    key = get_token_cache_key(token)
+
+    claims = _claims_cache.get(key)
+    if claims is None:
+        claims = jwt.decode(token, settings.SIMPLE_JWT['SIGNING_KEY'], algorithms=[settings.SIMPLE_JWT['ALGORITHM']])
+
+        exp = claims.get('exp')
+        if exp is not None:
+            _claims_cache.set(key, claims, exp - time.time())
+    elif claims.get('exp') is not None and claims['exp'] <= time.time():
+        _claims_cache.delete(key)
+        raise jwt.ExpiredSignatureError('Signature has expired')
+
+    # 캐시된 claims가 변경되지 않도록 복사본을 반환
+    return dict(claims)
+
+
+def get_request_claims(request, token):
+    # 한 요청 안에서는 여러 인증 클래스/뷰가 같은 claims를 재사용
+    request = getattr(request, '_request', request)
+    cached = getattr(request, '_token_claims', None)
+    if cached is not None and cached[0] == token:
+        return dict(cached[1])
+
+    claims = decode_token(token)
+    request._token_claims = (token, claims)
+    return dict(claims)
+
+
+def token_from_claims(token_class, token, claims):
+    # 이미 검증한 claims로 simplejwt 토큰 객체를 생성 (생성자의 재디코딩을 피함)
+    verified_token = token_class.__new__(token_class)
+    verified_token.token = token
+    verified_token.current_time = aware_utcnow()
+    verified_token.payload = claims
+    return verified_token
+
+
+def get_verified_access_token(request, token):
+    return token_from_claims(AccessToken, token, get_request_claims(request, token))
+
+
+def clear_token_cache():
+    _claims_cache.clear()
@@ -3,16 +3,16 @@ from rest_framework.decorators import api_view, permission_classes, authenticati
 from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
-from jwt import decode
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from django.contrib.auth import get_user_model, authenticate
 from django.contrib.auth.hashers import check_password
 from django_redis import get_redis_connection
-from django.conf import settings
 
 from proctormatic.utils import ok_response, ok_with_data_response, bad_request_response, conflict_response, \
     created_response, no_content_response, bad_request_invalid_data_response, unauthorized_response, not_found_response
 from .authentications import CustomAuthentication
+from .principal_cache import invalidate_principal
+from .tokens import decode_token, token_from_claims
 from .utils import generate_verification_code, send_verification_email, save_verification_code_to_redis
 from .serializers import CustomTokenObtainPairSerializer, SendEmailVerificationSerializer, EmailVerificationSerializer, \
     UserSerializer, UserInfoSerializer, EditMarketingSerializer, FindEmailRequestSerializer, \
@@ -108,13 +108,16 @@ def handle_user(request):
         serializer = EditMarketingSerializer(data=request.data)
         if serializer.is_valid():
             user.marketing = serializer.data.get('marketing')
-            user.save()
+            # 인증 캐시에서 만든 사용자 객체의 다른 필드 값으로 덮어쓰지 않도록 변경한 필드만 저장
+            user.save(update_fields=['marketing'])
             return ok_response('마케팅 활용 및 광고 수신 여부가 수정되었습니다.')
         return bad_request_invalid_data_response()
 
     elif request.method == 'PATCH':
         user.is_active = False
-        user.save()
+        user.save(update_fields=['is_active'])
+        # 탈퇴한 사용자의 토큰이 캐시된 인증 정보로 통과하지 않도록 즉시 삭제
+        invalidate_principal(User, user.id)
         return no_content_response('회원 탈퇴를 완료했습니다.')
 
 
@@ -143,13 +146,15 @@ def handle_token(request):
 
         try:
             try:
-                decode(refresh_token, settings.SECRET_KEY, algorithms=['HS256'])
+                claims = decode_token(refresh_token)
             except ExpiredSignatureError:
                 return unauthorized_response('토큰이 만료되었습니다. 다시 로그인 해주세요.')
             except InvalidTokenError:
                 return bad_request_response('유효하지 않은 토큰입니다.')
 
-            refresh = RefreshToken(refresh_token)
+            # 디코딩한 claims로 RefreshToken을 만들어 서명 검증을 한 번만 수행
+            refresh = token_from_claims(RefreshToken, refresh_token, claims)
+            refresh.verify()
             new_access_token = str(refresh.access_token)
             return ok_with_data_response({'access': new_access_token})
 
@@ -252,5 +257,6 @@ def update_password(user, password1, password2):
         return conflict_response('기존 비밀번호와 다른 비밀번호를 입력해주세요.')
 
     user.set_password(password1)
-    user.save()
+    user.save(update_fields=['password'])
+    invalidate_principal(User, user.id)
     return ok_response('비밀번호가 성공적으로 변경되었습니다.')
\ No newline at end of file
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models import F
+from django.contrib.auth import get_user_model
+
+from .models import Coin
+
+User = get_user_model()
+
+
+class InsufficientCoinError(Exception):
+    pass
+
+
+def apply_coin_change(user_id, delta, coin_type, amount, exam_id=None):
+    # 잔액 확인과 증감을 UPDATE 한 문장으로 처리 (행을 미리 잠그거나 읽지 않아 동시 요청에도 갱신이 유실되지 않음)
+    with transaction.atomic():
+        users = User.objects.filter(id=user_id)
+        if delta < 0:
+            users = users.filter(coin_amount__gte=-delta)
+
+        if not users.update(coin_amount=F('coin_amount') + delta):
+            raise InsufficientCoinError
+
+        return Coin.objects.create(
+            user_id=user_id,
+            exam_id=exam_id,
+            type=coin_type,
+            amount=amount
+        )
+
+
+def charge_coin(user_id, amount):
+    return apply_coin_change(user_id, amount, 'charge', amount)
+
+
+def use_coin(user_id, amount, exam_id=None):
+    return apply_coin_change(user_id, -amount, 'use', amount, exam_id)
+
+
+def refund_coin(user_id, amount, exam_id=None):
+    return apply_coin_change(user_id, amount, 'refund', amount, exam_id)
+
+
+def settle_exam_cost(user_id, exam_id, cost_difference):
+    # 시험 비용 변경 시 차액만큼 사용/환불 (차액이 없으면 내역을 남기지 않음)
+    if cost_difference > 0:
+        return use_coin(user_id, cost_difference, exam_id)
+    if cost_difference < 0:
+        return refund_coin(user_id, -cost_difference, exam_id)
+    return None
@@ -19,6 +19,25 @@ class Coin(models.Model):
 
     class Meta:
         db_table = 'coin'
+        # 적립금 내역 조회 (사용자별 최신순, type 필터 선택)
+        indexes = [
+            models.Index(fields=['user', 'created_at'], name='coin_user_created_idx'),
+            models.Index(fields=['user', 'type', 'created_at'], name='coin_user_type_created_idx'),
+        ]
+
+class CoinSummary(models.Model):
+    # 사용자/유형별 적립금 내역 건수와 합계 (내역 생성/삭제 시 증분 갱신, 목록 조회 시 COUNT(*) 대신 사용)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    type = models.CharField(max_length=20, choices=Coin.TYPE_CHOICES)
+    count = models.IntegerField(default=0)
+    amount = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'coin_summary'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'type'], name='coin_summary_user_type_uniq'),
+        ]
 
 class CoinCode(models.Model):
     code = models.CharField(max_length=100)
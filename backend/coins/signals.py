@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from coins.models import Coin
+from coins.summary import apply_coin_summary
+
+
+@receiver(post_save, sender=Coin)
+def add_coin_summary(sender, instance, created, **kwargs):
+    # 내역 생성 시에만 반영 (유형/금액은 생성 후 변경하지 않음)
+    if created:
+        apply_coin_summary(instance.user_id, instance.type, 1, instance.amount)
+
+
+@receiver(post_delete, sender=Coin)
+def subtract_coin_summary(sender, instance, **kwargs):
+    apply_coin_summary(instance.user_id, instance.type, -1, -instance.amount)
@@ -0,0 +1,67 @@
+from django.db import transaction
+from django.db.models import F, Count, Sum
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .models import Coin, CoinSummary
+
+User = get_user_model()
+
+COIN_TYPES = [coin_type for coin_type, _ in Coin.TYPE_CHOICES]
+
+
+def lock_coin_summary(user_id):
+    # 요약 행 생성(집계 + INSERT)과 증분 갱신이 서로 끼어들지 않도록 사용자 행을 잠가 사용자 단위로 직렬화
+    # (잠그지 않으면 집계 이후 ~ INSERT 이전에 생성된 내역은 갱신할 요약 행이 없어 누락됨)
+    list(User.objects.select_for_update().filter(id=user_id).values_list('id', flat=True))
+
+
+def apply_coin_summary(user_id, coin_type, count, amount):
+    # 요약 행이 아직 없는 사용자는 조회 시 전체 내역으로 생성하므로 여기서는 기존 행만 갱신
+    with transaction.atomic():
+        lock_coin_summary(user_id)
+        CoinSummary.objects.filter(user_id=user_id, type=coin_type).update(
+            count=F('count') + count,
+            amount=F('amount') + amount,
+            updated_at=timezone.now()
+        )
+
+
+def build_coin_summary(user_id):
+    # 기존 내역을 유형별로 한 번 집계해 요약 행 생성 (내역이 없는 유형도 0으로 생성해 이후 증분 갱신 대상이 되도록 함)
+    with transaction.atomic():
+        # 잠금을 먼저 얻은 뒤에 조회해야 그 사이 커밋된 내역/요약 행까지 보임
+        lock_coin_summary(user_id)
+
+        # 동시 요청이 먼저 생성한 경우 그대로 사용
+        if CoinSummary.objects.filter(user_id=user_id).exists():
+            return
+
+        totals = {
+            row['type']: row
+            for row in Coin.objects.filter(user_id=user_id).values('type').annotate(count=Count('id'), amount=Sum('amount'))
+        }
+        CoinSummary.objects.bulk_create([
+            CoinSummary(
+                user_id=user_id,
+                type=coin_type,
+                count=totals.get(coin_type, {}).get('count', 0),
+                amount=totals.get(coin_type, {}).get('amount') or 0
+            )
+            for coin_type in COIN_TYPES
+        ])
+
+
+def get_coin_summary(user_id):
+    summaries = {summary.type: summary for summary in CoinSummary.objects.filter(user_id=user_id)}
+    if len(summaries) < len(COIN_TYPES):
+        build_coin_summary(user_id)
+        summaries = {summary.type: summary for summary in CoinSummary.objects.filter(user_id=user_id)}
+
+    return {
+        coin_type: {
+            'count': summaries[coin_type].count,
+            'amount': summaries[coin_type].amount,
+        }
+        for coin_type in COIN_TYPES
+    }
@@ -88,14 +88,20 @@ coin_history_schema = extend_schema_view(
             OpenApiParameter(name='type', type=str, location=OpenApiParameter.QUERY),
             OpenApiParameter(name='page', type=int, location=OpenApiParameter.QUERY, default=1),
             OpenApiParameter(name='size', type=int, location=OpenApiParameter.QUERY, default=10),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='커서 방식 조회 (첫 페이지는 빈 값, 이후 응답의 nextCursor/prevCursor 값)'
+            ),
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
-                description='적립금 사용내역 조회 성공',
+                description='적립금 사용내역 조회 성공 (coinList, prev, next, totalPage, totalCount, summary, 커서 방식일 때 nextCursor/prevCursor)',
                 response=CoinHistorySerializer(many=True)
             ),
             status.HTTP_400_BAD_REQUEST: OpenApiResponse(
-                description='잘못된 페이지 또는 사이즈 요청',
+                description='잘못된 페이지, 사이즈 또는 커서 요청',
                 response={
                     'type': 'object',
                     'properties': {
@@ -1,10 +1,15 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from unittest.mock import patch
 from rest_framework import status
 from rest_framework_simplejwt.tokens import AccessToken
 from datetime import datetime
 
-from coins.models import Coin
+from coins.models import Coin, CoinSummary
+from coins.ledger import charge_coin
+from coins.summary import get_coin_summary, lock_coin_summary
 
 
 User = get_user_model()
@@ -131,4 +136,164 @@ class CoinHistoryTestCase(CommenTestSetUp):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.json()['coinList']), 2)
         self.assertTrue(response.json()['next'])
-        self.assertFalse(response.json()['prev'])
\ No newline at end of file
+        self.assertFalse(response.json()['prev'])
+
+class CoinHistorySummaryTestCase(CommenTestSetUp):
+    def test_coin_history_summary(self):
+        '''
+        기존 내역으로 요약을 생성해 유형별 건수/합계와 전체 건수를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+        # when
+        response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['totalCount'], 3)
+        self.assertEqual(response.json()['summary'], {
+            'charge': {'count': 1, 'amount': 1000},
+            'use': {'count': 1, 'amount': 600},
+            'refund': {'count': 1, 'amount': 60},
+        })
+        self.assertEqual(CoinSummary.objects.filter(user=self.user).count(), 3)
+
+    def test_coin_history_summary_updated_on_insert(self):
+        '''
+        요약 생성 이후의 내역은 증분 반영되고, 목록 조회 시 COUNT 쿼리를 실행하지 않는다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+        charge_coin(self.user.id, 500)
+        params = {
+            'type': 'charge',
+            'size': 1
+        }
+
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['summary']['charge'], {'count': 2, 'amount': 1500})
+        self.assertEqual(response.json()['totalCount'], 2)
+        self.assertEqual(response.json()['totalPage'], 2)
+        self.assertFalse([query for query in queries if 'COUNT(' in query['sql'].upper()])
+
+    def test_coin_history_summary_updated_on_delete(self):
+        '''
+        내역이 삭제되면 요약에서도 차감된다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.client.get(self.url, **headers)
+
+        # when
+        self.coin2.delete()
+        response = self.client.get(self.url, **headers)
+
+        # then
+        self.assertEqual(response.json()['summary']['use'], {'count': 0, 'amount': 0})
+        self.assertEqual(response.json()['totalCount'], 2)
+
+
+    def test_coin_summary_build_and_increment_lock_user(self):
+        '''
+        요약 행 생성과 증분 갱신 모두 사용자 행을 잠가 서로 끼어들지 않는다
+        '''
+        # when
+        with patch('coins.summary.lock_coin_summary', wraps=lock_coin_summary) as mock_lock:
+            get_coin_summary(self.user.id)
+            charge_coin(self.user.id, 500)
+
+        # then
+        self.assertEqual([call.args for call in mock_lock.call_args_list], [(self.user.id,), (self.user.id,)])
+        self.assertEqual(get_coin_summary(self.user.id)['charge'], {'count': 2, 'amount': 1500})
+
+    def test_coin_summary_built_by_concurrent_request(self):
+        '''
+        잠금을 기다리는 동안 다른 요청이 요약 행을 생성했으면 다시 집계하지 않고 그 값을 사용한다
+        '''
+        # given
+        def build_by_other_request(user_id):
+            # 다른 요청이 먼저 잠금을 얻어 요약 행을 생성하고 커밋한 상황
+            CoinSummary.objects.bulk_create([
+                CoinSummary(user_id=user_id, type='charge', count=2, amount=1500),
+                CoinSummary(user_id=user_id, type='use', count=1, amount=600),
+                CoinSummary(user_id=user_id, type='refund', count=1, amount=60),
+            ])
+
+        # when
+        with patch('coins.summary.lock_coin_summary', side_effect=build_by_other_request):
+            summary = get_coin_summary(self.user.id)
+
+        # then
+        self.assertEqual(summary['charge'], {'count': 2, 'amount': 1500})
+        self.assertEqual(CoinSummary.objects.filter(user=self.user).count(), 3)
+
+
+class CoinHistoryCursorTestCase(CommenTestSetUp):
+    def test_coin_history_with_cursor(self):
+        '''
+        커서 방식으로 요청하면 nextCursor를 따라 최신순으로 이어서 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+        # when
+        first_page = self.client.get(self.url, {'cursor': '', 'size': 2}, **headers).json()
+        second_page = self.client.get(self.url, {'cursor': first_page['nextCursor'], 'size': 2}, **headers).json()
+
+        # then
+        self.assertEqual([coin['amount'] for coin in first_page['coinList']], [60, 600])
+        self.assertFalse(first_page['prev'])
+        self.assertTrue(first_page['next'])
+        self.assertEqual([coin['amount'] for coin in second_page['coinList']], [1000])
+        self.assertTrue(second_page['prev'])
+        self.assertFalse(second_page['next'])
+        self.assertIsNone(second_page['nextCursor'])
+
+    def test_coin_history_with_cursor_same_created_at(self):
+        '''
+        생성 시각이 같은 내역도 id 순으로 누락/중복 없이 이어서 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        Coin.objects.filter(user=self.user).update(created_at=datetime(2024, 10, 14))
+        expected = list(Coin.objects.filter(user=self.user).order_by('-id').values_list('amount', flat=True))
+
+        # when
+        amounts = []
+        params = {'cursor': '', 'size': 1}
+        while True:
+            page = self.client.get(self.url, params, **headers).json()
+            amounts += [coin['amount'] for coin in page['coinList']]
+            if not page['next']:
+                break
+            params['cursor'] = page['nextCursor']
+
+        # then
+        self.assertEqual(amounts, expected)
+
+    def test_coin_history_with_invalid_cursor(self):
+        '''
+        잘못된 커서를 요청하면 메세지와 400 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+        # when
+        response = self.client.get(self.url, {'cursor': 'invalid'}, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json().get('message'), '잘못된 커서 요청입니다.')
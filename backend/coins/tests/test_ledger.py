@@ -0,0 +1,95 @@
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import get_user_model
+
+from coins.models import Coin
+from coins.ledger import InsufficientCoinError, charge_coin, use_coin, settle_exam_cost
+from exams.models import Exam
+
+
+User = get_user_model()
+
+class CoinLedgerTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            name='test',
+            email='test@test.com',
+            birth='2024-10-14',
+            coin_amount=1000,
+            policy=True,
+            marketing=True
+        )
+        self.exam = Exam.objects.create(
+            user=self.user,
+            title='first exam',
+            date='2024-11-01',
+            entry_time='09:30:00',
+            start_time='10:00:00',
+            end_time='12:00:00',
+            exit_time='11:30:00',
+            expected_taker=10,
+            cost=600
+        )
+
+    def test_charge_updates_balance_in_single_statement(self):
+        '''
+        충전 시 잔액 컬럼만 F() 표현식으로 갱신하고 충전 내역을 남긴다
+        '''
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            charge_coin(self.user.id, 500)
+
+        # then
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.coin_amount, 1500)
+        self.assertTrue(Coin.objects.filter(user=self.user, type='charge', amount=500).exists())
+        user_table = connection.ops.quote_name(User._meta.db_table)
+        updates = [query['sql'] for query in queries if query['sql'].startswith(f'UPDATE {user_table}')]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('name', updates[0].split('WHERE')[0])
+
+    def test_concurrent_changes_are_not_lost(self):
+        '''
+        이미 읽어 둔 잔액과 관계없이 모든 증감이 반영된다
+        '''
+        # given
+        stale_user = User.objects.get(id=self.user.id)
+
+        # when
+        charge_coin(stale_user.id, 300)
+        use_coin(stale_user.id, 200, self.exam.id)
+
+        # then
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.coin_amount, 1100)
+
+    def test_use_with_insufficient_balance(self):
+        '''
+        잔액이 부족하면 예외가 발생하고 잔액과 내역은 변경되지 않는다
+        '''
+        # when
+        with self.assertRaises(InsufficientCoinError):
+            use_coin(self.user.id, 1001, self.exam.id)
+
+        # then
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.coin_amount, 1000)
+        self.assertFalse(Coin.objects.filter(user=self.user).exists())
+
+    def test_settle_exam_cost(self):
+        '''
+        비용 차액이 양수면 사용, 음수면 환불 내역을 남기고 0이면 아무것도 하지 않는다
+        '''
+        # when
+        settle_exam_cost(self.user.id, self.exam.id, 300)
+        settle_exam_cost(self.user.id, self.exam.id, -100)
+        settle_exam_cost(self.user.id, self.exam.id, 0)
+
+        # then
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.coin_amount, 800)
+        self.assertEqual(
+            list(Coin.objects.filter(user=self.user).order_by('id').values_list('type', 'amount')),
+            [('use', 300), ('refund', 100)]
+        )
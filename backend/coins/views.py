@@ -1,12 +1,14 @@
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import AllowAny
 from django.contrib.auth import get_user_model
-from django.core.paginator import Paginator
 
 from accounts.authentications import CustomAuthentication
 from proctormatic.utils import ok_with_data_response, not_found_response, created_response, bad_request_response
+from proctormatic.pagination import paginate_queryset
 from .models import Coin, CoinCode
-from .serializers import CoinCodeSerializer, CoinCodeCreateSerializer, CoinSerializer, CoinHistorySerializer
+from .ledger import charge_coin
+from .summary import get_coin_summary
+from .serializers import CoinCodeSerializer, CoinCodeCreateSerializer, CoinHistorySerializer
 from .swagger_schemas import coin_schema, create_coin_code_schema, coin_history_schema
 
 User = get_user_model()
@@ -29,19 +31,9 @@ def handle_coin(request):
                 return not_found_response('해당 적립금 코드가 존재하지 않습니다.')
             coin_code = CoinCode.objects.get(code=code)
 
-            user.coin_amount += coin_code.amount
-            user.save()
-
-            coin_data = {
-                'user': user.id,
-                'type': 'charge',
-                'amount': coin_code.amount,
-            }
-
-            serializer = CoinSerializer(data=coin_data)
-            if serializer.is_valid(raise_exception=True):
-                serializer.save()
-                return created_response('적립금 충전 완료')
+            # 잔액 증가와 충전 내역 생성을 한 트랜잭션으로 처리
+            charge_coin(user.id, coin_code.amount)
+            return created_response('적립금 충전 완료')
 
         error_message = next(iter(serializer.errors.values()))[0]
         return bad_request_response(error_message)
@@ -64,25 +56,22 @@ def coin_history(request):
     user = request.user
 
     coin_type = request.query_params.get('type')
-    history = Coin.objects.filter(user=user.id).order_by('-created_at')
+    history = Coin.objects.filter(user=user.id).order_by('-created_at', '-id')
     if coin_type in ['charge', 'use', 'refund']:
         history = history.filter(type=coin_type)
 
-    page = request.GET.get('page', 1)
-    size = request.GET.get('size', 10)
-
-    if int(page) <= 0:
-        return bad_request_response('잘못된 페이지 요청입니다.')
-    if int(size) <= 0:
-        return bad_request_response('잘못된 사이즈 요청입니다.')
-
-    paginator = Paginator(history, size)
-    paginated_history = paginator.get_page(page)
-
-    serializer = CoinHistorySerializer(paginated_history, many=True)
-    return ok_with_data_response({
-        'coinList': serializer.data,
-        "prev": paginated_history.has_previous(),
-        "next": paginated_history.has_next(),
-        "totalPage": paginator.num_pages,
-    })
\ No newline at end of file
+    # 전체 건수는 COUNT(*) 대신 요약 행에서 가져옴
+    summary = get_coin_summary(user.id)
+    if coin_type in summary:
+        total_count = summary[coin_type]['count']
+    else:
+        total_count = sum(type_summary['count'] for type_summary in summary.values())
+
+    return paginate_queryset(
+        request,
+        history,
+        CoinHistorySerializer,
+        'coinList',
+        total_count=total_count,
+        extra_data={'totalCount': total_count, 'summary': summary}
+    )
@@ -18,4 +18,10 @@ class Exam(models.Model):
     is_deleted = models.BooleanField(default=False)
 
     class Meta:
-        db_table = 'exam'
\ No newline at end of file
+        db_table = 'exam'
+        # 예정/진행/완료 시험 목록 조회 (user + date + entry_time/end_time 범위 조건)
+        # is_deleted는 백엔드에 따라 `NOT is_deleted`로 조회되어 선두 컬럼으로 쓸 수 없으므로 마지막에 포함
+        indexes = [
+            models.Index(fields=['user', 'date', 'entry_time', 'is_deleted'], name='exam_user_date_entry_idx'),
+            models.Index(fields=['user', 'date', 'end_time', 'is_deleted'], name='exam_user_date_end_idx'),
+        ]
\ No newline at end of file
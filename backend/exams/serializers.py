@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from django.db.models import Count
 from .models import Exam
 from takers.models import Taker, Logs, Abnormal
 import datetime
@@ -17,27 +18,21 @@ class ScheduledExamListSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'date', 'start_time', 'end_time', 'url', 'expected_taker']
 
 class OngoingExamListSerializer(serializers.ModelSerializer):
-    total_taker = serializers.SerializerMethodField()  # 동적으로 계산할 필드
+    # 목록 쿼리에서 annotate한 응시자 수 (시험마다 COUNT 쿼리를 보내지 않도록 함)
+    total_taker = serializers.IntegerField(source='taker_cnt', read_only=True)
 
     class Meta:
         model = Exam
         fields = ['id', 'title', 'date', 'start_time', 'end_time', 'url', 'expected_taker', 'total_taker']
 
-    def get_total_taker(self, obj):
-        # Taker 모델에서 특정 시험에 응시한 사람들의 수를 카운트
-        return Taker.objects.filter(exam_id=obj.id).count()
-
 class CompletedExamListSerializer(serializers.ModelSerializer):
-    completed_upload = serializers.SerializerMethodField()
+    # 목록 쿼리에서 annotate한 `check_out_state`가 `done`인 응시자 수
+    completed_upload = serializers.IntegerField(source='completed_upload_cnt', read_only=True)
 
     class Meta:
         model = Exam
         fields = ['id', 'title', 'date', 'start_time', 'end_time', 'url', 'expected_taker', 'total_taker', 'completed_upload']
 
-    def get_completed_upload(self, obj):
-        # 해당 시험에 대한 `check_out_state`가 `done`인 응시자 수를 반환
-        return Taker.objects.filter(exam=obj, check_out_state='done').count()
-
 class ExamDetailTakerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Exam
@@ -58,14 +53,18 @@ class ExamDetailSerializer(serializers.ModelSerializer):
 
     def get_taker_list(self, obj):
         # Taker 모델에서 특정 시험에 응시한 사람들의 리스트를 반환
-        takers = Taker.objects.filter(exam_id=obj.id)
+        # 응시자별 이상행동 수는 집계 쿼리 한 번으로 함께 조회 (응시자 수와 관계없이 쿼리 1회)
+        takers = Taker.objects.filter(exam_id=obj.id) \
+            .annotate(abnormal_cnt=Count('abnormalList')) \
+            .values('id', 'name', 'verification_rate', 'stored_state', 'abnormal_cnt') \
+            .order_by('id')
         return [
             {
-                "taker_id": taker.id,
-                "name": taker.name,
-                "verification_rate": taker.verification_rate,
-                "stored_state": taker.stored_state,
-                "abnormal_cnt": taker.abnormalList.count()
+                "taker_id": taker['id'],
+                "name": taker['name'],
+                "verification_rate": taker['verification_rate'],
+                "stored_state": taker['stored_state'],
+                "abnormal_cnt": taker['abnormal_cnt']
             }
             for taker in takers
         ]
@@ -73,17 +72,15 @@ class ExamDetailSerializer(serializers.ModelSerializer):
 class AbnormalListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Abnormal
-        exclude = ('id', 'taker',)
-
-    def to_representation(self, instance):
-        qs = super().to_representation(instance)
-        return sorted(qs, key=lambda x: x['detected_time'], reverse=True)
+        exclude = ('id', 'taker', 'source',)
 
 class TakerDetailSerializer(serializers.ModelSerializer):
+    # 로그 집계값(entry_cnt, first_entry_time, first_exit_time)과 이상행동 목록(sorted_abnormals)은
+    # 조회 쿼리에서 annotate/prefetch된 값을 사용하고, 없으면 개별 쿼리로 조회
     number_of_entry = serializers.SerializerMethodField()
     entry_time = serializers.SerializerMethodField()
     exit_time = serializers.SerializerMethodField()
-    abnormalList = AbnormalListSerializer(many=True, read_only=True)
+    abnormalList = serializers.SerializerMethodField()
     date = serializers.SerializerMethodField()
 
     class Meta:
@@ -91,9 +88,13 @@ class TakerDetailSerializer(serializers.ModelSerializer):
         fields = ('name', 'email', 'birth', 'id_photo', 'web_cam', 'verification_rate', 'date','entry_time', 'exit_time', 'number_of_entry', 'check_out_state', 'abnormalList')
 
     def get_number_of_entry(self, obj):
+        if hasattr(obj, 'entry_cnt'):
+            return obj.entry_cnt-1
         return Logs.objects.filter(taker_id=obj.id, type='entry').count()-1
 
     def get_entry_time(self, obj):
+        if hasattr(obj, 'first_entry_time'):
+            return obj.first_entry_time
         entry = Logs.objects.filter(taker_id=obj.id, type='entry').first()
         if entry:
             return entry.time
@@ -101,14 +102,23 @@ class TakerDetailSerializer(serializers.ModelSerializer):
             return None
 
     def get_exit_time(self, obj):
+        if hasattr(obj, 'first_exit_time'):
+            return obj.first_exit_time
         exit = Logs.objects.filter(taker_id=obj.id, type='exit').first()
         if exit:
             return exit.time
         else:
             return None
+
+    def get_abnormalList(self, obj):
+        if hasattr(obj, 'sorted_abnormals'):
+            abnormals = obj.sorted_abnormals
+        else:
+            abnormals = obj.abnormalList.order_by('-detected_time', 'id')
+        return AbnormalListSerializer(abnormals, many=True).data
     
     def get_date(self, obj):
         # Taker와 연결된 Exam의 date 값 반환
         if isinstance(obj.exam.date, datetime.date):
             return obj.exam.date.strftime('%Y-%m-%d')
-        return obj.exam.date
\ No newline at end of file
+        return obj.exam.date
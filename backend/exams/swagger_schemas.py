@@ -74,6 +74,12 @@ scheduled_exam_list_schema = extend_schema_view(
         parameters=[
             OpenApiParameter(name='page', type=int, location=OpenApiParameter.QUERY, default=1),
             OpenApiParameter(name='size', type=int, location=OpenApiParameter.QUERY, default=10),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='커서 방식 조회 (첫 페이지는 빈 값, 이후 응답의 nextCursor/prevCursor 값)'
+            ),
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
@@ -112,6 +118,12 @@ ongoing_exam_list_schema = extend_schema_view(
         parameters=[
             OpenApiParameter(name='page', type=int, location=OpenApiParameter.QUERY, default=1),
             OpenApiParameter(name='size', type=int, location=OpenApiParameter.QUERY, default=10),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='커서 방식 조회 (첫 페이지는 빈 값, 이후 응답의 nextCursor/prevCursor 값)'
+            ),
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
@@ -150,6 +162,12 @@ completed_exam_list_schema = extend_schema_view(
         parameters=[
             OpenApiParameter(name='page', type=int, location=OpenApiParameter.QUERY, default=1),
             OpenApiParameter(name='size', type=int, location=OpenApiParameter.QUERY, default=10),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='커서 방식 조회 (첫 페이지는 빈 값, 이후 응답의 nextCursor/prevCursor 값)'
+            ),
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
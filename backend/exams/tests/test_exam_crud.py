@@ -1,4 +1,7 @@
+from unittest.mock import patch
 from django.test import TestCase
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework_simplejwt.tokens import AccessToken
@@ -9,6 +12,7 @@ from freezegun import freeze_time
 
 from exams.models import Exam
 from coins.models import Coin
+from takers.models import Taker, Abnormal
 
 
 User = get_user_model()
@@ -61,6 +65,15 @@ class CommenTestSetUp(TestCase):
         token['role'] = 'host'
         return token
 
+    def atomic_after_update(self, **fields):
+        # 요청이 시험을 조회한 뒤 트랜잭션을 시작하기 직전에 다른 요청이 시험을 수정한 상황을 재현
+        atomic = transaction.atomic
+
+        def wrapper(*args, **kwargs):
+            Exam.objects.filter(pk=self.exam.pk).update(**fields)
+            return atomic(*args, **kwargs)
+        return patch('exams.views.transaction.atomic', side_effect=wrapper)
+
 class ExamCreateTestCase(CommenTestSetUp):
     def test_create_exam(self):
         '''
@@ -482,6 +495,10 @@ class ExamUpdateTestCase(CommenTestSetUp):
         # then
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.json().get('message'), '적립금이 부족합니다. 충전해주세요.')
+        self.exam.refresh_from_db()
+        self.assertEqual(self.exam.cost, 600)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.coin_amount, 1000)
 
     def test_update_exam_cost_difference_negative(self):
         '''
@@ -503,6 +520,51 @@ class ExamUpdateTestCase(CommenTestSetUp):
         self.user.refresh_from_db()
         self.assertEqual(self.user.coin_amount, 1200)
 
+    def test_update_exam_deleted_concurrently(self):
+        '''
+        조회 이후 다른 요청으로 삭제된 시험은 비용 변경이 없어도 수정하지 않고 409 status를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        url = f'{self.url}{self.exam.id}/'
+        data = {
+            'title': 'update test exam'
+        }
+
+        # when
+        with self.atomic_after_update(is_deleted=True):
+            response = self.client.put(url, data, content_type='application/json', **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.exam.refresh_from_db()
+        self.assertTrue(self.exam.is_deleted)
+        self.assertEqual(self.exam.title, 'first exam')
+
+    def test_update_exam_keeps_other_fields(self):
+        '''
+        요청한 필드만 저장하고 조회 이후 바뀐 다른 필드는 덮어쓰지 않는다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        url = f'{self.url}{self.exam.id}/'
+        data = {
+            'title': 'update test exam'
+        }
+
+        # when
+        with self.atomic_after_update(total_taker=3):
+            response = self.client.put(url, data, content_type='application/json', **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.exam.refresh_from_db()
+        self.assertEqual(self.exam.title, 'update test exam')
+        self.assertEqual(self.exam.total_taker, 3)
+        self.assertEqual(self.exam.cost, 600)
+
 class ExamCheckTestCase(CommenTestSetUp):
     def test_check_exam(self):
         '''
@@ -521,6 +583,41 @@ class ExamCheckTestCase(CommenTestSetUp):
         self.assertEqual(response.data.get('title'), 'first exam')
         self.assertEqual(response.data.get('expected_taker'), 10)
 
+    def test_check_exam_taker_list_query_count(self):
+        '''
+        시험 조회 시 응시자 수와 관계없이 같은 수의 쿼리로 응시자 리스트와 이상행동 수를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        url = f'{self.url}{self.exam.id}/'
+
+        taker = Taker.objects.create(exam=self.exam, name='taker0', email='taker0@test.com')
+        Abnormal.objects.create(taker=taker, type='paper', detected_time='00:00:01', end_time='00:00:02')
+        Abnormal.objects.create(taker=taker, type='pen', detected_time='00:00:03', end_time='00:00:04')
+
+        # 인증 정보가 캐시된 상태에서 비교
+        self.client.get(url, **headers)
+        with CaptureQueriesContext(connection) as single_taker_queries:
+            self.client.get(url, **headers)
+
+        for i in range(1, 10):
+            other_taker = Taker.objects.create(exam=self.exam, name=f'taker{i}', email=f'taker{i}@test.com')
+            Abnormal.objects.create(taker=other_taker, type='cup', detected_time='00:00:01', end_time='00:00:02')
+
+        # when
+        with CaptureQueriesContext(connection) as many_takers_queries:
+            response = self.client.get(url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(many_takers_queries), len(single_taker_queries))
+        taker_list = response.data.get('taker_list')
+        self.assertEqual(len(taker_list), 10)
+        self.assertEqual(taker_list[0]['taker_id'], taker.id)
+        self.assertEqual(taker_list[0]['abnormal_cnt'], 2)
+        self.assertEqual([row['abnormal_cnt'] for row in taker_list[1:]], [1] * 9)
+
     def test_check_exam_not_exist(self):
         '''
         존재하지 않는 질문을 조회하려고 하면 메세지와 404 status를 반환한다
@@ -579,6 +676,25 @@ class ExamDeleteTestCase(CommenTestSetUp):
         self.assertIsNotNone(coin_record)
         self.assertEqual(coin_record.amount, 600)
 
+    def test_delete_exam_refunds_current_cost(self):
+        '''
+        조회 이후 다른 요청으로 비용이 바뀌었으면 바뀐 비용을 환불한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        url = f'{self.url}{self.exam.id}/'
+
+        # when
+        with self.atomic_after_update(cost=400):
+            response = self.client.delete(url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.coin_amount, 1400)
+        self.assertEqual(Coin.objects.get(user=self.user, exam_id=self.exam.id, type='refund').amount, 400)
+
     def test_delete_exam_not_exist(self):
         '''
         존재하지 않는 시험을 삭제하고자 하면 메세지와 404 status를 반환한다
@@ -1,10 +1,13 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework_simplejwt.tokens import AccessToken
 from freezegun import freeze_time
 
 from exams.models import Exam
+from takers.models import Taker
 
 
 User = get_user_model()
@@ -338,4 +341,127 @@ class CompletedExamTestCase(CommenTestSetUp):
 
         # then
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(response.json().get('message'), '잘못된 사이즈 요청입니다.')
\ No newline at end of file
+        self.assertEqual(response.json().get('message'), '잘못된 사이즈 요청입니다.')
+
+class ExamListCursorTestCase(CommenTestSetUp):
+    @freeze_time("2024-11-15 10:00:00")
+    def test_completed_exam_with_cursor(self):
+        '''
+        커서 방식으로 요청하면 기존 정렬 순서(-date, -end_time)대로 이어서 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        for day in range(10, 13):
+            Exam.objects.create(
+                user=self.user,
+                title=f'Past Exam {day}',
+                date=f'2024-11-{day}',
+                entry_time='09:00:00',
+                start_time='10:00:00',
+                end_time='12:00:00',
+                exit_time='11:30:00',
+                expected_taker=10,
+                cost=600
+            )
+
+        # when
+        first_page = self.client.get(self.url3, {'cursor': '', 'size': 2}, **headers).json()
+        second_page = self.client.get(self.url3, {'cursor': first_page['nextCursor'], 'size': 2}, **headers).json()
+
+        # then
+        titles = [exam['title'] for exam in first_page['completedExamList'] + second_page['completedExamList']]
+        self.assertEqual(titles, ['Past Exam', 'Past Exam 12', 'Past Exam 11', 'Past Exam 10'])
+        self.assertTrue(first_page['next'])
+        self.assertTrue(second_page['prev'])
+        self.assertFalse(second_page['next'])
+
+class ExamListQueryCountTestCase(CommenTestSetUp):
+    def create_exams(self, count, date, entry_time, start_time, end_time, exit_time, taker_count):
+        for i in range(count):
+            exam = Exam.objects.create(
+                user=self.user,
+                title=f'Exam {date} {i}',
+                date=date,
+                entry_time=entry_time,
+                start_time=start_time,
+                end_time=end_time,
+                exit_time=exit_time,
+                expected_taker=10,
+                cost=600
+            )
+            Taker.objects.bulk_create([
+                Taker(exam=exam, name=f'taker{j}', email=f'taker{j}@test.com', check_out_state='done')
+                for j in range(taker_count)
+            ])
+
+    def count_queries(self, url, size, headers):
+        # 인증 정보가 캐시된 상태에서 비교
+        self.client.get(url, {'size': size}, **headers)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'size': size}, **headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries), response
+
+    @freeze_time("2024-11-15 10:00:00")
+    def test_scheduled_exam_query_count(self):
+        '''
+        예정된 시험 목록은 페이지 크기와 관계없이 같은 수의 쿼리로 조회한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.create_exams(10, '2024-11-18', '09:00:00', '09:30:00', '10:30:00', '10:15:00', 3)
+
+        # when
+        small_page_queries, _ = self.count_queries(self.url1, 1, headers)
+        large_page_queries, response = self.count_queries(self.url1, 10, headers)
+
+        # then
+        self.assertEqual(len(response.data['scheduledExamList']), 10)
+        self.assertEqual(large_page_queries, small_page_queries)
+
+    @freeze_time("2024-11-15 10:00:00")
+    def test_ongoing_exam_query_count(self):
+        '''
+        진행중인 시험 목록은 페이지 크기와 관계없이 같은 수의 쿼리로 응시자 수를 함께 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.create_exams(10, '2024-11-15', '09:00:00', '09:30:00', '10:30:00', '10:15:00', 3)
+
+        # when
+        small_page_queries, _ = self.count_queries(self.url2, 1, headers)
+        large_page_queries, response = self.count_queries(self.url2, 10, headers)
+
+        # then
+        response_data = response.data['ongoingExamList']
+        self.assertEqual(len(response_data), 10)
+        self.assertEqual(large_page_queries, small_page_queries)
+        total_takers = {exam['title']: exam['total_taker'] for exam in response_data}
+        self.assertEqual(total_takers['Ongoing Exam'], 0)
+        self.assertEqual(total_takers['Exam 2024-11-15 0'], 3)
+
+    @freeze_time("2024-11-15 10:00:00")
+    def test_completed_exam_query_count(self):
+        '''
+        완료된 시험 목록은 페이지 크기와 관계없이 같은 수의 쿼리로 업로드 완료 응시자 수를 함께 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        self.create_exams(10, '2024-11-14', '09:00:00', '09:30:00', '10:30:00', '10:15:00', 2)
+        Taker.objects.create(exam=self.past_exam, name='abnormal', email='abnormal@test.com')
+
+        # when
+        small_page_queries, _ = self.count_queries(self.url3, 1, headers)
+        large_page_queries, response = self.count_queries(self.url3, 11, headers)
+
+        # then
+        response_data = response.data['completedExamList']
+        self.assertEqual(len(response_data), 11)
+        self.assertEqual(large_page_queries, small_page_queries)
+        completed_uploads = {exam['title']: exam['completed_upload'] for exam in response_data}
+        self.assertEqual(completed_uploads['Past Exam'], 0)
+        self.assertEqual(completed_uploads['Exam 2024-11-14 0'], 2)
@@ -1,10 +1,12 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework_simplejwt.tokens import AccessToken
 
 from exams.models import Exam
-from takers.models import Taker
+from takers.models import Taker, Logs, Abnormal
 from exams.serializers import TakerDetailSerializer
 
 
@@ -110,4 +112,44 @@ class ExamTakerResultTestCase(CommenTestSetUp):
 
         # then
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertEqual(response.json().get('message'), '존재하지 않는 응시자입니다.')
\ No newline at end of file
+        self.assertEqual(response.json().get('message'), '존재하지 않는 응시자입니다.')
+
+    def test_taker_result_view_with_logs_and_abnormals(self):
+        '''
+        입/퇴실 로그와 이상행동 수와 관계없이 같은 수의 쿼리로 응시자 결과를 반환한다
+        '''
+        # given
+        token = self.get_token(self.user)
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+        url = self.url.format(self.exam.id, self.taker.id)
+
+        Logs.objects.create(taker=self.taker, type='entry')
+        Abnormal.objects.create(taker=self.taker, type='pen', detected_time='00:00:03', end_time='00:00:04')
+
+        # 인증 정보가 캐시된 상태에서 비교
+        self.client.get(url, **headers)
+        with CaptureQueriesContext(connection) as few_rows_queries:
+            self.client.get(url, **headers)
+
+        Logs.objects.create(taker=self.taker, type='entry')
+        Logs.objects.create(taker=self.taker, type='entry')
+        Logs.objects.create(taker=self.taker, type='exit')
+        Abnormal.objects.create(taker=self.taker, type='cup', detected_time='00:01:00', end_time='00:01:05')
+        Abnormal.objects.create(taker=self.taker, type='paper', detected_time='00:00:10', end_time='00:00:12')
+
+        # when
+        with CaptureQueriesContext(connection) as many_rows_queries:
+            response = self.client.get(url, **headers)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(many_rows_queries), len(few_rows_queries))
+        self.assertEqual(response.data, TakerDetailSerializer(self.taker).data)
+        self.assertEqual(response.data['number_of_entry'], 2)
+        self.assertEqual(response.data['entry_time'], Logs.objects.filter(taker=self.taker, type='entry').first().time)
+        self.assertIsNotNone(response.data['exit_time'])
+        self.assertEqual(
+            [abnormal['detected_time'] for abnormal in response.data['abnormalList']],
+            ['00:01:00', '00:00:10', '00:00:03']
+        )
+        self.assertNotIn('source', response.data['abnormalList'][0])
@@ -0,0 +1,144 @@
+from django.test import TestCase
+from django.db import connection
+from django.contrib.auth import get_user_model
+from datetime import date, time, timedelta
+
+from exams.models import Exam
+from takers.models import Taker, Logs
+from coins.models import Coin
+
+
+User = get_user_model()
+
+# 시딩 규모 (인덱스가 없으면 전체 스캔이 되는 정도의 데이터)
+USER_COUNT = 20
+EXAMS_PER_USER = 50
+TAKERS_PER_EXAM = 20
+COINS_PER_USER = 100
+
+
+class QueryPlanTestCase(TestCase):
+    '''
+    자주 호출되는 조회 쿼리가 복합 인덱스를 사용하는지 EXPLAIN으로 확인한다
+    '''
+    @classmethod
+    def setUpTestData(cls):
+        users = User.objects.bulk_create([
+            User(
+                name=f'user{i}',
+                email=f'user{i}@test.com',
+                birth='2000-01-01',
+                coin_amount=1000,
+                policy=True,
+                marketing=True
+            )
+            for i in range(USER_COUNT)
+        ])
+        cls.user = users[0]
+
+        exams = Exam.objects.bulk_create([
+            Exam(
+                user=user,
+                title=f'exam{j}',
+                date=date(2024, 11, 1) + timedelta(days=j),
+                entry_time='09:30:00',
+                start_time='10:00:00',
+                end_time='12:00:00',
+                exit_time='11:30:00',
+                expected_taker=TAKERS_PER_EXAM,
+                cost=600,
+                is_deleted=j % 10 == 0
+            )
+            for user in users
+            for j in range(EXAMS_PER_USER)
+        ])
+        cls.exam = exams[0]
+
+        takers = Taker.objects.bulk_create([
+            Taker(exam=exam, name=f'taker{k}', email=f'taker{k}@test.com')
+            for exam in exams
+            for k in range(TAKERS_PER_EXAM)
+        ])
+        cls.taker = takers[0]
+
+        Logs.objects.bulk_create([
+            Logs(taker=taker, type=log_type)
+            for taker in takers
+            for log_type in ('entry', 'exit')
+        ])
+
+        Coin.objects.bulk_create([
+            Coin(user=user, type=('charge', 'use', 'refund')[n % 3], amount=100)
+            for user in users
+            for n in range(COINS_PER_USER)
+        ])
+
+        # 통계 정보를 갱신해 실제 운영과 비슷한 실행 계획이 나오도록 함
+        with connection.cursor() as cursor:
+            if connection.vendor == 'mysql':
+                cursor.execute('ANALYZE TABLE exam, taker, logs, coin')
+            else:
+                cursor.execute('ANALYZE')
+
+    def assertUsesIndex(self, queryset, *index_names):
+        plan = queryset.explain()
+        self.assertTrue(any(index_name in plan for index_name in index_names), plan)
+
+    def test_taker_lookup_by_exam_and_email(self):
+        '''
+        응시자 입장/이메일 중복 확인은 (exam, email) unique 인덱스를 사용한다
+        '''
+        queryset = Taker.objects.filter(email='taker1@test.com', exam_id=self.exam.id)
+
+        # sqlite는 테이블 정의의 UNIQUE 제약을 sqlite_autoindex_*로 생성
+        self.assertUsesIndex(queryset, 'taker_exam_email_uniq', 'sqlite_autoindex_taker')
+
+    def test_scheduled_exam_list(self):
+        '''
+        예정된 시험 목록은 (user, date, entry_time, is_deleted) 인덱스를 사용한다
+        '''
+        queryset = Exam.objects.filter(
+            user_id=self.user.id,
+            date=date(2024, 11, 10),
+            entry_time__gt=time(9, 0),
+            is_deleted=False
+        )
+
+        self.assertUsesIndex(queryset, 'exam_user_date_entry_idx')
+
+    def test_completed_exam_list(self):
+        '''
+        완료된 시험 목록은 (user, date, end_time, is_deleted) 인덱스를 사용한다
+        '''
+        queryset = Exam.objects.filter(
+            user_id=self.user.id,
+            date=date(2024, 11, 10),
+            end_time__lt=time(13, 0),
+            is_deleted=False
+        )
+
+        self.assertUsesIndex(queryset, 'exam_user_date_end_idx')
+
+    def test_coin_history_by_type(self):
+        '''
+        유형별 적립금 내역은 (user, type, created_at) 인덱스를 사용한다
+        '''
+        queryset = Coin.objects.filter(user=self.user.id, type='charge').order_by('-created_at')
+
+        self.assertUsesIndex(queryset, 'coin_user_type_created_idx')
+
+    def test_coin_history(self):
+        '''
+        전체 적립금 내역은 (user, created_at) 인덱스를 사용한다
+        '''
+        queryset = Coin.objects.filter(user=self.user.id).order_by('-created_at')
+
+        self.assertUsesIndex(queryset, 'coin_user_created_idx')
+
+    def test_logs_by_taker_and_type(self):
+        '''
+        응시자 입/퇴실 로그 조회는 (taker, type) 인덱스를 사용한다
+        '''
+        queryset = Logs.objects.filter(taker_id=self.taker.id, type='entry')
+
+        self.assertUsesIndex(queryset, 'logs_taker_type_idx')
@@ -2,7 +2,7 @@ from django.utils import timezone
 from datetime import date, datetime, timedelta
 from rest_framework.permissions import AllowAny
 from threading import Thread
-from django.db.models import F
+from django.db.models import Q, Count, OuterRef, Subquery, Prefetch
 from django.db import transaction
 from django.conf import settings
 from django.core.mail import send_mail
@@ -13,14 +13,14 @@ from proctormatic.utils import bad_request_response, bad_request_invalid_data_re
     unauthorized_response, internal_server_error, created_response, not_found_response, ok_with_data_response, \
     ok_response, no_content_response
 from .models import Exam
-from takers.models import Taker
-from coins.models import Coin
+from takers.models import Taker, Logs, Abnormal
+from coins.ledger import InsufficientCoinError, use_coin, refund_coin, settle_exam_cost
 from accounts.authentications import CustomAuthentication
+from proctormatic.pagination import paginate_queryset
 from .serializers import ExamSerializer, ScheduledExamListSerializer, OngoingExamListSerializer, \
     CompletedExamListSerializer, ExamDetailSerializer, TakerDetailSerializer, ExamDetailTakerSerializer
 from .swagger_schemas import create_exam_schema, scheduled_exam_list_schema, ongoing_exam_list_schema, \
     completed_exam_list_schema, exam_detail_schema, taker_result_view_schema, exam_taker_detail_schema
-from django.core.paginator import Paginator
 
 User = get_user_model()
 
@@ -52,16 +52,11 @@ def create_exam(request):
 
     entry_time = (datetime.combine(date, start_time) - timedelta(minutes=30)).time()
 
+    if not user.is_active:
+        return unauthorized_response('탈퇴한 사용자입니다.')
+
     try:
         with transaction.atomic():
-            user = User.objects.select_for_update().get(id=user.id)
-
-            if not user.is_active:
-                return unauthorized_response('탈퇴한 사용자입니다.')
-
-            if int(user.coin_amount) < int(exam_cost):
-                return bad_request_response('적립금이 부족합니다. 충전해주세요.')
-
             exam_instance = serializer.save(
                 user=user,
                 entry_time=entry_time,
@@ -69,19 +64,10 @@ def create_exam(request):
 
             # URL 설정과 함께 저장
             exam_instance.url = f"https://k11s209.p.ssafy.io/exams/{exam_instance.id}/"
-            exam_instance.save()
-
-            # 코인 차감
-            user.coin_amount = F('coin_amount') - exam_cost
-            user.save()
-
-            # Coin 내역 생성
-            Coin.objects.create(
-                user_id=user.id,
-                exam_id=exam_instance.id,
-                type='use',
-                amount=exam_cost
-            )
+            exam_instance.save(update_fields=['url'])
+
+            # 코인 차감 및 Coin 내역 생성 (잔액이 부족하면 시험 생성까지 롤백)
+            use_coin(user.id, exam_cost, exam_instance.id)
 
             # 이메일 전송 데이터 준비
             exam_data = {
@@ -93,6 +79,8 @@ def create_exam(request):
                 'url': exam_instance.url
             }
 
+    except InsufficientCoinError:
+        return bad_request_response('적립금이 부족합니다. 충전해주세요.')
     except Exception as e:
         return internal_server_error(str(e))
 
@@ -130,10 +118,7 @@ def scheduled_exam_list(request):
     # 두 쿼리셋을 결합하고 정렬
     exams = (future_exams | today_future_exams).order_by('date', 'start_time')
 
-    page = request.GET.get('page', 1)
-    size = request.GET.get('size', 10)
-
-    return paginate_queryset(exams, page, size, ScheduledExamListSerializer, 'scheduledExamList')
+    return paginate_queryset(request, exams, ScheduledExamListSerializer, 'scheduledExamList')
 
 
 @ongoing_exam_list_schema
@@ -154,12 +139,12 @@ def ongoing_exam_list(request):
         entry_time__lte=current_time,
         end_time__gte=current_time,
         is_deleted=False
+    ).annotate(
+        # 시험별 응시자 수를 목록 쿼리에서 함께 집계
+        taker_cnt=Count('taker')
     ).order_by('date', 'start_time')
 
-    page = request.GET.get('page', 1)
-    size = request.GET.get('size', 10)
-
-    return paginate_queryset(ongoing_exams, page, size, OngoingExamListSerializer, 'ongoingExamList')
+    return paginate_queryset(request, ongoing_exams, OngoingExamListSerializer, 'ongoingExamList')
 
 
 @completed_exam_list_schema
@@ -189,12 +174,12 @@ def completed_exam_list(request):
     )
 
     # 두 쿼리셋을 결합하고 정렬
-    exams = (completed_exams | today_completed_exams).order_by('-date', '-end_time')
-
-    page = request.GET.get('page', 1)
-    size = request.GET.get('size', 10)
+    exams = (completed_exams | today_completed_exams).annotate(
+        # 시험별 업로드 완료 응시자 수를 목록 쿼리에서 함께 집계
+        completed_upload_cnt=Count('taker', filter=Q(taker__check_out_state='done'))
+    ).order_by('-date', '-end_time')
 
-    return paginate_queryset(exams, page, size, CompletedExamListSerializer, 'completedExamList')
+    return paginate_queryset(request, exams, CompletedExamListSerializer, 'completedExamList')
 
 
 @exam_taker_detail_schema
@@ -256,32 +241,20 @@ def exam_detail(request, pk):
         new_cost = serializer.validated_data.get('cost', original_cost)
         cost_difference = new_cost - original_cost
 
-        # 시험 생성자의 현재 코인을 가져옴
-        exam_creator = exam.user
-        if int(exam_creator.coin_amount) < cost_difference:
+        # 데이터 수정과 차액 사용/환불을 함께 처리 (잔액이 부족하면 수정까지 롤백)
+        try:
+            with transaction.atomic():
+                # 조회 이후 다른 요청이 비용을 바꾸거나 시험을 삭제했다면 차액이 달라지므로 수정하지 않음
+                # 요청한 필드만 조건부 UPDATE 한 번으로 저장 (조회 시점의 is_deleted 등 다른 필드를 덮어쓰지 않음)
+                updated = Exam.objects.filter(pk=exam.pk, cost=original_cost, is_deleted=False).update(
+                    **{**serializer.validated_data, 'cost': new_cost, 'entry_time': entry_time}
+                )
+                if not updated:
+                    return conflict_response('시험 정보가 변경되었습니다. 다시 시도해주세요.')
+                settle_exam_cost(user.id, exam.id, cost_difference)
+        except InsufficientCoinError:
             return bad_request_response('적립금이 부족합니다. 충전해주세요.')
 
-        # 데이터 수정 및 저장
-        serializer.save(entry_time=entry_time)
-
-        # 차액에 따른 코인 사용 내역 추가
-        if cost_difference > 0:
-            transaction_type = "use"
-        elif cost_difference < 0:
-            transaction_type = "refund"
-
-        exam_creator.coin_amount = exam_creator.coin_amount - cost_difference
-        exam_creator.save()
-
-        # Coin 내역 기록
-        if cost_difference != 0:
-            Coin.objects.create(
-                user_id=exam_creator.id,
-                exam_id=exam.id,
-                type=transaction_type,
-                amount=abs(cost_difference)
-            )
-
         return ok_response('수정이 완료되었습니다.')
 
     elif request.method == "DELETE":
@@ -290,22 +263,15 @@ def exam_detail(request, pk):
         if exam.date == date.today() and exam.entry_time <= current_time <= exam.end_time:
             return conflict_response('진행 중인 시험은 삭제할 수 없습니다.')
 
-        # 시험 비용을 반환하고 코인 사용 내역에 기록
-        exam_creator = exam.user
-        exam_creator.coin_amount += exam.cost
-        exam_creator.save()
-
-        # Coin 내역 기록 (삭제에 따른 반환)
-        Coin.objects.create(
-            user_id=exam_creator.id,
-            exam_id=exam.id,
-            type="refund",
-            amount=exam.cost
-        )
-
-        # 시험 삭제
-        exam.is_deleted = True
-        exam.save()
+        # 시험 삭제와 비용 반환을 함께 처리 (동시 삭제 요청 시 한 번만 반환)
+        # 조회 이후 수정 요청으로 비용이 바뀌었을 수 있으므로 행을 잠근 뒤 현재 비용을 다시 읽어 반환
+        with transaction.atomic():
+            cost = Exam.objects.select_for_update().filter(pk=exam.pk, is_deleted=False) \
+                .values_list('cost', flat=True).first()
+            if cost is None:
+                return not_found_response('존재하지 않는 시험입니다.')
+            Exam.objects.filter(pk=exam.pk).update(is_deleted=True)
+            refund_coin(user.id, cost, exam.id)
         return no_content_response('시험이 성공적으로 삭제되었습니다.')
 
     # 추가로 명확히 응답을 설정
@@ -322,7 +288,21 @@ def taker_result_view(request, eid, tid):
         return not_found_response('존재하지 않는 시험입니다.')
 
     # 응시자 존재 여부 확인
-    taker = Taker.objects.filter(id=tid, exam_id=eid).first()
+    # 입/퇴실 로그 집계와 시험 정보는 같은 쿼리에서, 이상행동은 정렬된 prefetch 쿼리 한 번으로 조회
+    logs = Logs.objects.filter(taker_id=OuterRef('pk')).order_by('pk')
+    taker = Taker.objects.filter(id=tid, exam_id=eid) \
+        .select_related('exam') \
+        .annotate(
+            entry_cnt=Count('logs', filter=Q(logs__type='entry')),
+            first_entry_time=Subquery(logs.filter(type='entry').values('time')[:1]),
+            first_exit_time=Subquery(logs.filter(type='exit').values('time')[:1])
+        ) \
+        .prefetch_related(Prefetch(
+            'abnormalList',
+            queryset=Abnormal.objects.order_by('-detected_time', 'id'),
+            to_attr='sorted_abnormals'
+        )) \
+        .first()
     if not taker:
         return not_found_response('존재하지 않는 응시자입니다.')
 
@@ -333,25 +313,6 @@ def taker_result_view(request, eid, tid):
     return ok_with_data_response(serializer.data)
 
 
-def paginate_queryset(queryset, page, size, serializer_class, list_name):
-    if int(page) <= 0:
-        return bad_request_response('잘못된 페이지 요청입니다.')
-    if int(size) <= 0:
-        return bad_request_response('잘못된 사이즈 요청입니다.')
-
-    paginator = Paginator(queryset, size)
-    paginated_exams = paginator.get_page(page)
-
-    serializer = serializer_class(paginated_exams, many=True)
-
-    return ok_with_data_response({
-        list_name: serializer.data,
-        'prev': paginated_exams.has_previous(),
-        'next': paginated_exams.has_next(),
-        'totalPage': paginator.num_pages
-    })
-
-
 def validate_exam_time(date, start_time, end_time, exit_time):
     current_time = timezone.now()
 
@@ -11,6 +11,12 @@ notification_schama = extend_schema_view(
         parameters=[
             OpenApiParameter(name='page', type=int, location=OpenApiParameter.QUERY, default=1),
             OpenApiParameter(name='size', type=int, location=OpenApiParameter.QUERY, default=10),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='커서 방식 조회 (첫 페이지는 빈 값, 이후 응답의 nextCursor/prevCursor 값)'
+            ),
         ],
         responses={
             status.HTTP_200_OK: OpenApiResponse(
@@ -95,6 +101,12 @@ question_schema = extend_schema_view(
         parameters=[
             OpenApiParameter(name='page', type=int, location=OpenApiParameter.QUERY, default=1),
             OpenApiParameter(name='size', type=int, location=OpenApiParameter.QUERY, default=10),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='커서 방식 조회 (첫 페이지는 빈 값, 이후 응답의 nextCursor/prevCursor 값)'
+            ),
             OpenApiParameter(name='category', type=str, location=OpenApiParameter.QUERY)
         ],
         responses={
@@ -1,4 +1,7 @@
 from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from datetime import datetime
 from rest_framework import status
 from helpdesks.models import Notification
 
@@ -123,6 +126,63 @@ class NotificationListTestCase(CommenTestSetUp):
         self.assertTrue(response.json()['next'])
         self.assertFalse(response.json()['prev'])
 
+class NotificationCursorListTestCase(CommenTestSetUp):
+    def setUp(self):
+        super().setUp()
+        for i in range(3, 6):
+            Notification.objects.create(title=f"test_title{i}", content=f"test_content{i}")
+        # 같은 생성 시각이어도 id로 순서가 정해지는지 확인
+        Notification.objects.update(created_at=datetime(2024, 11, 15))
+
+    def get_titles(self, page):
+        return [notification['title'] for notification in page['notificationList']]
+
+    def test_notification_list_with_cursor(self):
+        '''
+        커서 방식으로 요청하면 nextCursor/prevCursor를 따라 앞뒤 페이지를 반환한다
+        '''
+        # when
+        first_page = self.client.get(self.url, {'cursor': '', 'size': 2}).json()
+        second_page = self.client.get(self.url, {'cursor': first_page['nextCursor'], 'size': 2}).json()
+        third_page = self.client.get(self.url, {'cursor': second_page['nextCursor'], 'size': 2}).json()
+        back_page = self.client.get(self.url, {'cursor': second_page['prevCursor'], 'size': 2}).json()
+
+        # then
+        self.assertEqual(self.get_titles(first_page), ['test_title5', 'test_title4'])
+        self.assertEqual(self.get_titles(second_page), ['test_title3', 'test_title2'])
+        self.assertEqual(self.get_titles(third_page), ['test_title1'])
+        self.assertEqual(self.get_titles(back_page), self.get_titles(first_page))
+        self.assertEqual((first_page['prev'], first_page['next']), (False, True))
+        self.assertEqual((second_page['prev'], second_page['next']), (True, True))
+        self.assertEqual((third_page['prev'], third_page['next']), (True, False))
+        self.assertEqual((back_page['prev'], back_page['next']), (False, True))
+        self.assertIsNone(third_page['nextCursor'])
+        self.assertNotIn('totalPage', first_page)
+
+    def test_notification_list_with_cursor_without_count_query(self):
+        '''
+        커서 방식은 전체 건수(COUNT) 쿼리 없이 한 번의 조회로 응답한다
+        '''
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'cursor': '', 'size': 2})
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('COUNT(', queries[0]['sql'].upper())
+
+    def test_notification_list_with_invalid_cursor(self):
+        '''
+        잘못된 커서를 요청하면 메세지와 400 status를 반환한다
+        '''
+        # when
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json().get('message'), '잘못된 커서 요청입니다.')
+
 class NotificationDetailTestCase(CommenTestSetUp):
     def test_notification_detail(self):
         '''
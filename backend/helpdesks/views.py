@@ -1,9 +1,9 @@
 from django.contrib.auth import get_user_model
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework.permissions import AllowAny
-from django.core.paginator import Paginator
 
 from accounts.authentications import CustomAuthentication
+from proctormatic.pagination import paginate_queryset
 from proctormatic.utils import created_response, bad_request_invalid_data_response, not_found_response, \
     ok_with_data_response, no_content_without_message_response, bad_request_response, ok_response
 from .models import Notification, Question, Faq, Answer
@@ -29,10 +29,8 @@ def notification(request):
 
     elif request.method == 'GET':
         notifications = Notification.objects.all().order_by('-created_at')
-        page = request.GET.get('page', 1)
-        size = request.GET.get('size', 10)
 
-        return paginate_queryset(notifications, page, size, NotificationListSerializer, 'notificationList')
+        return paginate_queryset(request, notifications, NotificationListSerializer, 'notificationList')
 
 
 @check_notification_schema
@@ -74,10 +72,7 @@ def question(request):
         if category in ['usage', 'coin', 'etc']:
             questions = questions.filter(category=category)
 
-        page = request.GET.get('page', 1)
-        size = request.GET.get('size', 10)
-
-        return paginate_queryset(questions, page, size, QuestionListSerializer, 'questionList')
+        return paginate_queryset(request, questions, QuestionListSerializer, 'questionList')
 
 
 @question_detail_schema
@@ -216,21 +211,3 @@ def faq_detail(request, faq_id):
     elif request.method == 'DELETE':
         faq.delete()
         return no_content_without_message_response()
-
-
-def paginate_queryset(queryset, page, size, serializer_class, list_name):
-    if int(page) <= 0:
-        return bad_request_response('잘못된 페이지 요청입니다.')
-    if int(size) <= 0:
-        return bad_request_response('잘못된 사이즈 요청입니다.')
-
-    paginator = Paginator(queryset, size)
-    paginated_exams = paginator.get_page(page)
-
-    serializer = serializer_class(paginated_exams, many=True)
-    return ok_with_data_response({
-        list_name: serializer.data,
-        'prev': paginated_exams.has_previous(),
-        'next': paginated_exams.has_next(),
-        'totalPage': paginator.num_pages
-    })
\ No newline at end of file
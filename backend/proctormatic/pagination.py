@@ -0,0 +1,149 @@
+import json
+import math
+import base64
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+
+from proctormatic.utils import ok_with_data_response, bad_request_response
+
+
+def paginate_queryset(request, queryset, serializer_class, list_name, total_count=None, extra_data=None):
+    # cursor 파라미터가 있으면 커서 방식, 없으면 기존 페이지 번호 방식으로 조회
+    try:
+        page = int(request.GET.get('page', 1))
+        size = int(request.GET.get('size', 10))
+    except ValueError:
+        return bad_request_response('잘못된 페이지 요청입니다.')
+
+    if page <= 0:
+        return bad_request_response('잘못된 페이지 요청입니다.')
+    if size <= 0:
+        return bad_request_response('잘못된 사이즈 요청입니다.')
+
+    cursor = request.GET.get('cursor')
+    if cursor is None:
+        data = paginate_by_page(queryset, page, size, total_count)
+    else:
+        data = paginate_by_cursor(queryset, cursor, size)
+        if data is None:
+            return bad_request_response('잘못된 커서 요청입니다.')
+        # 전체 건수를 따로 관리하는 경우에만 커서 방식에서도 전체 페이지 수 제공
+        if total_count is not None:
+            data['totalPage'] = get_total_page(total_count, size)
+
+    items = data.pop('items')
+    return ok_with_data_response({
+        list_name: serializer_class(items, many=True).data,
+        **data,
+        **(extra_data or {}),
+    })
+
+
+def paginate_by_page(queryset, page, size, total_count=None):
+    # 전체 건수를 따로 관리하는 경우(total_count) COUNT(*) 쿼리 생략
+    if total_count is None:
+        total_count = queryset.count()
+    total_page = get_total_page(total_count, size)
+
+    # 마지막 페이지를 넘으면 마지막 페이지 반환 (Paginator.get_page와 동일)
+    page = min(page, total_page)
+
+    return {
+        'items': queryset[(page - 1) * size:page * size],
+        'prev': page > 1,
+        'next': page < total_page,
+        'totalPage': total_page,
+    }
+
+
+def get_total_page(total_count, size):
+    return max(math.ceil(total_count / size), 1)
+
+
+def paginate_by_cursor(queryset, cursor, size):
+    # 정렬 기준 값 이후(또는 이전)부터 size + 1개만 조회해 페이지 깊이와 관계없이 일정한 비용, COUNT(*) 없음
+    ordering = get_cursor_ordering(queryset)
+
+    direction, position = 'next', None
+    if cursor:
+        decoded = decode_cursor(queryset.model, ordering, cursor)
+        if decoded is None:
+            return None
+        direction, position = decoded
+
+    if direction == 'prev':
+        ordering = [reverse_ordering(field) for field in ordering]
+
+    queryset = queryset.order_by(*ordering)
+    if position is not None:
+        queryset = queryset.filter(get_cursor_filter(ordering, position))
+
+    items = list(queryset[:size + 1])
+    has_more = len(items) > size
+    items = items[:size]
+
+    if direction == 'prev':
+        items.reverse()
+        ordering = [reverse_ordering(field) for field in ordering]
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = position is not None and bool(items), has_more
+
+    return {
+        'items': items,
+        'prev': has_prev,
+        'next': has_next,
+        'prevCursor': encode_cursor('prev', ordering, items[0]) if has_prev and items else None,
+        'nextCursor': encode_cursor('next', ordering, items[-1]) if has_next and items else None,
+    }
+
+
+def get_cursor_ordering(queryset):
+    # 기존 정렬 기준 뒤에 pk를 붙여 같은 값이 있어도 순서가 하나로 정해지도록 함
+    ordering = [field for field in queryset.query.order_by if isinstance(field, str)]
+    if not any(field.lstrip('-') in ('pk', 'id') for field in ordering):
+        descending = bool(ordering) and ordering[-1].startswith('-')
+        ordering.append('-pk' if descending else 'pk')
+    return ordering
+
+
+def reverse_ordering(field):
+    return field[1:] if field.startswith('-') else f'-{field}'
+
+
+def get_cursor_filter(ordering, position):
+    # (a, b, c) 정렬이면 a > x | (a = x & b > y) | (a = x & b = y & c > z) 형태의 조건
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, position):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+
+    # OR 조건만으로는 인덱스 범위 탐색이 되지 않으므로 첫 정렬 기준의 범위 조건을 함께 사용
+    first_field = ordering[0]
+    bound_lookup = 'lte' if first_field.startswith('-') else 'gte'
+    return Q(**{f'{first_field.lstrip("-")}__{bound_lookup}': position[0]}) & condition
+
+
+def encode_cursor(direction, ordering, item):
+    position = [getattr(item, field.lstrip('-')) for field in ordering]
+    payload = json.dumps([direction, [value.isoformat() if hasattr(value, 'isoformat') else value for value in position]])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(model, ordering, cursor):
+    try:
+        direction, values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if direction not in ('next', 'prev') or len(values) != len(ordering):
+            return None
+
+        position = []
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            model_field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            position.append(model_field.to_python(value))
+        return direction, position
+    except (ValueError, TypeError, ValidationError, FieldDoesNotExist):
+        return None
@@ -11,7 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 from pathlib import Path
-import os, environ
+import os, environ, tempfile
 from datetime import timedelta
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -193,6 +193,15 @@ CACHES = {
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
+# 인증 시 조회한 사용자/응시자 정보 캐시 TTL(초): redis 공유 캐시와 그 앞단의 프로세스 로컬 LRU (0이면 사용 안 함)
+AUTH_PRINCIPAL_CACHE_TTL = env.int('AUTH_PRINCIPAL_CACHE_TTL', default=60)
+AUTH_PRINCIPAL_LOCAL_CACHE_TTL = env.int('AUTH_PRINCIPAL_LOCAL_CACHE_TTL', default=5)
+AUTH_PRINCIPAL_LOCAL_CACHE_SIZE = env.int('AUTH_PRINCIPAL_LOCAL_CACHE_SIZE', default=1024)
+
+# 검증된 JWT claims 캐시 크기와 최대 보관 시간(초): 토큰 만료 시각과 이 값 중 짧은 쪽까지 보관 (0이면 사용 안 함)
+AUTH_TOKEN_CACHE_SIZE = env.int('AUTH_TOKEN_CACHE_SIZE', default=4096)
+AUTH_TOKEN_CACHE_MAX_TTL = env.int('AUTH_TOKEN_CACHE_MAX_TTL', default=3600)
+
 
 # Email settings
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -248,6 +257,21 @@ AWS_STORAGE_BUCKET_NAME = env('AWS_STORAGE_BUCKET_NAME')
 AWS_S3_REGION_NAME = env('AWS_S3_REGION_NAME')
 AWS_S3_CUSTOM_DOMAIN = env('AWS_S3_CUSTOM_DOMAIN')
 
+# 병합 영상 S3 업로드 설정 (part 크기, 동시 업로드 수, 초당 최대 전송량(0이면 제한 없음))
+S3_UPLOAD_PART_SIZE = env.int('S3_UPLOAD_PART_SIZE', default=64 * 1024 * 1024)
+S3_UPLOAD_CONCURRENCY = env.int('S3_UPLOAD_CONCURRENCY', default=4)
+S3_UPLOAD_MAX_BANDWIDTH = env.int('S3_UPLOAD_MAX_BANDWIDTH', default=0)
+# SSE-KMS 등으로 ETag가 MD5가 아닌 버킷에서는 False로 설정
+S3_UPLOAD_VERIFY_ETAG = env.bool('S3_UPLOAD_VERIFY_ETAG', default=True)
+# 프로세스 단위로 공유하는 S3 클라이언트의 커넥션 풀 크기 (동시 요청 수 + part 업로드 수 이상)
+S3_MAX_POOL_CONNECTIONS = env.int('S3_MAX_POOL_CONNECTIONS', default=50)
+# 웹캠 청크 직접 업로드용 presigned URL 만료 시간(초)과 청크 최대 크기
+WEBCAM_UPLOAD_URL_EXPIRES = env.int('WEBCAM_UPLOAD_URL_EXPIRES', default=5 * 60)
+WEBCAM_UPLOAD_MAX_SIZE = env.int('WEBCAM_UPLOAD_MAX_SIZE', default=200 * 1024 * 1024)
+# presigned URL을 쓸 수 없는 환경에서 업로드 파일을 서버에 버퍼링하지 않고 S3로 바로 전송할지 여부와 part 크기
+S3_STREAMING_UPLOAD = env.bool('S3_STREAMING_UPLOAD', default=False)
+S3_STREAMING_UPLOAD_PART_SIZE = env.int('S3_STREAMING_UPLOAD_PART_SIZE', default=8 * 1024 * 1024)
+
 # Django 파일 저장소 설정
 DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
 STATICFILES_STORAGE = 'storages.backends.s3boto3.S3StaticStorage'
@@ -264,4 +288,34 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'accounts.User'
 
 CELERY_BROKER_URL = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
-CELERY_RESULT_BACKEND = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
\ No newline at end of file
+CELERY_RESULT_BACKEND = f'redis://{REDIS_HOST}:{REDIS_PORT}/0'
+
+# 영상 병합 설정
+# True면 기준 포맷과 같은 청크는 -c copy로 리먹싱하고 최종 병합도 재인코딩 없이 수행
+VIDEO_MERGE_STREAM_COPY = env.bool('VIDEO_MERGE_STREAM_COPY', default=True)
+# S3 청크 선다운로드 동시 실행 수와 미리 받아둘 최대 청크 수
+VIDEO_MERGE_DOWNLOAD_WORKERS = env.int('VIDEO_MERGE_DOWNLOAD_WORKERS', default=4)
+VIDEO_MERGE_PREFETCH_DEPTH = env.int('VIDEO_MERGE_PREFETCH_DEPTH', default=8)
+# 웹캠 청크 업로드 시점에 검증/정규화 작업을 등록할지 여부
+VIDEO_INCREMENTAL_NORMALIZE = env.bool('VIDEO_INCREMENTAL_NORMALIZE', default=True)
+# 병합 중 재인코딩한 구간을 S3에 저장해 재시도 시 이어서 병합할지 여부
+VIDEO_MERGE_CHECKPOINT = env.bool('VIDEO_MERGE_CHECKPOINT', default=True)
+# 청크 사이 공백을 채울 검은 화면 구간의 표준 길이(초)와 로컬 캐시 경로
+VIDEO_GAP_FILLER_DURATIONS = env.list('VIDEO_GAP_FILLER_DURATIONS', cast=int, default=[60, 30, 5, 1])
+VIDEO_GAP_FILLER_DIR = env('VIDEO_GAP_FILLER_DIR', default=os.path.join(tempfile.gettempdir(), 'proctormatic_black'))
+
+# 이상행동 감지(YOLO) 설정
+# 초당 추론할 프레임 수와 한 번의 모델 호출로 묶어 추론할 프레임 수
+AI_SAMPLE_FPS = env.int('AI_SAMPLE_FPS', default=2)
+AI_BATCH_SIZE = env.int('AI_BATCH_SIZE', default=16)
+# 워커 부팅 시 YOLO 모델을 미리 로드하고 더미 추론으로 워밍업할지 여부
+AI_WARM_UP_ON_WORKER_BOOT = env.bool('AI_WARM_UP_ON_WORKER_BOOT', default=False)
+
+# 이상행동 분석 작업은 병합 워커와 분리된 전용 큐에서 처리
+# 예) celery -A proctormatic worker -Q analysis -c 2 --prefetch-multiplier 1
+AI_ANALYSIS_QUEUE = env('AI_ANALYSIS_QUEUE', default='analysis')
+CELERY_TASK_ROUTES = {
+    'takers.tasks.analyze_video_task': {'queue': AI_ANALYSIS_QUEUE},
+    'takers.tasks.analyze_chunk_task': {'queue': AI_ANALYSIS_QUEUE},
+    'takers.tasks.save_analysis_result_task': {'queue': AI_ANALYSIS_QUEUE},
+}
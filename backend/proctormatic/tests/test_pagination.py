@@ -0,0 +1,137 @@
+import json
+import base64
+from datetime import datetime
+from django.test import TestCase, RequestFactory
+from django.contrib.auth import get_user_model
+from freezegun import freeze_time
+from rest_framework import status
+
+from coins.models import Coin
+from coins.serializers import CoinHistorySerializer
+from proctormatic.pagination import paginate_queryset, paginate_by_cursor
+
+User = get_user_model()
+
+PAGE_SIZE = 10
+
+
+def make_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class CursorPaginationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            name='test',
+            email='test@test.com',
+            birth='2000-01-01',
+            policy=True,
+            marketing=True
+        )
+
+        # 페이지 경계에서 같은 생성 시각이 이어지도록 3건씩 같은 시각으로 생성 (총 53건)
+        for index in range(53):
+            with freeze_time(datetime(2024, 1, 1, 0, index // 3)):
+                Coin.objects.create(user=cls.user, type='charge', amount=index)
+
+    def get_history(self, *ordering):
+        return Coin.objects.filter(user=self.user).order_by(*ordering)
+
+    def traverse_forward(self, history):
+        pages = []
+        data = paginate_by_cursor(history, None, PAGE_SIZE)
+        while True:
+            pages.append([coin.id for coin in data['items']])
+            if not data['next']:
+                return pages, data
+            data = paginate_by_cursor(history, data['nextCursor'], PAGE_SIZE)
+
+    def test_forward_traversal_without_duplicates_or_gaps(self):
+        '''
+        다음 커서를 따라가면 전체 내역을 중복/누락 없이 정렬 순서대로 반환한다
+        '''
+        # given
+        history = self.get_history('-created_at', '-id')
+
+        # when
+        pages, last_page = self.traverse_forward(history)
+
+        # then
+        self.assertEqual([coin_id for page in pages for coin_id in page], list(history.values_list('id', flat=True)))
+        self.assertEqual([len(page) for page in pages], [10, 10, 10, 10, 10, 3])
+        self.assertIsNone(last_page['nextCursor'])
+
+    def test_backward_traversal_without_duplicates_or_gaps(self):
+        '''
+        마지막 페이지에서 이전 커서를 따라가면 앞으로 순회한 페이지를 역순으로 같은 내용으로 반환한다
+        '''
+        # given
+        history = self.get_history('-created_at', '-id')
+        forward_pages, data = self.traverse_forward(history)
+
+        # when
+        backward_pages = [[coin.id for coin in data['items']]]
+        while data['prev']:
+            data = paginate_by_cursor(history, data['prevCursor'], PAGE_SIZE)
+            backward_pages.append([coin.id for coin in data['items']])
+
+        # then
+        self.assertEqual(backward_pages, forward_pages[::-1])
+        self.assertIsNone(data['prevCursor'])
+
+    def test_forward_traversal_ascending_without_pk(self):
+        '''
+        pk가 없는 오름차순 정렬도 pk를 보조 정렬 기준으로 붙여 중복/누락 없이 순회한다
+        '''
+        # given
+        history = self.get_history('created_at')
+
+        # when
+        pages, _ = self.traverse_forward(history)
+
+        # then
+        coin_ids = [coin_id for page in pages for coin_id in page]
+        self.assertEqual(coin_ids, list(history.order_by('created_at', 'pk').values_list('id', flat=True)))
+        self.assertEqual(len(set(coin_ids)), 53)
+
+    def test_invalid_cursor(self):
+        '''
+        디코딩할 수 없거나 정렬 기준과 맞지 않는 커서는 None을 반환한다
+        '''
+        # given
+        history = self.get_history('-created_at', '-id')
+        invalid_cursors = [
+            'not-a-cursor',
+            base64.urlsafe_b64encode(b'not json').decode(),
+            make_cursor(['sideways', ['2024-01-01T00:00:00', 1]]),
+            make_cursor(['next', ['2024-01-01T00:00:00']]),
+            make_cursor(['next', ['not a datetime', 1]]),
+            make_cursor(['next', ['2024-01-01T00:00:00', 'not an id']]),
+            make_cursor({'direction': 'next'}),
+        ]
+
+        # when / then
+        for cursor in invalid_cursors:
+            with self.subTest(cursor=cursor):
+                self.assertIsNone(paginate_by_cursor(history, cursor, PAGE_SIZE))
+
+    def test_invalid_cursor_request(self):
+        '''
+        잘못된 커서로 요청하면 400 status를 반환하고, 빈 커서는 첫 페이지를 반환한다
+        '''
+        # given
+        history = self.get_history('-created_at', '-id')
+        factory = RequestFactory()
+
+        # when
+        invalid_response = paginate_queryset(factory.get('/', {'cursor': 'not-a-cursor'}), history, CoinHistorySerializer, 'data')
+        first_response = paginate_queryset(factory.get('/', {'cursor': ''}), history, CoinHistorySerializer, 'data')
+
+        # then
+        self.assertEqual(invalid_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(invalid_response.data['message'], '잘못된 커서 요청입니다.')
+        self.assertEqual(first_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(first_response.data['data']), PAGE_SIZE)
+        self.assertFalse(first_response.data['prev'])
+        self.assertTrue(first_response.data['next'])
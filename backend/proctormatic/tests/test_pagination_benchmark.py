@@ -0,0 +1,78 @@
+import os
+import time
+import unittest
+from datetime import datetime
+from statistics import median
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from freezegun import freeze_time
+
+from coins.models import Coin
+from proctormatic.pagination import paginate_by_page, paginate_by_cursor, get_cursor_ordering, encode_cursor
+
+User = get_user_model()
+
+# 대량 시딩과 실행 시간 비교는 PAGINATION_BENCHMARK_ROWS를 지정했을 때만 실행 (50000 이상 권장, 운영 규모 비교는 1000000)
+BENCHMARK_ROWS = int(os.environ.get('PAGINATION_BENCHMARK_ROWS', 0))
+BENCHMARK_PAGE_SIZE = 10
+BENCHMARK_REPEAT = 5
+BATCH_SIZE = 10000
+
+
+@unittest.skipUnless(BENCHMARK_ROWS, 'PAGINATION_BENCHMARK_ROWS를 지정했을 때만 실행')
+class PaginationBenchmarkTestCase(TestCase):
+    '''
+    깊은 페이지에서 페이지 번호(OFFSET) 방식과 커서 방식의 조회 시간을 비교한다
+    '''
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(
+            name='test',
+            email='test@test.com',
+            birth='2000-01-01',
+            policy=True,
+            marketing=True
+        )
+
+        # 내역마다 생성 시각이 1초씩 다르도록 시간을 흘려보내며 생성
+        with freeze_time(datetime(2024, 1, 1), auto_tick_seconds=1):
+            for start in range(0, BENCHMARK_ROWS, BATCH_SIZE):
+                Coin.objects.bulk_create([
+                    Coin(user=cls.user, type='charge', amount=100)
+                    for _ in range(min(BATCH_SIZE, BENCHMARK_ROWS - start))
+                ])
+
+    def measure(self, paginate):
+        elapsed = []
+        for _ in range(BENCHMARK_REPEAT):
+            started_at = time.perf_counter()
+            data = paginate()
+            list(data['items'])
+            elapsed.append(time.perf_counter() - started_at)
+        return median(elapsed), data
+
+    def test_deep_page_cursor_faster_than_offset(self):
+        '''
+        마지막 페이지 조회 시 커서 방식이 OFFSET 방식보다 빠르고 같은 내역을 반환한다
+        '''
+        # given
+        history = Coin.objects.filter(user=self.user.id).order_by('-created_at', '-id')
+        last_page = BENCHMARK_ROWS // BENCHMARK_PAGE_SIZE
+        offset = (last_page - 1) * BENCHMARK_PAGE_SIZE
+        previous_item = history[offset - 1]
+        cursor = encode_cursor('next', get_cursor_ordering(history), previous_item)
+
+        # when
+        offset_elapsed, offset_data = self.measure(
+            lambda: paginate_by_page(history, last_page, BENCHMARK_PAGE_SIZE, total_count=BENCHMARK_ROWS)
+        )
+        cursor_elapsed, cursor_data = self.measure(
+            lambda: paginate_by_cursor(history, cursor, BENCHMARK_PAGE_SIZE)
+        )
+
+        # then
+        self.assertEqual(
+            [coin.id for coin in offset_data['items']],
+            [coin.id for coin in cursor_data['items']]
+        )
+        self.assertLess(cursor_elapsed, offset_elapsed)
@@ -1,12 +1,79 @@
-import cv2
-from ultralytics import YOLO
+import os
+import time
+import threading
 import logging
+from django.conf import settings
+from django.db import transaction
 from takers.models import Abnormal
 
+# cv2, numpy, ultralytics(torch)는 import 비용과 메모리가 크므로 추론하는 워커 코드에서만 import
+# (웹 프로세스는 takers.tasks를 통해 이 모듈을 import하지만 추론은 하지 않음)
 
-def process_video_by_frame(video_path, model_path, taker_id):
-    # YOLO 모델 로드
-    model = YOLO(model_path)
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(__file__), 'yolo11_epochs50_imgsz640_batch4_best.pt')
+
+# 워커 프로세스 단위로 로드된 YOLO 모델을 재사용하기 위한 캐시
+_model_cache = {}
+_model_cache_lock = threading.Lock()
+_model_stats = {
+    'loads': 0,
+    'load_seconds': 0.0,
+    'hits': 0,
+}
+
+
+def get_model(model_path=DEFAULT_MODEL_PATH):
+    model = _model_cache.get(model_path)
+    if model is not None:
+        _model_stats['hits'] += 1
+        return model
+
+    with _model_cache_lock:
+        model = _model_cache.get(model_path)
+        if model is not None:
+            _model_stats['hits'] += 1
+            return model
+
+        from ultralytics import YOLO
+
+        started_at = time.perf_counter()
+        model = YOLO(model_path)
+        load_seconds = time.perf_counter() - started_at
+
+        _model_cache[model_path] = model
+        _model_stats['loads'] += 1
+        _model_stats['load_seconds'] += load_seconds
+        logging.info(f"YOLO 모델 로드 완료: path={model_path}, load_seconds={load_seconds:.3f}, pid={os.getpid()}")
+
+    return model
+
+
+def get_model_stats():
+    return {**_model_stats, 'cached_models': len(_model_cache)}
+
+
+def warm_up_model(model_path=DEFAULT_MODEL_PATH):
+    # 첫 추론 시 발생하는 초기화 비용을 워커 부팅 시점에 미리 지불
+    import numpy as np
+
+    model = get_model(model_path)
+
+    started_at = time.perf_counter()
+    model(np.zeros((640, 640, 3), dtype=np.uint8), conf=0.5, verbose=False)
+    logging.info(f"YOLO 모델 워밍업 완료: warm_up_seconds={time.perf_counter() - started_at:.3f}, pid={os.getpid()}")
+
+
+def detect_intervals(video_path, model_path, sample_fps=None, batch_size=None):
+    # 감지 구간은 초 단위로만 기록되므로 모든 프레임이 아닌 초당 sample_fps장만 추론
+    import cv2
+
+    sample_fps = sample_fps or settings.AI_SAMPLE_FPS
+    batch_size = batch_size or settings.AI_BATCH_SIZE
+    sample_interval_ms = 1000 / sample_fps
+
+    # 프로세스에 캐시된 YOLO 모델 사용 (최초 호출 시에만 로드)
+    started_at = time.perf_counter()
+    model = get_model(model_path)
+    logging.info(f"YOLO 모델 준비 시간: {time.perf_counter() - started_at:.3f}s, stats={get_model_stats()}")
 
     # 동영상 파일 열기
     cap = cv2.VideoCapture(video_path)
@@ -14,81 +81,138 @@ def process_video_by_frame(video_path, model_path, taker_id):
     # 라벨별 감지 시작 및 종료 시간 저장 딕셔너리
     detection_intervals = {}
 
+    # 한 번의 모델 호출로 추론할 (초, 프레임) 묶음
+    batch = []
+    next_sample_ms = 0
+
     # 동영상 프레임 처리 루프
     while cap.isOpened():
-        ret, frame = cap.read()
+        # 샘플링하지 않는 프레임은 grab만 하고 디코딩된 이미지 변환(retrieve)은 생략
+        if not cap.grab():
+            break
+
+        msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+        if msec < next_sample_ms:
+            continue
+        while next_sample_ms <= msec:
+            next_sample_ms += sample_interval_ms
+
+        ret, frame = cap.retrieve()
         if not ret:
             break
 
         # 현재 프레임의 시간 계산 (초 단위)
-        frame_time = int(cap.get(cv2.CAP_PROP_POS_MSEC) / 1000)
+        batch.append((int(msec / 1000), frame))
 
-        # YOLO로 객체 감지 수행
-        results = model(frame, conf=0.5)
+        if len(batch) >= batch_size:
+            detect_batch(model, batch, detection_intervals)
+            batch = []
 
-        try:
-            boxes = results[0].boxes if hasattr(results[0], 'boxes') else results[0].detections
+    if batch:
+        detect_batch(model, batch, detection_intervals)
 
-            current_detected_labels = set()
+    cap.release()
 
-            for box in boxes:
-                class_id = int(box.cls)
-                label_name = results[0].names[class_id]
-                current_detected_labels.add(label_name)
+    return detection_intervals
 
-                # 새로운 라벨에 대해 초기화
-                if label_name not in detection_intervals:
-                    detection_intervals[label_name] = [{'start': frame_time, 'end': frame_time}]
-                else:
-                    last_interval = detection_intervals[label_name][-1]
-                    # 이전 구간과 연속된 경우 종료 시간 업데이트
-                    if last_interval['end'] == frame_time - 1:
-                        last_interval['end'] = frame_time
-                    else:
-                        # 새로운 구간 추가
-                        detection_intervals[label_name].append({'start': frame_time, 'end': frame_time})
 
-        except AttributeError:
-            logging.warning("모델 출력 형식이 예상과 다릅니다. 결과 확인이 필요합니다.")
+def merge_intervals(intervals):
+    if not intervals:
+        return []
 
-    cap.release()
+    # 여러 청크의 결과가 섞여 들어올 수 있으므로 시작 시간 기준으로 정렬 후 병합
+    intervals = sorted(intervals, key=lambda interval: interval['start'])
+    merged_intervals = []
+    current_interval = dict(intervals[0])
 
-    # 연속 구간 병합 및 최종 출력
-    for label, intervals in detection_intervals.items():
-        merged_intervals = []
-        current_interval = intervals[0]
+    for interval in intervals[1:]:
+        # 이전 구간과 연속된 경우 종료 시간 확장
+        if interval['start'] <= current_interval['end'] + 1:
+            current_interval['end'] = max(current_interval['end'], interval['end'])
+        else:
+            # 연속되지 않으면 현재 구간 저장 후 새 구간 시작
+            merged_intervals.append(current_interval)
+            current_interval = dict(interval)
+    # 마지막 구간 추가
+    merged_intervals.append(current_interval)
 
-        for interval in intervals[1:]:
-            # 이전 구간과 연속된 경우 종료 시간 확장
-            if interval['start'] <= current_interval['end'] + 1:
-                current_interval['end'] = interval['end']
-            else:
-                # 연속되지 않으면 현재 구간 저장 후 새 구간 시작
-                merged_intervals.append(current_interval)
-                current_interval = interval
-        # 마지막 구간 추가
-        merged_intervals.append(current_interval)
+    return merged_intervals
 
-        # 최종 병합된 결과 출력
-        save_abnormal_batch(label, merged_intervals, taker_id)
 
-    return detection_intervals
+def offset_intervals(detection_intervals, offset):
+    # 청크 내부 시간(초)을 병합 영상 기준 시간으로 변환
+    return {
+        label: [{'start': interval['start'] + offset, 'end': interval['end'] + offset} for interval in intervals]
+        for label, intervals in detection_intervals.items()
+    }
+
+
+def stitch_chunk_intervals(chunk_results):
+    # 청크별 감지 결과를 라벨 단위로 모은 뒤 청크 경계를 넘어 이어지는 구간을 하나로 병합
+    collected = {}
+    for detection_intervals in chunk_results:
+        for label, intervals in (detection_intervals or {}).items():
+            collected.setdefault(label, []).extend(intervals)
+
+    return {label: merge_intervals(intervals) for label, intervals in collected.items()}
 
 
-def save_abnormal_batch(label, intervals, taker):
-    for interval in intervals:
-        logging.info(f"Saving abnormal: label={label}, start={interval['start']}, end={interval['end']}, taker={taker}")
+def detect_batch(model, batch, detection_intervals):
+    # YOLO로 샘플링된 프레임들을 한 번에 객체 감지
+    frame_times = [frame_time for frame_time, _ in batch]
+    frames = [frame for _, frame in batch]
+    results = model(frames, conf=0.5, verbose=False)
 
+    for frame_time, result in zip(frame_times, results):
+        update_detection_intervals(detection_intervals, result, frame_time)
+
+
+def update_detection_intervals(detection_intervals, result, frame_time):
+    try:
+        boxes = result.boxes if hasattr(result, 'boxes') else result.detections
+
+        for box in boxes:
+            class_id = int(box.cls)
+            label_name = result.names[class_id]
+
+            # 새로운 라벨에 대해 초기화
+            if label_name not in detection_intervals:
+                detection_intervals[label_name] = [{'start': frame_time, 'end': frame_time}]
+            else:
+                last_interval = detection_intervals[label_name][-1]
+                # 같은 초에 이미 감지된 경우 건너뜀
+                if last_interval['end'] == frame_time:
+                    continue
+                # 이전 구간과 연속된 경우 종료 시간 업데이트
+                if last_interval['end'] == frame_time - 1:
+                    last_interval['end'] = frame_time
+                else:
+                    # 새로운 구간 추가
+                    detection_intervals[label_name].append({'start': frame_time, 'end': frame_time})
+
+    except AttributeError:
+        logging.warning("모델 출력 형식이 예상과 다릅니다. 결과 확인이 필요합니다.")
+
+
+def save_abnormal_intervals(detection_intervals, taker):
+    # 모든 라벨의 구간을 한 번의 bulk_create로 저장
     abnormalities = [
         Abnormal(
             taker_id=taker,
             type=label,
             detected_time=seconds_to_time_format(interval['start']),
-            end_time=seconds_to_time_format(interval['end'])
+            end_time=seconds_to_time_format(interval['end']),
+            source='ai'
         )
+        for label, intervals in detection_intervals.items()
         for interval in intervals
     ]
-    Abnormal.objects.bulk_create(abnormalities)
+    logging.info(f"Saving {len(abnormalities)} abnormals for taker={taker}")
+
+    # 재병합 등으로 분석이 다시 실행되면 이전 분석 결과를 교체 (응시 화면에서 등록한 이상행동은 유지)
+    with transaction.atomic():
+        Abnormal.objects.filter(taker_id=taker, source='ai').delete()
+        Abnormal.objects.bulk_create(abnormalities)
 
 
 def seconds_to_time_format(seconds):
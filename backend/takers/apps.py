@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TakersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'takers'
+
+    def ready(self):
+        import takers.signals  # noqa
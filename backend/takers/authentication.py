@@ -1,15 +1,42 @@
+import jwt
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.exceptions import AuthenticationFailed
 
+from accounts.principal_cache import get_principal
+from accounts.tokens import get_verified_access_token
 from takers.models import Taker
 
+# 웹캠 청크 업로드 등 요청마다 DB를 조회하지 않도록 캐시하는 응시자 필드 (나머지는 접근 시 DB에서 조회)
+TAKER_PRINCIPAL_FIELDS = ('id', 'exam_id', 'name', 'email', 'check_out_state')
+
 class CustomJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        # get_validated_token에서 요청 단위로 claims를 재사용할 수 있도록 요청을 보관
+        self.request = request
+        return super().authenticate(request)
+
+    def get_validated_token(self, raw_token):
+        token = raw_token.decode() if isinstance(raw_token, bytes) else raw_token
+
+        try:
+            validated_token = get_verified_access_token(self.request, token)
+        except jwt.ExpiredSignatureError:
+            raise AuthenticationFailed('토큰이 만료되었습니다.')
+        except jwt.InvalidTokenError:
+            raise AuthenticationFailed('유효하지 않은 토큰입니다.')
+
+        # simplejwt AccessToken 검증과 동일하게 토큰 타입과 식별자 확인
+        if validated_token.get('token_type') != 'access' or 'jti' not in validated_token.payload:
+            raise AuthenticationFailed('유효하지 않은 토큰입니다.')
+
+        return validated_token
+
     def get_user(self, validated_token):
         user_id = validated_token['user_id']
         user_role = validated_token['role']
 
-        user = Taker.objects.filter(id=user_id).first()
+        user = get_principal(Taker, user_id, TAKER_PRINCIPAL_FIELDS)
 
         if user_role == 'host':
             raise PermissionDenied("권한이 없습니다.")
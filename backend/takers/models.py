@@ -6,10 +6,12 @@ class Taker(models.Model):
         ('normal', 'Normal'),
         ('abnormal', 'Abnormal')
     )
+    # done: 병합 영상 업로드 완료, analyzed: 이상행동 분석까지 완료
     STORED_STATE_CHOICES = (
         ('before', 'Before'),
         ('in_progress', 'In_progress'),
-        ('done', 'Done')
+        ('done', 'Done'),
+        ('analyzed', 'Analyzed')
     )
 
     exam = models.ForeignKey(Exam, on_delete=models.CASCADE)
@@ -24,6 +26,10 @@ class Taker(models.Model):
 
     class Meta:
         db_table = 'taker'
+        # 입장/이메일 중복 확인 시 (exam, email)로 조회하며, 한 시험에 같은 이메일로 두 번 등록될 수 없음
+        constraints = [
+            models.UniqueConstraint(fields=['exam', 'email'], name='taker_exam_email_uniq'),
+        ]
 
     @property
     def is_authenticated(self):
@@ -41,6 +47,9 @@ class Logs(models.Model):
 
     class Meta:
         db_table = 'logs'
+        indexes = [
+            models.Index(fields=['taker', 'type'], name='logs_taker_type_idx'),
+        ]
 
 class Abnormal(models.Model):
     TYPE_CHOICES = (
@@ -58,11 +67,17 @@ class Abnormal(models.Model):
         ('mobilephone', 'Mobilephone'),
         ('etc', 'Etc')
     )
+    # 응시 화면에서 감지해 등록한 이상행동(client)과 영상 분석 작업이 저장한 이상행동(ai) 구분
+    SOURCE_CHOICES = (
+        ('client', 'Client'),
+        ('ai', 'Ai')
+    )
 
     taker = models.ForeignKey(Taker, on_delete=models.CASCADE, related_name="abnormalList")
     detected_time = models.TimeField()
     end_time = models.TimeField()
     type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES, default='client')
 
     class Meta:
         db_table = 'abnormal'
\ No newline at end of file
@@ -14,6 +14,8 @@ class TakerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Taker
         fields = ['name', 'email', 'exam']
+        # 이미 등록된 (exam, email)은 뷰에서 재입장으로 처리하므로 unique 제약 검증은 하지 않음
+        validators = []
 
 class UpdateTakerSerializer(serializers.ModelSerializer):
     birth = CustomCharField(
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from accounts.principal_cache import invalidate_principal
+from takers.models import Taker
+
+
+@receiver(post_save, sender=Taker)
+@receiver(post_delete, sender=Taker)
+def invalidate_taker_principal(sender, instance, **kwargs):
+    # check_out_state 등 인증 관련 필드가 바뀔 수 있으므로 저장/삭제 시 캐시된 인증 정보 삭제
+    invalidate_principal(Taker, instance.pk)
@@ -0,0 +1,217 @@
+import os
+import math
+import time
+import base64
+import hashlib
+import logging
+import threading
+import boto3
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+
+# 프로세스 단위로 재사용하는 S3 클라이언트 (boto3 클라이언트는 스레드 간 공유 가능)
+_s3_client = None
+_s3_client_pid = None
+_s3_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    global _s3_client, _s3_client_pid
+
+    # fork된 워커 프로세스는 부모의 커넥션을 공유하지 않도록 새로 생성
+    client = _s3_client
+    if client is not None and _s3_client_pid == os.getpid():
+        return client
+
+    with _s3_client_lock:
+        if _s3_client is not None and _s3_client_pid == os.getpid():
+            return _s3_client
+
+        config = Config(
+            retries=dict(
+                max_attempts=5,
+                mode='adaptive'
+            ),
+            connect_timeout=5,
+            read_timeout=10,
+            max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS
+        )
+        try:
+            # boto3.client()가 사용하는 기본 세션은 스레드 안전하지 않으므로 별도 세션에서 생성
+            _s3_client = boto3.session.Session().client(
+                's3',
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_S3_REGION_NAME,
+                config=config
+            )
+        except Exception as e:
+            logging.error(f"Failed to create S3 client: {str(e)}")
+            raise
+        _s3_client_pid = os.getpid()
+
+    return _s3_client
+
+
+def reset_s3_client():
+    global _s3_client, _s3_client_pid
+
+    with _s3_client_lock:
+        _s3_client = None
+        _s3_client_pid = None
+
+
+class BandwidthLimiter:
+    # 여러 part 업로드 스레드가 공유하는 초당 전송량 제한 (0이면 제한 없음)
+    def __init__(self, max_bytes_per_second):
+        self.max_bytes_per_second = max_bytes_per_second
+        self.next_available = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, size):
+        if not self.max_bytes_per_second:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            self.next_available = max(self.next_available, now)
+            wait = self.next_available - now
+            self.next_available += size / self.max_bytes_per_second
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def find_multipart_upload(s3_client, bucket, key):
+    # 이전 시도에서 완료되지 못한 multipart upload가 있으면 가장 최근 것을 이어서 사용
+    paginator = s3_client.get_paginator('list_multipart_uploads')
+    uploads = [
+        upload
+        for page in paginator.paginate(Bucket=bucket, Prefix=key)
+        for upload in page.get('Uploads', [])
+        if upload['Key'] == key
+    ]
+    if not uploads:
+        return None
+    return max(uploads, key=lambda upload: upload['Initiated'])['UploadId']
+
+
+def list_uploaded_parts(s3_client, bucket, key, upload_id):
+    paginator = s3_client.get_paginator('list_parts')
+    return {
+        part['PartNumber']: part['ETag'].strip('"')
+        for page in paginator.paginate(Bucket=bucket, Key=key, UploadId=upload_id)
+        for part in page.get('Parts', [])
+    }
+
+
+def abort_multipart_uploads(s3_client, bucket, key):
+    try:
+        paginator = s3_client.get_paginator('list_multipart_uploads')
+        for page in paginator.paginate(Bucket=bucket, Prefix=key):
+            for upload in page.get('Uploads', []):
+                if upload['Key'] == key:
+                    s3_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload['UploadId'])
+    except Exception as e:
+        logging.error(f"multipart upload 취소 실패 {key}: {str(e)}")
+
+
+def object_args_match(s3_client, bucket, key, extra_args):
+    # 업로드된 객체의 Content-Type/메타데이터가 이번 업로드에서 지정한 값과 같은지 확인
+    response = s3_client.head_object(Bucket=bucket, Key=key)
+    if 'ContentType' in extra_args and response.get('ContentType') != extra_args['ContentType']:
+        return False
+    return response.get('Metadata', {}) == extra_args.get('Metadata', {})
+
+
+def read_part(file_path, part_number, part_size):
+    with open(file_path, 'rb') as f:
+        f.seek((part_number - 1) * part_size)
+        return f.read(part_size)
+
+
+def verify_etag(etag, expected):
+    if settings.S3_UPLOAD_VERIFY_ETAG and etag.strip('"') != expected:
+        raise Exception(f"업로드 무결성 검증 실패: expected={expected}, actual={etag}")
+
+
+def upload_file(s3_client, file_path, bucket, key, extra_args=None):
+    # part 단위 병렬 업로드 + Content-MD5/ETag 검증 + 재시도 시 이미 올라간 part는 건너뛰고 이어서 업로드
+    part_size = max(settings.S3_UPLOAD_PART_SIZE, 5 * 1024 * 1024)
+    limiter = BandwidthLimiter(settings.S3_UPLOAD_MAX_BANDWIDTH)
+    extra_args = extra_args or {}
+    file_size = os.path.getsize(file_path)
+
+    if file_size <= part_size:
+        data = read_part(file_path, 1, part_size)
+        digest = hashlib.md5(data).digest()
+        limiter.consume(len(data))
+        response = s3_client.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=data,
+            ContentMD5=base64.b64encode(digest).decode(),
+            **extra_args
+        )
+        verify_etag(response['ETag'], digest.hex())
+        return response['ETag']
+
+    upload_id = find_multipart_upload(s3_client, bucket, key)
+    resumed = upload_id is not None
+    if resumed:
+        uploaded_parts = list_uploaded_parts(s3_client, bucket, key, upload_id)
+        logging.info(f"multipart upload 이어서 진행: key={key}, 완료된 part 수={len(uploaded_parts)}")
+    else:
+        upload_id = s3_client.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)['UploadId']
+        uploaded_parts = {}
+
+    def upload_part(part_number):
+        data = read_part(file_path, part_number, part_size)
+        digest = hashlib.md5(data).digest()
+
+        # 이전 시도에서 같은 내용으로 올라간 part는 다시 보내지 않음
+        if uploaded_parts.get(part_number) == digest.hex():
+            return part_number, digest
+
+        limiter.consume(len(data))
+        response = s3_client.upload_part(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+            ContentMD5=base64.b64encode(digest).decode()
+        )
+        verify_etag(response['ETag'], digest.hex())
+        return part_number, digest
+
+    part_count = math.ceil(file_size / part_size)
+    with ThreadPoolExecutor(max_workers=settings.S3_UPLOAD_CONCURRENCY) as executor:
+        parts = sorted(executor.map(upload_part, range(1, part_count + 1)))
+
+    response = s3_client.complete_multipart_upload(
+        Bucket=bucket,
+        Key=key,
+        UploadId=upload_id,
+        MultipartUpload={
+            'Parts': [{'PartNumber': part_number, 'ETag': digest.hex()} for part_number, digest in parts]
+        }
+    )
+
+    # multipart 객체의 ETag는 각 part MD5를 이어붙인 값의 MD5 + '-part 수'
+    verify_etag(response['ETag'], f"{hashlib.md5(b''.join(digest for _, digest in parts)).hexdigest()}-{part_count}")
+
+    # Content-Type/메타데이터는 create_multipart_upload 시점에 정해지므로 이어서 올린 경우 첫 시도의 값이 남아있음
+    # (진행 중인 upload의 메타데이터는 조회할 수 없어 완료 후 확인하고, 다르면 이번 시도의 값으로 교체)
+    if resumed and extra_args and not object_args_match(s3_client, bucket, key, extra_args):
+        logging.info(f"이어서 올린 객체의 메타데이터 교체: key={key}")
+        s3_client.copy(
+            {'Bucket': bucket, 'Key': key},
+            bucket,
+            key,
+            ExtraArgs={'MetadataDirective': 'REPLACE', **extra_args}
+        )
+        return s3_client.head_object(Bucket=bucket, Key=key)['ETag']
+
+    return response['ETag']
@@ -408,4 +408,121 @@ add_abnormal_schema = extend_schema(
             }
         )
     }
-)
\ No newline at end of file
+)
+web_cam_upload_url_schema = extend_schema_view(
+    post=extend_schema(
+        summary='웹캠 파일 업로드 URL 발급',
+        description='웹캠 청크를 서버를 거치지 않고 S3에 직접 업로드할 수 있는 presigned POST 정책을 발급합니다. '
+                    'url로 fields와 파일(file, 마지막 항목)을 multipart/form-data로 전송합니다.',
+        request=OpenApiRequest({
+            'type': 'object',
+            'properties': {
+                'start_time': {
+                    'type': 'string',
+                },
+                'end_time': {
+                    'type': 'string',
+                }
+            },
+            'required': ['start_time', 'end_time']
+        }),
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                description='업로드 URL 발급 성공',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'url': {
+                            'type': 'string'
+                        },
+                        'fields': {
+                            'type': 'object'
+                        },
+                        'key': {
+                            'type': 'string'
+                        },
+                        'expires_in': {
+                            'type': 'integer'
+                        },
+                    }
+                }
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description='잘못된 요청',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {
+                            'type': 'string'
+                        },
+                    },
+                }
+            ),
+            status.HTTP_401_UNAUTHORIZED: OpenApiResponse(
+                description='인증 실패',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {
+                            'type': 'string'
+                        },
+                    },
+                }
+            ),
+        }
+    )
+)
+
+web_cam_upload_complete_schema = extend_schema_view(
+    post=extend_schema(
+        summary='웹캠 파일 업로드 완료',
+        description='presigned POST로 S3에 업로드한 웹캠 청크의 업로드 완료를 알립니다.',
+        request=OpenApiRequest({
+            'type': 'object',
+            'properties': {
+                'start_time': {
+                    'type': 'string',
+                },
+                'end_time': {
+                    'type': 'string',
+                }
+            },
+            'required': ['start_time', 'end_time']
+        }),
+        responses={
+            status.HTTP_200_OK: OpenApiResponse(
+                description='웹캠 저장 성공',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {
+                            'type': 'string'
+                        },
+                    }
+                }
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description='잘못된 요청 또는 업로드된 파일의 형식/크기 오류',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {
+                            'type': 'string'
+                        },
+                    },
+                }
+            ),
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                description='업로드된 웹캠 파일이 없음',
+                response={
+                    'type': 'object',
+                    'properties': {
+                        'message': {
+                            'type': 'string'
+                        },
+                    },
+                }
+            ),
+        }
+    )
+)
@@ -1,194 +1,411 @@
 import os
+import shutil
+import hashlib
 import logging
-import boto3
-import ffmpeg
-from botocore.config import Config
-from celery.exceptions import MaxRetriesExceededError
+from botocore.exceptions import ClientError
 from django.conf import settings
-from celery import shared_task
+from celery import shared_task, chord, group
+from celery.signals import worker_init, worker_process_init
 import tempfile
-from takers.ai import process_video_by_frame
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from takers.ai import detect_intervals, merge_intervals, offset_intervals, stitch_chunk_intervals, \
+    save_abnormal_intervals, warm_up_model, DEFAULT_MODEL_PATH
 from takers.models import Taker
+from takers.storage import get_s3_client, upload_file, abort_multipart_uploads
+from takers.video import probe_video, get_video_duration, normalize_video, transcode_video, compose_black_segments, write_concat_file, \
+    concat_videos
 
 # 임시 디렉토리 설정 및 생성
 TEMP_DIR = tempfile.gettempdir()
 os.makedirs(TEMP_DIR, exist_ok=True)
 
-# AWS 설정
-config = Config(
-    retries=dict(
-        max_attempts=5,
-        mode='adaptive'
-    ),
-    connect_timeout=5,
-    read_timeout=10
-)
-
-def get_s3_client():
+
+# worker_init에서 이 워커가 모델을 미리 로드할지 기록 (prefork 자식 프로세스는 fork 시 값을 물려받음)
+_warm_up_on_boot = False
+
+
+def consumes_analysis_queue(worker):
+    # -Q로 지정한 큐(지정하지 않으면 기본 큐) 중에 분석 큐가 있는지 확인
+    if worker is None:
+        return False
+    return settings.AI_ANALYSIS_QUEUE in worker.app.amqp.queues.consume_from
+
+
+@worker_init.connect
+def warm_up_model_on_worker_init(sender=None, **kwargs):
+    global _warm_up_on_boot
+
+    # 병합 워커처럼 분석 큐를 소비하지 않는 워커는 모델을 로드하지 않음
+    _warm_up_on_boot = settings.AI_WARM_UP_ON_WORKER_BOOT and consumes_analysis_queue(sender)
+
+    # prefork 풀은 자식 프로세스마다 모델을 로드하므로 worker_process_init에서 처리
+    if not _warm_up_on_boot or 'prefork' in str(getattr(sender, 'pool_cls', '')):
+        return
+    warm_up_model()
+
+
+@worker_process_init.connect
+def warm_up_model_on_worker_process_init(**kwargs):
+    if not _warm_up_on_boot:
+        return
+    warm_up_model()
+
+
+def create_work_dir(taker_id, prefix='merge'):
+    # 동시에 실행되는 병합 작업끼리 파일이 겹치지 않도록 작업마다 전용 디렉토리 사용
+    return tempfile.mkdtemp(prefix=f'{prefix}_{taker_id}_', dir=TEMP_DIR)
+
+
+def clean_work_dir(work_dir):
+    if not work_dir:
+        return
     try:
-        return boto3.client('s3',
-                            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                            region_name=settings.AWS_S3_REGION_NAME,
-                            config=config
-                            )
+        shutil.rmtree(work_dir)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logging.error(f"Failed to create S3 client: {str(e)}")
+        logging.error(f"Error cleaning up directory {work_dir}: {str(e)}")
+
+
+def parse_chunk_time(value):
+    # 응시 화면은 청크 시작/종료 시각을 HH:mm:ss로 보내고 업로드 시 ':'만 제거하므로 HHMMSS를 자정 기준 초로 변환
+    if len(value) != 6 or not value.isdigit():
+        raise ValueError(f"청크 시각 형식이 올바르지 않습니다: {value}")
+
+    hours, minutes, seconds = int(value[:2]), int(value[2:4]), int(value[4:])
+    if hours >= 24 or minutes >= 60 or seconds >= 60:
+        raise ValueError(f"청크 시각 형식이 올바르지 않습니다: {value}")
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def parse_chunk_times(video_file):
+    # webcam_<HHMMSS>_<HHMMSS>.<ext> 형식의 파일명에서 시작/종료 시각을 초 단위로 추출
+    filename_without_ext = os.path.splitext(os.path.basename(video_file))[0]
+    start_time, end_time = filename_without_ext.split('_')[1:3]
+    return parse_chunk_time(start_time), parse_chunk_time(end_time)
+
+
+def iter_webcam_chunk_objects(s3_client, folder_path):
+    # list_objects_v2는 한 번에 최대 1000개만 반환하므로 continuation token을 따라가며 순회
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Prefix=folder_path + "/"
+    )
+
+    found = False
+    for page in pages:
+        for obj in page.get('Contents', []):
+            found = True
+            key = obj['Key']
+            if not key.startswith(f"{folder_path}/webcam_") or not key.endswith(('.mp4', '.webm', '.avi')):
+                continue
+            try:
+                parse_chunk_times(key)
+            except ValueError:
+                logging.warning(f"파일명 형식이 올바르지 않은 청크를 건너뜁니다: {key}")
+                continue
+            yield obj
+
+    if not found:
+        raise Exception("비디오 파일을 찾을 수 없습니다.")
+
+
+def iter_webcam_chunks(s3_client, folder_path):
+    for obj in iter_webcam_chunk_objects(s3_client, folder_path):
+        yield obj['Key']
+
+
+def list_webcam_chunks(s3_client, folder_path):
+    # 문자열 정렬이 아닌 시작 시간(숫자) 기준으로 정렬
+    return sorted(iter_webcam_chunks(s3_client, folder_path), key=parse_chunk_times)
+
+
+def list_webcam_chunk_objects(s3_client, folder_path):
+    return sorted(iter_webcam_chunk_objects(s3_client, folder_path), key=lambda obj: parse_chunk_times(obj['Key']))
+
+
+def get_chunk_starts(video_files):
+    # 병합 작업의 계산 결과가 없을 때(이미 병합된 영상 재사용) 파일명 시각으로 병합 영상 기준 위치를 추정
+    # 병합 영상은 첫 청크 시작 시각을 0초로 하고 청크 사이 공백을 검은 화면으로 채움
+    if not video_files:
+        return []
+
+    first_start_time, _ = parse_chunk_times(video_files[0])
+    return [(video_file, parse_chunk_times(video_file)[0] - first_start_time) for video_file in video_files]
+
+
+def get_inputs_fingerprint(chunk_objects):
+    # 병합에 사용된 청크 목록(key + ETag)의 해시, 같은 입력으로 이미 병합했는지 판단하는 데 사용
+    digest = hashlib.sha256()
+    for obj in chunk_objects:
+        digest.update(f"{obj['Key']}:{obj.get('ETag', '')}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def get_merged_fingerprint(s3_client, merged_key):
+    try:
+        response = s3_client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=merged_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
         raise
+    return response.get('Metadata', {}).get('inputs-fingerprint')
+
+
+def complete_merge(taker_id, exam_id, chunk_starts=None):
+    folder_path = f"{exam_id}/{taker_id}"
+    merged_video_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{folder_path}/merged.webm"
+
+    taker = Taker.objects.filter(id=taker_id).first()
+    taker.web_cam = merged_video_url
+    taker.stored_state = 'done'
+    taker.save()
 
+    # 병합 영상은 바로 확인할 수 있도록 하고, 이상행동 분석은 별도 큐의 워커에서 수행
+    analyze_video_task.delay(taker_id, exam_id, chunk_starts)
 
-def clean_temp_files(file_paths):
-    for file_path in file_paths:
+
+def checkpoint_normalized_chunk(s3_client, normalized_path, video_file, etag):
+    # 재시도 시 다시 인코딩하지 않도록 정규화된 구간을 S3 normalized/ 경로에 저장
+    try:
+        s3_client.upload_file(
+            Filename=normalized_path,
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=get_normalized_key(video_file, etag)
+        )
+    except Exception as e:
+        logging.error(f"정규화 구간 체크포인트 저장 실패 {video_file}: {str(e)}")
+
+
+def get_normalized_key(video_file, etag):
+    # 업로드 시점에 미리 정규화해 둔 구간의 S3 경로: {exam_id}/{taker_id}/normalized/webcam_<start>_<end>.<원본 ETag>.webm
+    # 같은 key로 원본 청크가 다시 업로드되면 ETag가 바뀌므로 이전 원본으로 만든 구간은 재사용하지 않음
+    folder_path, filename = os.path.split(video_file)
+    source_etag = etag.strip('"')
+    return f"{folder_path}/normalized/{os.path.splitext(filename)[0]}.{source_etag}.webm"
+
+
+def list_normalized_keys(s3_client, folder_path):
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Prefix=f"{folder_path}/normalized/"
+    )
+    return {obj['Key'] for page in pages for obj in page.get('Contents', [])}
+
+
+def download_chunk(s3_client, video_file, local_video_path):
+    s3_client.download_file(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=video_file,
+        Filename=local_video_path
+    )
+    return local_video_path
+
+
+def prefetch_chunks(s3_client, chunk_objects, work_dir, normalized_keys=frozenset()):
+    # 인코딩하는 동안 다음 청크들을 미리 받아두도록 최대 depth개까지 다운로드를 걸어둠
+    # 현재 원본(ETag)으로 정규화된 구간이 있으면 원본 대신 정규화된 구간을 받음
+    workers = settings.VIDEO_MERGE_DOWNLOAD_WORKERS
+    depth = max(settings.VIDEO_MERGE_PREFETCH_DEPTH, workers)
+    chunk_objects = iter(chunk_objects)
+    pending = deque()
+
+    def submit(executor, chunk_object):
+        video_file = chunk_object['Key']
+        normalized_key = get_normalized_key(video_file, chunk_object['ETag'])
+        if normalized_key in normalized_keys:
+            local_video_path = os.path.join(work_dir, f"normalized_{os.path.basename(normalized_key)}")
+            future = executor.submit(download_chunk, s3_client, normalized_key, local_video_path)
+            pending.append((video_file, future, True))
+        else:
+            local_video_path = os.path.join(work_dir, os.path.basename(video_file))
+            future = executor.submit(download_chunk, s3_client, video_file, local_video_path)
+            pending.append((video_file, future, False))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as e:
-            logging.error(f"Error cleaning up file {file_path}: {str(e)}")
+            for chunk_object in chunk_objects:
+                submit(executor, chunk_object)
+                if len(pending) >= depth:
+                    break
+
+            while pending:
+                video_file, future, normalized = pending.popleft()
+                next_object = next(chunk_objects, None)
+                if next_object is not None:
+                    submit(executor, next_object)
+                yield video_file, future, normalized
+        finally:
+            # 중간에 작업이 실패하면 아직 시작하지 않은 다운로드는 취소
+            for _, future, _ in pending:
+                future.cancel()
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def prepare_chunk_task(self, taker_id, exam_id, video_file):
+    # 시험 중 업로드된 청크를 바로 검증/정규화해 두어 퇴실 시 병합은 이어붙이기만 하도록 함
+    work_dir = None
+
+    try:
+        s3_client = get_s3_client()
+        work_dir = create_work_dir(taker_id, prefix='prepare')
+        filename = os.path.basename(video_file)
+        # 다운로드 전에 ETag를 확인해, 그 사이 원본이 교체되어도 체크포인트가 새 원본과 짝지어지지 않도록 함
+        etag = s3_client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=video_file)['ETag']
+        local_video_path = download_chunk(s3_client, video_file, os.path.join(work_dir, filename))
+
+        probe = probe_video(local_video_path)
+        if probe is None:
+            logging.warning(f"유효하지 않은 비디오 파일입니다: {video_file}")
+            return f"유효하지 않은 비디오 파일입니다: {video_file}"
+
+        normalized_path = os.path.join(work_dir, f"normalized_{os.path.splitext(filename)[0]}.webm")
+        normalize_video(local_video_path, normalized_path, probe)
+
+        s3_client.upload_file(
+            Filename=normalized_path,
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=get_normalized_key(video_file, etag)
+        )
 
+        return f'{video_file} 청크가 정규화되었습니다.'
 
-if os.name == 'nt':  # Windows일 때
-    FFMPEG_PATH = r'C:\ffmpeg-7.1-essentials_build\bin\ffmpeg.exe'
-elif os.name == 'posix':  # Linux(우분투)일 때
-    FFMPEG_PATH = '/usr/bin/ffmpeg'
-else:
-    raise EnvironmentError("알 수 없는 운영체제 입니다.")
-# FFMPEG_PATH = '/usr/bin/ffmpeg'  # ffmpeg의 절대 경로 지정
+    except Exception as e:
+        logging.error(f"prepare_chunk_task에서 예기치 못한 오류 발생 {video_file}: {str(e)}")
+
+        # 작업 실패 시 재시도, 재시도 초과 시 퇴실 시점의 병합 작업에서 원본 청크를 정규화함
+        if self.request.retries >= self.max_retries:
+            logging.error(f"작업 {self.request.id}의 최대 재시도 횟수 초과. 오류: {str(e)}")
+            return f"Error: {str(e)}"
+        raise self.retry(exc=e)
+
+    finally:
+        clean_work_dir(work_dir)
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=5 * 60)
 def merge_videos_task(self, taker_id, exam_id):
-    temp_files = []
+    work_dir = None
+    checkpoint_executor = None
 
     try:
-        taker = Taker.objects.filter(id=taker_id).first()
-
-        taker.stored_state = 'in_progress'
-        taker.save()
-
         s3_client = get_s3_client()
         folder_path = f"{exam_id}/{taker_id}"
-        concat_file_path = os.path.join(TEMP_DIR, 'concat.txt')
-        merged_output_path = os.path.join(TEMP_DIR, 'merged.webm')
+        merged_key = f"{folder_path}/merged.webm"
 
         logging.info(f"비디오를 검색하는 경로: {folder_path}")
 
-        response = s3_client.list_objects_v2(
-            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-            Prefix=folder_path + "/"
-        )
+        chunk_objects = list_webcam_chunk_objects(s3_client, folder_path)
+        video_files = [obj['Key'] for obj in chunk_objects]
+        etags = {obj['Key']: obj['ETag'] for obj in chunk_objects}
 
-        if 'Contents' not in response:
-            raise Exception("비디오 파일을 찾을 수 없습니다.")
+        if not video_files:
+            return "병합할 유효한 비디오 파일이 없습니다."
 
+        # 같은 청크 목록으로 이미 병합된 영상이 있으면 다시 병합하지 않음
+        inputs_fingerprint = get_inputs_fingerprint(chunk_objects)
+        if get_merged_fingerprint(s3_client, merged_key) == inputs_fingerprint:
+            taker = Taker.objects.filter(id=taker_id).first()
+            if taker.stored_state not in ('done', 'analyzed'):
+                complete_merge(taker_id, exam_id)
+            return "이미 병합된 영상이 있습니다."
 
-        video_files = [
-            obj['Key'] for obj in response.get('Contents', [])
-            if obj['Key'].startswith(f"{folder_path}/webcam_") and obj['Key'].endswith(('.mp4', '.webm', '.avi'))
-        ]
-        video_files.sort()
+        taker = Taker.objects.filter(id=taker_id).first()
+        taker.stored_state = 'in_progress'
+        taker.save()
 
-        if not video_files:
-            return "병합할 유효한 비디오 파일이 없습니다."
+        work_dir = create_work_dir(taker_id)
+        concat_file_path = os.path.join(work_dir, 'concat.txt')
+        merged_output_path = os.path.join(work_dir, 'merged.webm')
 
         processed_videos = []
         previous_end_time = None
+        # 병합 영상에서 각 청크가 시작하는 위치(초), 분석 결과를 병합 영상 기준 시간으로 옮길 때 사용
+        timeline_position = 0
+        chunk_starts = []
+        stream_copy = settings.VIDEO_MERGE_STREAM_COPY
+        transcoded_count = 0
+        normalized_keys = list_normalized_keys(s3_client, folder_path)
+        checkpoint_executor = ThreadPoolExecutor(max_workers=settings.VIDEO_MERGE_DOWNLOAD_WORKERS)
 
-        for video_file in video_files:
+        logging.info(f"미리 정규화된 청크 수: {len(normalized_keys)}/{len(video_files)}")
+
+        for video_file, download, normalized in prefetch_chunks(s3_client, chunk_objects, work_dir, normalized_keys):
             try:
                 filename = os.path.basename(video_file)
-                filename_without_ext = os.path.splitext(filename)[0]
-                start_time, end_time = map(int, filename_without_ext.split('_')[1:3])
+                start_time, end_time = parse_chunk_times(video_file)
 
                 if previous_end_time is not None and start_time > previous_end_time:
                     gap_duration = start_time - previous_end_time
-                    black_video_path = os.path.join(TEMP_DIR, f'black_{previous_end_time}_{start_time}.webm')
-
-                    stream = ffmpeg.input('color=c=black:s=1280x720:d={}'.format(gap_duration), f='lavfi')
-                    audio = ffmpeg.input('anullsrc=r=44100:cl=stereo:d={}'.format(gap_duration), f='lavfi')
-
-                    stream = ffmpeg.output(stream, audio,
-                                           black_video_path,
-                                           vcodec='vp8',
-                                           acodec='libvorbis',
-                                           pix_fmt='yuv420p')
-
-                    ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)  # 절대 경로 지정
-
-                    processed_videos.append(black_video_path)
-                    temp_files.append(black_video_path)
-
-                local_video_path = os.path.join(TEMP_DIR, filename)
-                output_resized_path = os.path.join(TEMP_DIR, f"resized_{filename}")
-
-                s3_client.download_file(
-                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                    Key=video_file,
-                    Filename=local_video_path
-                )
-                temp_files.append(local_video_path)
-
-                stream = ffmpeg.input(local_video_path)
-                stream = ffmpeg.output(stream,
-                                       output_resized_path,
-                                       vcodec='vp8',
-                                       acodec='libvorbis',
-                                       preset='medium',
-                                       crf=23,
-                                       video_bitrate='2000k',
-                                       audio_bitrate='192k',
-                                       s='1280x720',
-                                       pix_fmt='yuv420p')
-
-                ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)  # 절대 경로 지정
+
+                    processed_videos.extend(compose_black_segments(
+                        gap_duration,
+                        settings.VIDEO_GAP_FILLER_DURATIONS,
+                        settings.VIDEO_GAP_FILLER_DIR
+                    ))
+                    timeline_position += gap_duration
+
+                output_resized_path = os.path.join(work_dir, f"resized_{filename}")
+                local_video_path = download.result()
+
+                if normalized:
+                    # 업로드 시점에 이미 기준 포맷으로 정규화된 구간은 그대로 이어붙임
+                    processed_videos.append(local_video_path)
+                    chunk_starts.append((video_file, round(timeline_position)))
+                    timeline_position += get_video_duration(local_video_path, end_time - start_time)
+                    previous_end_time = end_time
+                    continue
+
+                if stream_copy:
+                    _, transcoded = normalize_video(local_video_path, output_resized_path)
+                    if transcoded:
+                        transcoded_count += 1
+
+                    # 기준 포맷으로 정규화된 구간만 체크포인트 (transcode_video 결과는 스트림 복사 병합에 쓸 수 없음)
+                    if settings.VIDEO_MERGE_CHECKPOINT:
+                        checkpoint_executor.submit(
+                            checkpoint_normalized_chunk, s3_client, output_resized_path, video_file, etags[video_file]
+                        )
+                else:
+                    transcode_video(local_video_path, output_resized_path)
 
                 processed_videos.append(output_resized_path)
-                temp_files.append(output_resized_path)
+                chunk_starts.append((video_file, round(timeline_position)))
+                timeline_position += get_video_duration(output_resized_path, end_time - start_time)
                 previous_end_time = end_time
 
                 os.remove(local_video_path)
-                temp_files.remove(local_video_path)
 
             except Exception as e:
                 logging.error(f"다운로드 실패 {video_file}: {str(e)}")
                 continue
 
+        checkpoint_executor.shutdown(wait=True)
+        checkpoint_executor = None
+
         if not processed_videos:
             return "처리된 비디오 파일이 없습니다."
 
-        with open(concat_file_path, 'w', encoding='utf-8') as f:
-            for video_path in processed_videos:
-                video_path = video_path.replace('\\', '/')
-                f.write(f"file '{video_path}'\n")
-        temp_files.append(concat_file_path)
+        write_concat_file(processed_videos, concat_file_path)
+
+        logging.info(f"재인코딩된 청크 수: {transcoded_count}/{len(video_files)}")
 
         try:
-            stream = ffmpeg.input(concat_file_path, format='concat', safe=0)
-            stream = ffmpeg.output(stream,
-                                   merged_output_path,
-                                   vcodec='vp8',
-                                   acodec='libvorbis',
-                                   preset='medium',
-                                   crf=23,
-                                   pix_fmt='yuv420p')
-
-            ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)  # 절대 경로 지정
-            temp_files.append(merged_output_path)
-
-            model_path = os.path.join(os.path.dirname(__file__), 'yolo11_epochs50_imgsz640_batch4_best.pt')
-            process_video_by_frame(merged_output_path, model_path, taker_id)
-
-            s3_client.upload_file(
-                Filename=merged_output_path,
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                Key=f"{folder_path}/merged.webm"
+            concat_videos(concat_file_path, merged_output_path, stream_copy=stream_copy)
+
+            # part 단위 병렬 업로드, 재시도 시에는 이전에 올라간 part부터 이어서 업로드
+            upload_file(
+                s3_client,
+                merged_output_path,
+                settings.AWS_STORAGE_BUCKET_NAME,
+                merged_key,
+                extra_args={'ContentType': 'video/webm', 'Metadata': {'inputs-fingerprint': inputs_fingerprint}}
             )
 
-            merged_video_url = f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_S3_REGION_NAME}.amazonaws.com/{folder_path}/merged.webm"
-
-            taker = Taker.objects.filter(id=taker_id).first()
-            taker.web_cam = merged_video_url
-            taker.stored_state = 'done'
-            taker.save()
+            complete_merge(taker_id, exam_id, chunk_starts)
 
             return f'블랙스크린이 추가된 {len(video_files)} 개의 비디오가 성공적으로 병합되었습니다.'
 
@@ -199,13 +416,86 @@ def merge_videos_task(self, taker_id, exam_id):
     except Exception as e:
         logging.error(f"merge_videos_task에서 예기치 못한 오류 발생: {str(e)}")
 
-        # 작업 실패 시 재시도
-        try:
-            self.retry(exc=e)
-        except MaxRetriesExceededError:
+        # 작업 실패 시 재시도 (재시도 횟수를 다 쓴 상태에서 retry를 호출하면 원래 예외가 다시 발생하므로 먼저 확인)
+        if self.request.retries >= self.max_retries:
             logging.error(f"작업 {self.request.id}의 최대 재시도 횟수 초과. 오류: {str(e)}")
+            # 더 이상 이어서 올릴 일이 없으므로 남아있는 multipart upload 정리
+            abort_multipart_uploads(get_s3_client(), settings.AWS_STORAGE_BUCKET_NAME, f"{exam_id}/{taker_id}/merged.webm")
             return f"Error: {str(e)}"
-        return f"Error: {str(e)}"
+        raise self.retry(exc=e)
 
     finally:
-        clean_temp_files(temp_files)
+        # 체크포인트 업로드가 끝난 뒤에 작업 디렉터리 삭제
+        if checkpoint_executor is not None:
+            checkpoint_executor.shutdown(wait=True)
+        clean_work_dir(work_dir)
+
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=5 * 60)
+def analyze_video_task(self, taker_id, exam_id, chunk_starts=None):
+    # 병합 영상을 순차로 읽지 않고, 원본 청크별 분석 작업을 chord로 병렬 실행한 뒤 한 번에 저장
+    # chunk_starts: 병합 작업이 계산한 [(청크 key, 병합 영상 기준 시작 위치(초))]
+    try:
+        if chunk_starts is None:
+            chunk_starts = get_chunk_starts(list_webcam_chunks(get_s3_client(), f"{exam_id}/{taker_id}"))
+
+        if not chunk_starts:
+            save_analysis_result_task.delay([], taker_id)
+            return "분석할 유효한 비디오 파일이 없습니다."
+
+        header = group(analyze_chunk_task.s(taker_id, video_file, offset) for video_file, offset in chunk_starts)
+        chord(header)(save_analysis_result_task.s(taker_id))
+
+        return f'{len(chunk_starts)} 개의 청크 분석 작업이 등록되었습니다.'
+
+    except Exception as e:
+        logging.error(f"analyze_video_task에서 예기치 못한 오류 발생: {str(e)}")
+
+        # 작업 실패 시 재시도 (재시도 횟수를 다 쓴 상태에서 retry를 호출하면 원래 예외가 다시 발생하므로 먼저 확인)
+        if self.request.retries >= self.max_retries:
+            logging.error(f"작업 {self.request.id}의 최대 재시도 횟수 초과. 오류: {str(e)}")
+            return f"Error: {str(e)}"
+        raise self.retry(exc=e)
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60, acks_late=True)
+def analyze_chunk_task(self, taker_id, video_file, offset):
+    work_dir = None
+
+    try:
+        s3_client = get_s3_client()
+        work_dir = create_work_dir(taker_id, prefix='analyze')
+        local_video_path = download_chunk(
+            s3_client, video_file, os.path.join(work_dir, os.path.basename(video_file))
+        )
+
+        detection_intervals = detect_intervals(local_video_path, DEFAULT_MODEL_PATH)
+        detection_intervals = {
+            label: merge_intervals(intervals) for label, intervals in detection_intervals.items()
+        }
+        return offset_intervals(detection_intervals, offset)
+
+    except Exception as e:
+        logging.error(f"analyze_chunk_task에서 예기치 못한 오류 발생 {video_file}: {str(e)}")
+
+        # 작업 실패 시 재시도, 재시도 초과 시 빈 결과를 반환해 chord 콜백이 나머지 청크 결과는 저장하도록 함
+        if self.request.retries >= self.max_retries:
+            logging.error(f"작업 {self.request.id}의 최대 재시도 횟수 초과. 오류: {str(e)}")
+            return {}
+        raise self.retry(exc=e)
+
+    finally:
+        clean_work_dir(work_dir)
+
+
+@shared_task
+def save_analysis_result_task(chunk_results, taker_id):
+    detection_intervals = stitch_chunk_intervals(chunk_results)
+    save_abnormal_intervals(detection_intervals, taker_id)
+
+    taker = Taker.objects.filter(id=taker_id).first()
+    taker.stored_state = 'analyzed'
+    taker.save()
+
+    return f'{len(detection_intervals)} 종류의 이상행동 분석이 완료되었습니다.'
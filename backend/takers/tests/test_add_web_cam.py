@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from freezegun import freeze_time
 from rest_framework.test import APITestCase
+from unittest.mock import patch, MagicMock
 from datetime import timedelta
 from django.utils import timezone
 from datetime import datetime
@@ -136,4 +137,105 @@ class AddWebCamTestCase(APITestCase):
 
         # Then
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(response.data['message'], '시작 시간이 종료 시간보다 클 수 없습니다.')
\ No newline at end of file
+        self.assertEqual(response.data['message'], '시작 시간이 종료 시간보다 클 수 없습니다.')
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.prepare_chunk_task')
+    @patch('takers.upload_handlers.get_s3_client')
+    @patch('takers.views.get_s3_client')
+    def test_add_web_cam_streaming_upload(self, mock_views_s3_client, mock_handler_s3_client, mock_prepare_chunk_task):
+        '''
+        스트리밍 업로드 - part 크기 단위로 S3 multipart upload 후 최종 경로로 복사 - 200
+        '''
+        # Given
+        s3_client = MagicMock()
+        s3_client.create_multipart_upload.return_value = {'UploadId': 'upload-id'}
+        s3_client.upload_part.return_value = {'ETag': '"etag"'}
+        mock_views_s3_client.return_value = s3_client
+        mock_handler_s3_client.return_value = s3_client
+
+        part_size = 5 * 1024 * 1024
+        video = SimpleUploadedFile("video.webm", b'\x00' * (part_size * 2 + 1024), content_type='video/webm')
+        data = {
+            'web_cam': video,
+            'start_time': '12:50:00',
+            'end_time': '12:50:10'
+        }
+
+        # When
+        with self.settings(S3_STREAMING_UPLOAD=True, S3_STREAMING_UPLOAD_PART_SIZE=part_size):
+            response = self.client.post(self.url, data, format='multipart', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        part_bodies = [kwargs['Body'] for _, kwargs in s3_client.upload_part.call_args_list]
+        self.assertGreaterEqual(len(part_bodies), 2)
+        self.assertEqual(sum(len(body) for body in part_bodies), part_size * 2 + 1024)
+        # 요청당 버퍼는 part 하나 크기(+ 읽기 단위)를 넘지 않음
+        for body in part_bodies:
+            self.assertLess(len(body), part_size + 64 * 1024)
+        s3_client.complete_multipart_upload.assert_called_once()
+        s3_client.upload_fileobj.assert_not_called()
+
+        temp_key = s3_client.create_multipart_upload.call_args.kwargs['Key']
+        self.assertTrue(temp_key.startswith(f"{self.exam.id}/{self.taker.id}/uploads/"))
+        copy_kwargs = s3_client.copy_object.call_args.kwargs
+        self.assertEqual(copy_kwargs['Key'], f"{self.exam.id}/{self.taker.id}/webcam_125000_125010.webm")
+        self.assertEqual(copy_kwargs['CopySource']['Key'], temp_key)
+        s3_client.delete_object.assert_called_once_with(Bucket=copy_kwargs['Bucket'], Key=temp_key)
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.upload_handlers.get_s3_client')
+    @patch('takers.views.get_s3_client')
+    def test_add_web_cam_streaming_upload_invalid_time(self, mock_views_s3_client, mock_handler_s3_client):
+        '''
+        스트리밍 업로드 후 요청이 잘못된 경우 임시 파일 삭제 - 400
+        '''
+        # Given
+        s3_client = MagicMock()
+        mock_views_s3_client.return_value = s3_client
+        mock_handler_s3_client.return_value = s3_client
+        data = {
+            'web_cam': self.create_dummy_video(),
+            'start_time': '14:30',
+            'end_time': '13:30'
+        }
+
+        # When
+        with self.settings(S3_STREAMING_UPLOAD=True):
+            response = self.client.post(self.url, data, format='multipart', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        temp_key = s3_client.put_object.call_args.kwargs['Key']
+        s3_client.delete_object.assert_called_once_with(Bucket=s3_client.put_object.call_args.kwargs['Bucket'], Key=temp_key)
+        s3_client.copy_object.assert_not_called()
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.prepare_chunk_task')
+    @patch('takers.upload_handlers.get_s3_client')
+    @patch('takers.views.get_s3_client')
+    def test_add_web_cam_streaming_upload_s3_failure(self, mock_views_s3_client, mock_handler_s3_client, mock_prepare_chunk_task):
+        '''
+        스트리밍 업로드 중 S3 전송 실패 - 500
+        '''
+        # Given
+        s3_client = MagicMock()
+        s3_client.put_object.side_effect = Exception('connection reset')
+        mock_views_s3_client.return_value = s3_client
+        mock_handler_s3_client.return_value = s3_client
+        data = {
+            'web_cam': self.create_dummy_video(),
+            'start_time': '12:50:00',
+            'end_time': '12:50:10'
+        }
+
+        # When
+        with self.settings(S3_STREAMING_UPLOAD=True):
+            response = self.client.post(self.url, data, format='multipart', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.data['message'], 'S3 업로드 실패: connection reset')
+        s3_client.copy_object.assert_not_called()
+        mock_prepare_chunk_task.delay.assert_not_called()
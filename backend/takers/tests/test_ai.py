@@ -0,0 +1,107 @@
+import types
+from unittest.mock import patch
+from django.test import SimpleTestCase
+
+from takers.ai import detect_intervals, get_model, get_model_stats
+
+VIDEO_FPS = 30
+VIDEO_SECONDS = 3
+
+
+class FakeVideoCapture:
+    # 30fps 영상을 흉내내며 grab/retrieve된 프레임 번호를 기록
+    def __init__(self, video_path):
+        self.frame_count = VIDEO_FPS * VIDEO_SECONDS
+        self.position = -1
+        self.grabbed = []
+        self.retrieved = []
+        FakeVideoCapture.instance = self
+
+    def isOpened(self):
+        return True
+
+    def grab(self):
+        if self.position + 1 >= self.frame_count:
+            return False
+        self.position += 1
+        self.grabbed.append(self.position)
+        return True
+
+    def get(self, prop):
+        return self.position * 1000 / VIDEO_FPS
+
+    def retrieve(self):
+        self.retrieved.append(self.position)
+        return True, self.position
+
+    def release(self):
+        pass
+
+
+class FakeModel:
+    # 호출마다 배치 크기를 기록하고 모든 프레임에서 'pen'을 감지한 것으로 반환
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, frames, conf, verbose):
+        self.batches.append(list(frames))
+        box = types.SimpleNamespace(cls=0)
+        return [types.SimpleNamespace(boxes=[box], names={0: 'pen'}) for _ in frames]
+
+
+class DetectIntervalsTestCase(SimpleTestCase):
+    def test_detect_intervals_sampling_and_batching(self):
+        '''
+        초당 sample_fps장만 retrieve하고 나머지 프레임은 grab만 하며, batch_size 단위로 모델을 호출
+        '''
+        # Given
+        fake_cv2 = types.SimpleNamespace(VideoCapture=FakeVideoCapture, CAP_PROP_POS_MSEC=0)
+        model = FakeModel()
+
+        # When
+        with patch.dict('sys.modules', {'cv2': fake_cv2}), patch('takers.ai.get_model', return_value=model):
+            detection_intervals = detect_intervals('video.webm', 'model.pt', sample_fps=2, batch_size=4)
+
+        # Then
+        capture = FakeVideoCapture.instance
+        self.assertEqual(len(capture.grabbed), VIDEO_FPS * VIDEO_SECONDS)
+        self.assertEqual(capture.retrieved, [0, 15, 30, 45, 60, 75])
+        self.assertEqual([len(batch) for batch in model.batches], [4, 2])
+        self.assertEqual([frame for batch in model.batches for frame in batch], capture.retrieved)
+        self.assertEqual(detection_intervals, {'pen': [{'start': 0, 'end': 2}]})
+
+
+class ModelCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        # 다른 테스트와 캐시/통계를 공유하지 않도록 비운 상태에서 시작하고 종료 후 복원
+        patcher = patch.multiple('takers.ai', _model_cache={}, _model_stats={'loads': 0, 'load_seconds': 0.0, 'hits': 0})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_model_cached_per_process(self):
+        '''
+        같은 경로의 모델은 한 번만 로드하고 이후 호출은 캐시된 인스턴스를 반환하며 통계를 갱신
+        '''
+        # Given
+        loaded_paths = []
+
+        def load_model(model_path):
+            loaded_paths.append(model_path)
+            return object()
+
+        fake_ultralytics = types.SimpleNamespace(YOLO=load_model)
+
+        # When
+        with patch.dict('sys.modules', {'ultralytics': fake_ultralytics}):
+            first = get_model('model_a.pt')
+            second = get_model('model_a.pt')
+            other = get_model('model_b.pt')
+
+        # Then
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(loaded_paths, ['model_a.pt', 'model_b.pt'])
+        stats = get_model_stats()
+        self.assertEqual(stats['loads'], 2)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['cached_models'], 2)
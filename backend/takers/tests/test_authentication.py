@@ -0,0 +1,99 @@
+import jwt
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework import status
+from datetime import timedelta
+from django.utils import timezone
+from datetime import datetime
+from exams.models import Exam
+from takers.models import Taker
+from takers.serializers import TakerTokenSerializer
+from accounts.tokens import clear_token_cache
+
+User = get_user_model()
+
+class TakerAuthenticationCacheTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='takerauth1@example.com',
+            password='password',
+            name='Test User',
+            birth='2000-01-01',
+            policy=True,
+            marketing=True
+        )
+
+        start_time = timezone.now()
+
+        self.exam = Exam.objects.create(
+            user=self.user,
+            title="Taker Auth",
+            date=datetime.today(),
+            entry_time=start_time - timedelta(minutes=30),
+            start_time=start_time.time(),
+            exit_time=start_time.time(),
+            end_time=(timezone.now() + timedelta(hours=2)).time(),
+            url="https://example.com",
+            expected_taker=10,
+            cost=10
+        )
+
+        self.taker = Taker.objects.create(
+            name="Test Taker",
+            exam=self.exam,
+            email="taker@example.com",
+        )
+        self.token = str(TakerTokenSerializer.get_access_token(self.taker))
+        self.url = '/api/taker/webcam/upload/'
+        clear_token_cache()
+
+    def test_cached_taker_invalidated_on_delete(self):
+        '''
+        캐시된 응시자가 삭제되면 다음 요청은 401
+        '''
+        # Given
+        data = {'start_time': '14:30:00', 'end_time': '13:30:00'}
+        response = self.client.post(self.url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.taker.delete()
+
+        # When
+        response = self.client.post(self.url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+    def test_token_decoded_once_for_repeated_requests(self):
+        '''
+        같은 토큰으로 반복 요청하면 서명 검증/디코딩은 한 번만 수행
+        '''
+        # Given
+        data = {'start_time': '14:30:00', 'end_time': '13:30:00'}
+
+        # When
+        with patch('accounts.tokens.jwt.decode', wraps=jwt.decode) as mock_decode:
+            for _ in range(3):
+                response = self.client.post(self.url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # Then
+        self.assertEqual(mock_decode.call_count, 1)
+
+    def test_refresh_token_rejected(self):
+        '''
+        access 타입이 아닌 토큰으로 요청하면 401
+        '''
+        # Given
+        token = RefreshToken.for_user(self.taker)
+        token['role'] = 'taker'
+        data = {'start_time': '14:30:00', 'end_time': '13:30:00'}
+
+        # When
+        response = self.client.post(self.url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json().get('message'), '유효하지 않은 토큰입니다.')
@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import subprocess
+import unittest
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# 웹 프로세스와 병합 워커가 import하면 안 되는 추론 전용 모듈
+HEAVY_MODULES = ['cv2', 'numpy', 'torch', 'ultralytics']
+
+# import 시간/메모리 측정은 실행 환경에 따라 달라지므로 WEB_IMPORT_BENCHMARK=1로 실행할 때만 확인
+WEB_IMPORT_BENCHMARK = os.environ.get('WEB_IMPORT_BENCHMARK') == '1'
+WEB_IMPORT_TIME_BUDGET_SECONDS = 5
+WEB_IMPORT_RSS_BUDGET_MB = 300
+
+IMPORT_SCRIPT = '''
+import sys, json, time, resource
+started_at = time.perf_counter()
+import django
+django.setup()
+import %s
+elapsed = time.perf_counter() - started_at
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({
+    'elapsed': elapsed,
+    'rss_mb': rss_mb,
+    'loaded': [name for name in %r if name in sys.modules],
+}))
+'''
+
+
+class WebImportTestCase(SimpleTestCase):
+    def run_import(self, module_name):
+        # 다른 테스트가 이미 import한 모듈의 영향을 받지 않도록 새 프로세스에서 확인
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE,
+            'PYTHONPATH': os.pathsep.join(sys.path),
+        }
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_SCRIPT % (module_name, HEAVY_MODULES)],
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def test_tasks_import_does_not_load_ml_stack(self):
+        '''
+        takers.tasks import 시 cv2/numpy/torch/ultralytics를 불러오지 않음
+        '''
+        # When
+        result = self.run_import('takers.tasks')
+
+        # Then
+        self.assertEqual(result['loaded'], [])
+
+    def test_web_import_does_not_load_ml_stack(self):
+        '''
+        URLconf(모든 views 포함) import 시 cv2/numpy/torch/ultralytics를 불러오지 않음
+        '''
+        # When
+        result = self.run_import('proctormatic.urls')
+
+        # Then
+        self.assertEqual(result['loaded'], [])
+
+    @unittest.skipUnless(WEB_IMPORT_BENCHMARK, 'WEB_IMPORT_BENCHMARK=1일 때만 실행')
+    def test_web_import_time_and_memory_budget(self):
+        '''
+        URLconf import 시간과 최대 메모리가 상한 이내
+        '''
+        # When
+        result = self.run_import('proctormatic.urls')
+
+        # Then
+        self.assertLess(result['elapsed'], WEB_IMPORT_TIME_BUDGET_SECONDS)
+        self.assertLess(result['rss_mb'], WEB_IMPORT_RSS_BUDGET_MB)
@@ -0,0 +1,266 @@
+import os
+import base64
+import shutil
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from unittest.mock import patch
+from django.test import SimpleTestCase, override_settings
+
+from takers.storage import upload_file, abort_multipart_uploads
+from takers.tasks import merge_videos_task
+
+PART_SIZE = 5 * 1024 * 1024
+BUCKET = 'bucket'
+KEY = '1/1/merged.webm'
+
+
+class StubPaginator:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate(self, **kwargs):
+        return iter(self.pages(**kwargs))
+
+
+class StubMultipartS3Client:
+    # multipart upload 상태를 메모리에 보관하고, S3처럼 Content-MD5를 검증하는 클라이언트
+    def __init__(self, corrupt_etag=False):
+        self.corrupt_etag = corrupt_etag
+        self.uploads = {}
+        self.objects = {}
+        self.uploaded_part_numbers = []
+        self.aborted = []
+        self.copied = []
+        self.lock = threading.Lock()
+
+    def start_upload(self, key, parts=None, **extra_args):
+        upload_id = f'upload-{len(self.uploads) + 1}'
+        self.uploads[upload_id] = {
+            'Key': key,
+            'Initiated': datetime(2024, 1, 1, len(self.uploads)),
+            'Parts': dict(parts or {}),
+            'Args': extra_args,
+        }
+        return upload_id
+
+    def get_paginator(self, operation_name):
+        if operation_name == 'list_multipart_uploads':
+            return StubPaginator(lambda Bucket, Prefix: [{'Uploads': [
+                {'Key': upload['Key'], 'UploadId': upload_id, 'Initiated': upload['Initiated']}
+                for upload_id, upload in self.uploads.items()
+                if upload['Key'].startswith(Prefix)
+            ]}])
+        return StubPaginator(lambda Bucket, Key, UploadId: [{'Parts': [
+            {'PartNumber': part_number, 'ETag': f'"{etag}"'}
+            for part_number, etag in self.uploads[UploadId]['Parts'].items()
+        ]}])
+
+    def check_md5(self, body, content_md5):
+        if base64.b64encode(hashlib.md5(body).digest()).decode() != content_md5:
+            raise Exception('BadDigest')
+        return '0' * 32 if self.corrupt_etag else hashlib.md5(body).hexdigest()
+
+    def put_object(self, Bucket, Key, Body, ContentMD5, **extra_args):
+        etag = self.check_md5(Body, ContentMD5)
+        self.objects[Key] = {'ETag': f'"{etag}"', **extra_args}
+        return {'ETag': f'"{etag}"'}
+
+    def create_multipart_upload(self, Bucket, Key, **extra_args):
+        return {'UploadId': self.start_upload(Key, **extra_args)}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, ContentMD5):
+        etag = self.check_md5(Body, ContentMD5)
+        with self.lock:
+            self.uploaded_part_numbers.append(PartNumber)
+            self.uploads[UploadId]['Parts'][PartNumber] = etag
+        return {'ETag': f'"{etag}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        upload = self.uploads.pop(UploadId)
+        parts = MultipartUpload['Parts']
+        etag = f"{hashlib.md5(b''.join(bytes.fromhex(part['ETag']) for part in parts)).hexdigest()}-{len(parts)}"
+        self.objects[Key] = {'ETag': f'"{etag}"', **upload['Args']}
+        return {'ETag': f'"{etag}"'}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+        self.uploads.pop(UploadId)
+
+    def head_object(self, Bucket, Key):
+        return self.objects[Key]
+
+    def copy(self, CopySource, Bucket, Key, ExtraArgs):
+        self.copied.append(Key)
+        extra_args = {name: value for name, value in ExtraArgs.items() if name != 'MetadataDirective'}
+        self.objects[Key] = {'ETag': '"copied-1"', **extra_args}
+
+
+@override_settings(S3_UPLOAD_PART_SIZE=PART_SIZE, S3_UPLOAD_CONCURRENCY=2, S3_UPLOAD_MAX_BANDWIDTH=0)
+class UploadFileTestCase(SimpleTestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.extra_args = {'ContentType': 'video/webm', 'Metadata': {'inputs-fingerprint': 'new'}}
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def create_file(self, size):
+        file_path = os.path.join(self.work_dir, 'merged.webm')
+        with open(file_path, 'wb') as f:
+            f.write(os.urandom(size))
+        return file_path
+
+    def part_md5(self, file_path, part_number):
+        with open(file_path, 'rb') as f:
+            f.seek((part_number - 1) * PART_SIZE)
+            return hashlib.md5(f.read(PART_SIZE)).hexdigest()
+
+    def test_upload_file_single_part(self):
+        '''
+        part 크기 이하의 파일은 Content-MD5를 붙여 한 번에 업로드
+        '''
+        # Given
+        s3_client = StubMultipartS3Client()
+        file_path = self.create_file(1024)
+
+        # When
+        etag = upload_file(s3_client, file_path, BUCKET, KEY, extra_args=self.extra_args)
+
+        # Then
+        self.assertEqual(etag.strip('"'), self.part_md5(file_path, 1))
+        self.assertEqual(s3_client.objects[KEY]['Metadata'], {'inputs-fingerprint': 'new'})
+        self.assertEqual(s3_client.uploads, {})
+
+    def test_upload_file_multipart(self):
+        '''
+        part마다 Content-MD5를 붙여 업로드하고, 완료된 객체의 ETag를 part MD5로 검증
+        '''
+        # Given
+        s3_client = StubMultipartS3Client()
+        file_path = self.create_file(2 * PART_SIZE + 1024)
+
+        # When
+        upload_file(s3_client, file_path, BUCKET, KEY, extra_args=self.extra_args)
+
+        # Then
+        self.assertEqual(sorted(s3_client.uploaded_part_numbers), [1, 2, 3])
+        self.assertTrue(s3_client.objects[KEY]['ETag'].endswith('-3"'))
+        self.assertEqual(s3_client.objects[KEY]['Metadata'], {'inputs-fingerprint': 'new'})
+        self.assertEqual(s3_client.copied, [])
+
+    def test_upload_file_resume(self):
+        '''
+        이전 시도의 multipart upload를 이어서 사용하고, 같은 내용으로 올라간 part는 다시 보내지 않음
+        '''
+        # Given
+        s3_client = StubMultipartS3Client()
+        file_path = self.create_file(2 * PART_SIZE + 1024)
+        s3_client.start_upload(
+            KEY,
+            parts={1: self.part_md5(file_path, 1), 2: 'stale'},
+            **self.extra_args
+        )
+
+        # When
+        upload_file(s3_client, file_path, BUCKET, KEY, extra_args=self.extra_args)
+
+        # Then
+        self.assertEqual(sorted(s3_client.uploaded_part_numbers), [2, 3])
+        self.assertEqual(s3_client.uploads, {})
+        self.assertEqual(s3_client.copied, [])
+
+    def test_upload_file_resume_replaces_stale_metadata(self):
+        '''
+        첫 시도와 다른 메타데이터로 이어서 업로드하면 완료 후 이번 시도의 메타데이터로 교체
+        '''
+        # Given
+        s3_client = StubMultipartS3Client()
+        file_path = self.create_file(2 * PART_SIZE + 1024)
+        s3_client.start_upload(KEY, ContentType='video/webm', Metadata={'inputs-fingerprint': 'old'})
+
+        # When
+        upload_file(s3_client, file_path, BUCKET, KEY, extra_args=self.extra_args)
+
+        # Then
+        self.assertEqual(s3_client.copied, [KEY])
+        self.assertEqual(s3_client.objects[KEY]['Metadata'], {'inputs-fingerprint': 'new'})
+
+    def test_upload_file_etag_mismatch(self):
+        '''
+        응답 ETag가 보낸 part의 MD5와 다르면 업로드 실패
+        '''
+        # Given
+        s3_client = StubMultipartS3Client(corrupt_etag=True)
+        file_path = self.create_file(2 * PART_SIZE + 1024)
+
+        # When / Then
+        with self.assertRaisesMessage(Exception, '업로드 무결성 검증 실패'):
+            upload_file(s3_client, file_path, BUCKET, KEY, extra_args=self.extra_args)
+
+    @override_settings(S3_UPLOAD_VERIFY_ETAG=False)
+    def test_upload_file_etag_verification_disabled(self):
+        '''
+        ETag 검증을 끄면 ETag가 달라도 업로드 완료
+        '''
+        # Given
+        s3_client = StubMultipartS3Client(corrupt_etag=True)
+        file_path = self.create_file(1024)
+
+        # When
+        upload_file(s3_client, file_path, BUCKET, KEY, extra_args=self.extra_args)
+
+        # Then
+        self.assertIn(KEY, s3_client.objects)
+
+    def test_abort_multipart_uploads(self):
+        '''
+        같은 key의 multipart upload만 모두 취소
+        '''
+        # Given
+        s3_client = StubMultipartS3Client()
+        first_upload = s3_client.start_upload(KEY)
+        second_upload = s3_client.start_upload(KEY)
+        other_upload = s3_client.start_upload(f'{KEY}.bak')
+
+        # When
+        abort_multipart_uploads(s3_client, BUCKET, KEY)
+
+        # Then
+        self.assertEqual(s3_client.aborted, [first_upload, second_upload])
+        self.assertEqual(list(s3_client.uploads), [other_upload])
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME=BUCKET)
+class MergeVideosTaskTestCase(SimpleTestCase):
+    @patch('takers.tasks.abort_multipart_uploads')
+    @patch('takers.tasks.list_webcam_chunk_objects', side_effect=RuntimeError('list failed'))
+    @patch('takers.tasks.get_s3_client')
+    def test_merge_videos_max_retries_exceeded(self, mock_s3_client, mock_list, mock_abort):
+        '''
+        재시도 횟수를 다 쓰면 남아있는 multipart upload를 취소하고 오류 메시지를 반환
+        '''
+        # When
+        result = merge_videos_task.apply(args=(1, 1), retries=merge_videos_task.max_retries)
+
+        # Then
+        self.assertTrue(result.successful())
+        self.assertEqual(result.get(), 'Error: list failed')
+        mock_abort.assert_called_once_with(mock_s3_client.return_value, BUCKET, KEY)
+
+    @patch('takers.tasks.abort_multipart_uploads')
+    @patch('takers.tasks.list_webcam_chunk_objects', side_effect=RuntimeError('list failed'))
+    @patch('takers.tasks.get_s3_client')
+    def test_merge_videos_retry_keeps_upload(self, mock_s3_client, mock_list, mock_abort):
+        '''
+        재시도가 남아있으면 multipart upload를 남겨두고 재시도
+        '''
+        # When
+        with patch.object(merge_videos_task, 'retry', side_effect=RuntimeError('retry')) as mock_retry:
+            with self.assertRaisesMessage(RuntimeError, 'retry'):
+                merge_videos_task(1, 1)
+
+        # Then
+        mock_retry.assert_called_once()
+        mock_abort.assert_not_called()
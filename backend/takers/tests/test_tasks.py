@@ -0,0 +1,564 @@
+import types
+import shutil
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from exams.models import Exam
+from proctormatic.celery import app
+from takers.models import Taker, Abnormal
+from takers.tasks import prefetch_chunks, parse_chunk_times, list_webcam_chunks, analyze_video_task, \
+    analyze_chunk_task, prepare_chunk_task, merge_videos_task, save_analysis_result_task, get_inputs_fingerprint, \
+    get_chunk_starts, warm_up_model_on_worker_init, warm_up_model_on_worker_process_init
+
+User = get_user_model()
+
+
+class StubS3Client:
+    # 다운로드 요청한 key를 기록하고, failing_keys에 포함된 key는 실패시키는 S3 클라이언트
+    def __init__(self, failing_keys=()):
+        self.failing_keys = set(failing_keys)
+        self.downloaded = []
+        self.lock = threading.Lock()
+
+    def download_file(self, Bucket, Key, Filename):
+        with self.lock:
+            self.downloaded.append(Key)
+        if Key in self.failing_keys:
+            raise RuntimeError(f'download failed: {Key}')
+        with open(Filename, 'wb') as f:
+            f.write(Key.encode())
+
+    def head_object(self, Bucket, Key):
+        return {'ETag': '"etag"'}
+
+
+class StubPaginator:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate(self, **kwargs):
+        return iter(self.pages)
+
+
+class StubListS3Client:
+    # list_objects_v2 결과를 페이지 단위로 돌려주는 S3 클라이언트
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get_paginator(self, operation_name):
+        return StubPaginator(self.pages)
+
+
+class StubChunkS3Client(StubS3Client, StubListS3Client):
+    # 청크 목록 조회와 다운로드를 모두 흉내내는 S3 클라이언트
+    def __init__(self, pages, failing_keys=()):
+        StubS3Client.__init__(self, failing_keys)
+        StubListS3Client.__init__(self, pages)
+
+
+class StubPrefixPaginator:
+    def __init__(self, s3_client):
+        self.s3_client = s3_client
+
+    def paginate(self, Bucket, Prefix):
+        return iter([{'Contents': [
+            {'Key': key, 'ETag': etag} for key, etag in self.s3_client.objects.items() if key.startswith(Prefix)
+        ]}])
+
+
+class StubMergeS3Client(StubS3Client):
+    # 버킷의 객체 목록(key: ETag)과 병합 영상의 메타데이터를 흉내내는 S3 클라이언트
+    def __init__(self, objects, merged_fingerprint=None):
+        super().__init__()
+        self.objects = dict(objects)
+        self.merged_fingerprint = merged_fingerprint
+        self.uploaded = []
+
+    def get_paginator(self, operation_name):
+        return StubPrefixPaginator(self)
+
+    def head_object(self, Bucket, Key):
+        if Key in self.objects:
+            return {'ETag': self.objects[Key]}
+        if self.merged_fingerprint is None:
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+        return {'Metadata': {'inputs-fingerprint': self.merged_fingerprint}}
+
+    def upload_file(self, Filename, Bucket, Key):
+        with self.lock:
+            self.uploaded.append(Key)
+
+
+class ChunkOrderTestCase(SimpleTestCase):
+    def test_parse_chunk_times(self):
+        '''
+        파일명의 HHMMSS 시각을 자정 기준 초로 변환
+        '''
+        self.assertEqual(parse_chunk_times('1/1/webcam_093050_093110.webm'), (34250, 34270))
+        self.assertEqual(parse_chunk_times('webcam_000000_235959.mp4'), (0, 86399))
+        for video_file in ['1/1/webcam_abc_093110.webm', '1/1/webcam_9305_093110.webm', '1/1/webcam_093060_093110.webm']:
+            with self.subTest(video_file=video_file), self.assertRaises(ValueError):
+                parse_chunk_times(video_file)
+
+    def test_chunk_gap_across_minute_boundary(self):
+        '''
+        분/시 경계를 넘는 청크 사이 간격을 HHMMSS 숫자 차이가 아닌 실제 초 차이로 계산
+        '''
+        # Given
+        _, first_end_time = parse_chunk_times('1/1/webcam_093040_093050.webm')
+        next_start_time, _ = parse_chunk_times('1/1/webcam_093110_093120.webm')
+        _, hour_end_time = parse_chunk_times('1/1/webcam_095950_100000.webm')
+        hour_start_time, _ = parse_chunk_times('1/1/webcam_100005_100015.webm')
+
+        # Then
+        self.assertEqual(next_start_time - first_end_time, 20)
+        self.assertEqual(hour_start_time - hour_end_time, 5)
+
+    def test_get_chunk_starts(self):
+        '''
+        병합 결과가 없을 때 첫 청크 시작 시각 기준 초 단위 차이로 병합 영상 기준 위치를 추정
+        '''
+        # Given
+        video_files = ['1/1/webcam_093050_093110.webm', '1/1/webcam_093130_093150.webm', '1/1/webcam_100000_100010.webm']
+
+        # When
+        chunk_starts = get_chunk_starts(video_files)
+
+        # Then
+        self.assertEqual(chunk_starts, list(zip(video_files, [0, 40, 1750])))
+        self.assertEqual(get_chunk_starts([]), [])
+
+    def test_list_webcam_chunks_numeric_order(self):
+        '''
+        시작 시각 순서로 정렬하고, 형식이 다른 파일은 제외
+        '''
+        # Given
+        s3_client = StubListS3Client([
+            {'Contents': [{'Key': '1/1/webcam_100000_100010.webm'}, {'Key': '1/1/webcam_093110_093120.webm'}]},
+            {'Contents': [
+                {'Key': '1/1/webcam_093050_093110.webm'},
+                {'Key': '1/1/webcam_095950_100000.webm'},
+                {'Key': '1/1/webcam_invalid.webm'},
+                {'Key': '1/1/webcam_99_100.webm'},
+                {'Key': '1/1/merged.webm'},
+            ]},
+        ])
+
+        # When
+        video_files = list_webcam_chunks(s3_client, '1/1')
+
+        # Then
+        self.assertEqual(video_files, [
+            '1/1/webcam_093050_093110.webm',
+            '1/1/webcam_093110_093120.webm',
+            '1/1/webcam_095950_100000.webm',
+            '1/1/webcam_100000_100010.webm',
+        ])
+
+
+def create_worker(queues, pool_cls):
+    # -Q로 지정한 큐와 풀 종류만 흉내낸 celery 워커
+    queues = types.SimpleNamespace(consume_from={queue: object() for queue in queues})
+    return types.SimpleNamespace(app=types.SimpleNamespace(amqp=types.SimpleNamespace(queues=queues)), pool_cls=pool_cls)
+
+
+@override_settings(AI_WARM_UP_ON_WORKER_BOOT=True, AI_ANALYSIS_QUEUE='analysis')
+@patch('takers.tasks.warm_up_model')
+class WarmUpModelTestCase(SimpleTestCase):
+    def setUp(self):
+        patcher = patch('takers.tasks._warm_up_on_boot', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def boot(self, worker, processes=0):
+        warm_up_model_on_worker_init(sender=worker)
+        for _ in range(processes):
+            warm_up_model_on_worker_process_init()
+
+    def test_warm_up_analysis_worker_prefork(self, mock_warm_up):
+        '''
+        분석 큐를 소비하는 prefork 워커는 자식 프로세스마다 모델을 로드
+        '''
+        # When
+        self.boot(create_worker(['analysis'], 'celery.concurrency.prefork:TaskPool'), processes=2)
+
+        # Then
+        self.assertEqual(mock_warm_up.call_count, 2)
+
+    def test_warm_up_analysis_worker_solo(self, mock_warm_up):
+        '''
+        분석 큐를 소비하는 단일 프로세스 워커는 워커 시작 시 한 번만 모델을 로드
+        '''
+        # When
+        self.boot(create_worker(['analysis'], 'celery.concurrency.solo:TaskPool'))
+
+        # Then
+        mock_warm_up.assert_called_once_with()
+
+    def test_skip_warm_up_merge_worker(self, mock_warm_up):
+        '''
+        분석 큐를 소비하지 않는 병합 워커는 모델을 로드하지 않음
+        '''
+        # When
+        self.boot(create_worker(['celery'], 'celery.concurrency.eventlet:TaskPool'))
+        self.boot(create_worker(['celery'], 'celery.concurrency.prefork:TaskPool'), processes=2)
+
+        # Then
+        mock_warm_up.assert_not_called()
+
+    @override_settings(AI_WARM_UP_ON_WORKER_BOOT=False)
+    def test_skip_warm_up_disabled(self, mock_warm_up):
+        '''
+        워밍업 설정을 끄면 분석 워커도 모델을 로드하지 않음
+        '''
+        # When
+        self.boot(create_worker(['analysis'], 'celery.concurrency.prefork:TaskPool'), processes=2)
+
+        # Then
+        mock_warm_up.assert_not_called()
+
+
+@override_settings(VIDEO_MERGE_DOWNLOAD_WORKERS=2, VIDEO_MERGE_PREFETCH_DEPTH=2)
+class PrefetchChunksTestCase(SimpleTestCase):
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.video_files = [f'1/1/webcam_0930{start:02d}_0930{start + 10:02d}.webm' for start in range(0, 50, 10)]
+        self.chunk_objects = [{'Key': video_file, 'ETag': f'"etag-{index}"'} for index, video_file in enumerate(self.video_files)]
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def test_prefetch_chunks(self):
+        '''
+        청크 순서대로 반환하고, 현재 원본 ETag로 정규화된 구간이 있는 청크만 normalized/ 경로에서 받으며, 다운로드 실패는 해당 청크의 result()에서만 발생
+        '''
+        # Given
+        s3_client = StubS3Client(failing_keys={'1/1/webcam_093020_093030.webm'})
+        normalized_keys = {
+            '1/1/normalized/webcam_093010_093020.etag-1.webm',
+            # 원본이 다시 업로드되기 전의 ETag로 만든 구간
+            '1/1/normalized/webcam_093030_093040.etag-old.webm',
+        }
+
+        # When
+        results = []
+        for video_file, future, normalized in prefetch_chunks(s3_client, self.chunk_objects, self.work_dir, normalized_keys):
+            try:
+                results.append((video_file, normalized, open(future.result(), 'rb').read().decode()))
+            except RuntimeError as e:
+                results.append((video_file, normalized, str(e)))
+
+        # Then
+        self.assertEqual([video_file for video_file, _, _ in results], self.video_files)
+        self.assertEqual(results[1], ('1/1/webcam_093010_093020.webm', True, '1/1/normalized/webcam_093010_093020.etag-1.webm'))
+        self.assertEqual(results[2], ('1/1/webcam_093020_093030.webm', False, 'download failed: 1/1/webcam_093020_093030.webm'))
+        self.assertEqual(results[3], ('1/1/webcam_093030_093040.webm', False, '1/1/webcam_093030_093040.webm'))
+        self.assertEqual(results[4], ('1/1/webcam_093040_093050.webm', False, '1/1/webcam_093040_093050.webm'))
+        self.assertNotIn('1/1/webcam_093010_093020.webm', s3_client.downloaded)
+
+    def test_prefetch_chunks_stopped_early(self):
+        '''
+        순회를 중간에 멈추면 prefetch 깊이를 넘는 청크는 다운로드하지 않음
+        '''
+        # Given
+        s3_client = StubS3Client()
+
+        # When
+        chunks = prefetch_chunks(s3_client, self.chunk_objects, self.work_dir)
+        video_file, future, _ = next(chunks)
+        future.result()
+        chunks.close()
+
+        # Then
+        self.assertEqual(video_file, self.video_files[0])
+        self.assertLessEqual(len(s3_client.downloaded), 3)
+        self.assertNotIn(self.video_files[-1], s3_client.downloaded)
+
+
+def create_taker():
+    user = User.objects.create_user(
+        email='testuser@example.com',
+        password='password',
+        name='Test User',
+        birth='2000-01-01',
+        policy=True,
+        marketing=True
+    )
+
+    test_time = timezone.now()
+
+    exam = Exam.objects.create(
+        user=user,
+        title="Test Analysis Exam",
+        date=datetime.today(),
+        entry_time=test_time - timedelta(minutes=30),
+        start_time=test_time.time(),
+        exit_time=test_time + timedelta(minutes=30),
+        end_time=(test_time + timedelta(hours=2)).time(),
+        url="https://example.com",
+        expected_taker=10,
+        cost=10
+    )
+
+    return Taker.objects.create(
+        name="Test Taker",
+        exam=exam,
+        email="taker@example.com",
+    )
+
+
+class AnalyzeChunkTaskTestCase(TestCase):
+    def setUp(self):
+        self.taker = create_taker()
+        self.exam = self.taker.exam
+
+        folder_path = f'{self.exam.id}/{self.taker.id}'
+        self.failing_key = f'{folder_path}/webcam_093010_093020.webm'
+        self.s3_client = StubChunkS3Client(
+            [{'Contents': [
+                {'Key': f'{folder_path}/webcam_093000_093010.webm'},
+                {'Key': self.failing_key},
+                {'Key': f'{folder_path}/webcam_093020_093030.webm'},
+            ]}],
+            failing_keys={self.failing_key}
+        )
+
+        # chord를 브로커 없이 현재 프로세스에서 실행
+        # (celery 설정은 CELERY_ namespace로 읽으므로 같은 이름으로 덮어씀)
+        self.addCleanup(app.conf.update, CELERY_TASK_ALWAYS_EAGER=app.conf.task_always_eager)
+        app.conf.update(CELERY_TASK_ALWAYS_EAGER=True)
+
+    @patch('takers.tasks.detect_intervals', return_value={'pen': [{'start': 1, 'end': 3}]})
+    def test_analyze_chunk_max_retries_exceeded(self, mock_detect):
+        '''
+        재시도 횟수를 다 쓴 청크는 예외 대신 빈 결과를 반환
+        '''
+        # When
+        with patch('takers.tasks.get_s3_client', return_value=self.s3_client):
+            result = analyze_chunk_task.apply(
+                args=(self.taker.id, self.failing_key, 10),
+                retries=analyze_chunk_task.max_retries
+            )
+
+        # Then
+        self.assertTrue(result.successful())
+        self.assertEqual(result.get(), {})
+        mock_detect.assert_not_called()
+
+    @patch('takers.tasks.detect_intervals', return_value={'pen': [{'start': 1, 'end': 3}]})
+    def test_analyze_video_saves_other_chunks_when_chunk_fails(self, mock_detect):
+        '''
+        한 청크가 계속 실패해도 chord 콜백이 실행되어 나머지 청크의 이상행동 구간은 저장
+        '''
+        # When
+        with patch('takers.tasks.get_s3_client', return_value=self.s3_client), \
+                patch.object(analyze_chunk_task, 'max_retries', 0):
+            analyze_video_task(self.taker.id, self.exam.id)
+
+        # Then
+        self.taker.refresh_from_db()
+        self.assertEqual(self.taker.stored_state, 'analyzed')
+        self.assertEqual(mock_detect.call_count, 2)
+        abnormals = self.taker.abnormalList.order_by('detected_time')
+        self.assertEqual(
+            [(abnormal.type, str(abnormal.detected_time), str(abnormal.end_time)) for abnormal in abnormals],
+            [('pen', '00:00:01', '00:00:03'), ('pen', '00:00:21', '00:00:23')]
+        )
+
+    def test_save_analysis_result_replaces_previous_ai_abnormals(self):
+        '''
+        재병합으로 분석 결과를 다시 저장하면 이전 분석 결과만 교체하고 응시 화면에서 등록한 이상행동은 유지
+        '''
+        # Given
+        Abnormal.objects.create(taker=self.taker, type='absence', detected_time='00:00:05', end_time='00:00:08')
+        chunk_results = [{'pen': [{'start': 1, 'end': 3}]}, {'cup': [{'start': 12, 'end': 14}]}]
+        save_analysis_result_task(chunk_results, self.taker.id)
+
+        # When
+        save_analysis_result_task(chunk_results, self.taker.id)
+
+        # Then
+        self.assertEqual(
+            sorted(self.taker.abnormalList.values_list('type', 'source')),
+            [('absence', 'client'), ('cup', 'ai'), ('pen', 'ai')]
+        )
+
+
+class PrepareChunkTaskTestCase(SimpleTestCase):
+    def test_prepare_chunk_max_retries_exceeded(self):
+        '''
+        재시도 횟수를 다 쓴 청크 정규화 작업은 예외 대신 오류 메시지를 반환 (퇴실 시 병합 작업이 원본 청크를 정규화)
+        '''
+        # Given
+        video_file = '1/1/webcam_093000_093010.webm'
+        s3_client = StubS3Client(failing_keys={video_file})
+
+        # When
+        with patch('takers.tasks.get_s3_client', return_value=s3_client):
+            result = prepare_chunk_task.apply(args=(1, 1, video_file), retries=prepare_chunk_task.max_retries)
+
+        # Then
+        self.assertTrue(result.successful())
+        self.assertEqual(result.get(), f'Error: download failed: {video_file}')
+
+    @override_settings(AWS_STORAGE_BUCKET_NAME='bucket')
+    @patch('takers.tasks.normalize_video')
+    @patch('takers.tasks.probe_video', return_value={'streams': []})
+    def test_prepare_chunk_checkpoint_key_has_source_etag(self, mock_probe, mock_normalize):
+        '''
+        정규화한 구간은 원본 청크의 ETag를 붙인 normalized/ 경로에 저장
+        '''
+        # Given
+        video_file = '1/1/webcam_093000_093010.webm'
+        s3_client = StubMergeS3Client({video_file: '"abc123-2"'})
+
+        # When
+        with patch('takers.tasks.get_s3_client', return_value=s3_client):
+            prepare_chunk_task(1, 1, video_file)
+
+        # Then
+        self.assertEqual(s3_client.uploaded, ['1/1/normalized/webcam_093000_093010.abc123-2.webm'])
+
+
+@override_settings(
+    AWS_STORAGE_BUCKET_NAME='bucket',
+    VIDEO_MERGE_STREAM_COPY=True,
+    VIDEO_MERGE_CHECKPOINT=True,
+    VIDEO_MERGE_DOWNLOAD_WORKERS=2,
+    VIDEO_MERGE_PREFETCH_DEPTH=2
+)
+class MergeVideosTaskTestCase(TestCase):
+    def setUp(self):
+        self.taker = create_taker()
+        self.folder_path = f'{self.taker.exam_id}/{self.taker.id}'
+        self.video_files = [f'{self.folder_path}/webcam_093000_093010.webm', f'{self.folder_path}/webcam_093010_093020.webm']
+        self.chunk_objects = {video_file: f'"etag-{index}"' for index, video_file in enumerate(self.video_files)}
+
+        # 인코딩/병합은 출력 파일만 만들고, 병합 영상 업로드와 분석 작업 등록은 기록만 함
+        def write_output(input_path, output_path, probe=None):
+            with open(output_path, 'wb') as f:
+                f.write(b'video')
+            return output_path
+
+        self.mock_normalize = self.start_patch(
+            'takers.tasks.normalize_video', side_effect=lambda *args: (write_output(*args), False)
+        )
+        self.mock_transcode = self.start_patch('takers.tasks.transcode_video', side_effect=write_output)
+        self.start_patch('takers.tasks.concat_videos', side_effect=lambda concat_path, output_path, **kwargs: write_output(concat_path, output_path))
+        self.mock_upload = self.start_patch('takers.tasks.upload_file')
+        self.mock_analyze = self.start_patch('takers.tasks.analyze_video_task')
+        self.mock_duration = self.start_patch('takers.tasks.get_video_duration', return_value=10.0)
+
+    def start_patch(self, target, **kwargs):
+        patcher = patch(target, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def merge(self, s3_client):
+        with patch('takers.tasks.get_s3_client', return_value=s3_client):
+            return merge_videos_task(self.taker.id, self.taker.exam_id)
+
+    def fingerprint(self):
+        return get_inputs_fingerprint([{'Key': key, 'ETag': etag} for key, etag in self.chunk_objects.items()])
+
+    def test_merge_skipped_when_fingerprint_matches(self):
+        '''
+        같은 청크 목록으로 병합된 영상이 있으면 다시 병합하지 않고, 분석까지 끝난 응시자는 분석도 다시 등록하지 않음
+        '''
+        # Given
+        self.taker.stored_state = 'analyzed'
+        self.taker.save()
+        s3_client = StubMergeS3Client(self.chunk_objects, merged_fingerprint=self.fingerprint())
+
+        # When
+        result = self.merge(s3_client)
+
+        # Then
+        self.assertEqual(result, '이미 병합된 영상이 있습니다.')
+        self.assertEqual(s3_client.downloaded, [])
+        self.mock_upload.assert_not_called()
+        self.mock_analyze.delay.assert_not_called()
+
+    def test_merge_when_fingerprint_mismatches(self):
+        '''
+        청크 목록이 바뀌어 fingerprint가 다르면 다시 병합하고, 새 fingerprint를 메타데이터로 업로드한 뒤 정규화 구간을 체크포인트
+        '''
+        # Given
+        s3_client = StubMergeS3Client(self.chunk_objects, merged_fingerprint='stale')
+
+        # When
+        self.merge(s3_client)
+
+        # Then
+        self.assertEqual(sorted(s3_client.downloaded), self.video_files)
+        self.assertEqual(
+            self.mock_upload.call_args.kwargs['extra_args']['Metadata'],
+            {'inputs-fingerprint': self.fingerprint()}
+        )
+        self.assertEqual(sorted(s3_client.uploaded), [
+            f'{self.folder_path}/normalized/webcam_093000_093010.etag-0.webm',
+            f'{self.folder_path}/normalized/webcam_093010_093020.etag-1.webm',
+        ])
+        self.taker.refresh_from_db()
+        self.assertEqual(self.taker.stored_state, 'done')
+        self.mock_analyze.delay.assert_called_once_with(
+            self.taker.id, self.taker.exam_id, [(self.video_files[0], 0), (self.video_files[1], 10)]
+        )
+
+    def test_merge_passes_chunk_starts_on_merged_timeline(self):
+        '''
+        청크 사이 공백(분 경계 포함)과 실제 청크 길이로 계산한 병합 영상 기준 시작 위치를 분석 작업에 전달
+        '''
+        # Given
+        video_files = [f'{self.folder_path}/webcam_093050_093100.webm', f'{self.folder_path}/webcam_093110_093120.webm']
+        s3_client = StubMergeS3Client({video_file: '"etag"' for video_file in video_files})
+        self.mock_duration.return_value = 9.6
+
+        # When
+        with patch('takers.tasks.compose_black_segments', return_value=[]) as mock_black:
+            self.merge(s3_client)
+
+        # Then
+        self.assertEqual(mock_black.call_args.args[0], 10)
+        self.mock_analyze.delay.assert_called_once_with(
+            self.taker.id, self.taker.exam_id, [(video_files[0], 0), (video_files[1], 20)]
+        )
+
+    def test_merge_reuses_checkpoint(self):
+        '''
+        현재 원본 ETag로 체크포인트된 정규화 구간은 원본 대신 받아 그대로 이어붙이고, 이전 원본의 구간은 무시하고 다시 정규화 후 체크포인트
+        '''
+        # Given
+        normalized_key = f'{self.folder_path}/normalized/webcam_093000_093010.etag-0.webm'
+        stale_key = f'{self.folder_path}/normalized/webcam_093010_093020.etag-old.webm'
+        s3_client = StubMergeS3Client({**self.chunk_objects, normalized_key: '"normalized"', stale_key: '"stale"'})
+
+        # When
+        self.merge(s3_client)
+
+        # Then
+        self.assertEqual(sorted(s3_client.downloaded), sorted([normalized_key, self.video_files[1]]))
+        self.assertEqual(self.mock_normalize.call_count, 1)
+        self.assertEqual(s3_client.uploaded, [f'{self.folder_path}/normalized/webcam_093010_093020.etag-1.webm'])
+
+    @override_settings(VIDEO_MERGE_STREAM_COPY=False)
+    def test_merge_without_stream_copy_skips_checkpoint(self):
+        '''
+        스트림 복사를 끄고 transcode_video로 인코딩한 구간은 체크포인트하지 않음
+        '''
+        # Given
+        s3_client = StubMergeS3Client(self.chunk_objects)
+
+        # When
+        self.merge(s3_client)
+
+        # Then
+        self.assertEqual(self.mock_transcode.call_count, 2)
+        self.mock_normalize.assert_not_called()
+        self.assertEqual(s3_client.uploaded, [])
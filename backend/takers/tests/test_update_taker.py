@@ -104,7 +104,7 @@ class UpdateTakerTestCase(APITestCase):
         self.assertEqual(response.data['message'], '잘못된 요청입니다.')
 
     @freeze_time("2024-11-14 12:50:00")
-    @patch('boto3.client')
+    @patch('takers.views.get_s3_client')
     def test_update_taker_s3_upload_failure(self, mock_s3_client):
         '''
         S3 업로드 실패 시 - 500
@@ -0,0 +1,164 @@
+import shutil
+import tempfile
+from unittest.mock import patch
+from django.test import SimpleTestCase
+
+from takers.video import is_target_format, normalize_video, compose_black_segments, get_video_duration
+
+
+def make_probe(video=None, audio=None):
+    video_stream = {
+        'codec_type': 'video',
+        'codec_name': 'vp8',
+        'width': 1280,
+        'height': 720,
+        'pix_fmt': 'yuv420p',
+        **(video or {}),
+    }
+    audio_stream = {
+        'codec_type': 'audio',
+        'codec_name': 'vorbis',
+        'sample_rate': '44100',
+        'channels': 2,
+        **(audio or {}),
+    }
+    return {'streams': [video_stream, audio_stream]}
+
+
+class NormalizeVideoTestCase(SimpleTestCase):
+    def test_is_target_format(self):
+        '''
+        영상/음성 스트림이 모두 기준 포맷이면 True, 코덱/해상도/음성 구성이 다르면 False
+        '''
+        self.assertTrue(is_target_format(make_probe()))
+        self.assertFalse(is_target_format(make_probe(video={'codec_name': 'h264'})))
+        self.assertFalse(is_target_format(make_probe(video={'width': 640, 'height': 480})))
+        self.assertFalse(is_target_format(make_probe(audio={'codec_name': 'opus'})))
+        self.assertFalse(is_target_format({'streams': make_probe()['streams'][:1]}))
+        self.assertFalse(is_target_format(None))
+
+    @patch('takers.video.probe_video')
+    def test_get_video_duration(self, mock_probe):
+        '''
+        컨테이너의 재생 길이를 초 단위로 반환하고, 확인할 수 없으면 default 반환
+        '''
+        mock_probe.return_value = {'format': {'duration': '9.640000'}}
+        self.assertEqual(get_video_duration('chunk.webm', 10), 9.64)
+
+        for probe in [None, {'format': {}}, {'format': {'duration': 'N/A'}}]:
+            mock_probe.return_value = probe
+            self.assertEqual(get_video_duration('chunk.webm', 10), 10)
+
+    @patch('takers.video.transcode_video')
+    @patch('takers.video.ffmpeg.run')
+    def test_normalize_video_stream_copy(self, mock_run, mock_transcode):
+        '''
+        기준 포맷과 같은 청크는 재인코딩하지 않고 스트림 복사로 리먹싱
+        '''
+        # When
+        output_path, transcoded = normalize_video('input.webm', 'output.webm', make_probe())
+
+        # Then
+        self.assertEqual(output_path, 'output.webm')
+        self.assertFalse(transcoded)
+        mock_transcode.assert_not_called()
+        args = mock_run.call_args[0][0].get_args()
+        self.assertIn('copy', args[args.index('-c') + 1])
+
+    @patch('takers.video.transcode_video', side_effect=lambda input_path, output_path, probe: output_path)
+    @patch('takers.video.ffmpeg.run')
+    def test_normalize_video_transcode_mismatched_codec(self, mock_run, mock_transcode):
+        '''
+        코덱이 다른 청크는 해당 청크만 재인코딩
+        '''
+        # Given
+        probe = make_probe(video={'codec_name': 'h264'})
+
+        # When
+        output_path, transcoded = normalize_video('input.webm', 'output.webm', probe)
+
+        # Then
+        self.assertEqual(output_path, 'output.webm')
+        self.assertTrue(transcoded)
+        mock_transcode.assert_called_once_with('input.webm', 'output.webm', probe)
+        mock_run.assert_not_called()
+
+    @patch('takers.video.transcode_video', side_effect=lambda input_path, output_path, probe: output_path)
+    @patch('takers.video.ffmpeg.run')
+    def test_normalize_video_transcode_mismatched_resolution(self, mock_run, mock_transcode):
+        '''
+        해상도가 다른 청크는 재인코딩
+        '''
+        # When
+        _, transcoded = normalize_video('input.webm', 'output.webm', make_probe(video={'width': 640, 'height': 480}))
+
+        # Then
+        self.assertTrue(transcoded)
+        mock_transcode.assert_called_once()
+        mock_run.assert_not_called()
+
+
+class BlackSegmentTestCase(SimpleTestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.created = []
+
+        # 실제 인코딩 대신 길이를 내용으로 기록한 파일을 생성
+        def create_black_video(duration, output_path):
+            self.created.append(duration)
+            with open(output_path, 'w') as f:
+                f.write(str(duration))
+            return output_path
+
+        patcher = patch('takers.video.create_black_video', side_effect=create_black_video)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def segment_durations(self, segments):
+        durations = []
+        for segment in segments:
+            with open(segment) as f:
+                durations.append(int(f.read()))
+        return durations
+
+    def test_compose_black_segments(self):
+        '''
+        공백을 표준 길이 조각으로 나누고 조각 길이의 합은 공백 길이와 같으며, 같은 길이는 한 번만 생성
+        '''
+        # When
+        segments = compose_black_segments(157, [60, 30, 5, 1], self.cache_dir)
+
+        # Then
+        self.assertEqual(self.segment_durations(segments), [60, 60, 30, 5, 1, 1])
+        self.assertEqual(sum(self.segment_durations(segments)), 157)
+        self.assertEqual(sorted(self.created), [1, 5, 30, 60])
+
+    def test_compose_black_segments_remainder(self):
+        '''
+        표준 길이로 나누어 떨어지지 않는 나머지는 해당 길이의 구간을 생성
+        '''
+        # When
+        segments = compose_black_segments(97, [60, 30], self.cache_dir)
+
+        # Then
+        self.assertEqual(self.segment_durations(segments), [60, 30, 7])
+        self.assertEqual(sum(self.segment_durations(segments)), 97)
+
+    def test_compose_black_segments_cache_hit(self):
+        '''
+        이미 캐시된 길이의 구간은 다시 인코딩하지 않고 같은 파일을 재사용
+        '''
+        # Given
+        first_segments = compose_black_segments(65, [60, 30, 5, 1], self.cache_dir)
+        self.created.clear()
+
+        # When
+        second_segments = compose_black_segments(125, [60, 30, 5, 1], self.cache_dir)
+
+        # Then
+        self.assertEqual(self.created, [])
+        self.assertEqual(second_segments, [first_segments[0], first_segments[0], first_segments[1]])
+        self.assertEqual(sum(self.segment_durations(second_segments)), 125)
@@ -0,0 +1,221 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from freezegun import freeze_time
+from rest_framework.test import APITestCase
+from unittest.mock import patch
+from botocore.exceptions import ClientError
+from datetime import timedelta
+from django.utils import timezone
+from datetime import datetime
+from exams.models import Exam
+from takers.models import Taker
+from takers.serializers import TakerTokenSerializer
+from rest_framework import status
+
+User = get_user_model()
+
+class WebCamUploadTestCase(APITestCase):
+    @freeze_time("2024-11-14 12:00:00")
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='webcamupload1@example.com',
+            password='password',
+            name='Test User',
+            birth='2000-01-01',
+            policy=True,
+            marketing=True
+        )
+
+        start_time = timezone.now()
+
+        self.exam = Exam.objects.create(
+            user=self.user,
+            title="Web Cam Upload",
+            date=datetime.today(),
+            entry_time=start_time - timedelta(minutes=30),
+            start_time=start_time.time(),
+            exit_time=start_time.time(),
+            end_time=(timezone.now() + timedelta(hours=2)).time(),
+            url="https://example.com",
+            expected_taker=10,
+            cost=10
+        )
+
+        self.taker = Taker.objects.create(
+            name="Test Taker",
+            exam=self.exam,
+            email="taker@example.com",
+        )
+        self.token = str(TakerTokenSerializer.get_access_token(self.taker))
+        self.upload_url = '/api/taker/webcam/upload/'
+        self.complete_url = '/api/taker/webcam/complete/'
+        self.key = f"{self.exam.id}/{self.taker.id}/webcam_125000_125010.webm"
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.get_s3_client')
+    def test_web_cam_upload_url(self, mock_s3_client):
+        '''
+        Content-Type과 파일 크기를 제한하는 POST 정책 발급 - 200
+        '''
+        # Given
+        mock_s3_client.return_value.generate_presigned_post.return_value = {
+            'url': 'https://s3.example.com/',
+            'fields': {'key': self.key, 'policy': 'policy'}
+        }
+        data = {
+            'start_time': '12:50:00',
+            'end_time': '12:50:10',
+            'method': 'PUT'
+        }
+
+        # When
+        with self.settings(WEBCAM_UPLOAD_MAX_SIZE=1024):
+            response = self.client.post(self.upload_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['url'], 'https://s3.example.com/')
+        self.assertEqual(response.data['fields']['key'], self.key)
+        self.assertEqual(response.data['key'], self.key)
+        mock_s3_client.return_value.generate_presigned_url.assert_not_called()
+        _, kwargs = mock_s3_client.return_value.generate_presigned_post.call_args
+        self.assertEqual(kwargs['Key'], self.key)
+        self.assertIn({'Content-Type': 'video/webm'}, kwargs['Conditions'])
+        self.assertIn(['content-length-range', 1, 1024], kwargs['Conditions'])
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.get_s3_client')
+    def test_web_cam_upload_url_invalid_time(self, mock_s3_client):
+        '''
+        시간 형식이 올바르지 않은 경우 (다른 경로 지정 시도) - 400
+        '''
+        # Given
+        data = {
+            'start_time': '../../1',
+            'end_time': '12:50:10'
+        }
+
+        # When
+        response = self.client.post(self.upload_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['message'], '잘못된 요청입니다.')
+        mock_s3_client.return_value.generate_presigned_post.assert_not_called()
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.get_s3_client')
+    def test_web_cam_upload_url_not_fixed_width_time(self, mock_s3_client):
+        '''
+        시각이 HH:mm:ss(6자리)가 아니거나 범위를 벗어난 경우 - 400
+        '''
+        for start_time in ['9:50:00', '12:50:0', '125000000', '12:60:00', '24:00:00']:
+            with self.subTest(start_time=start_time):
+                # Given
+                data = {
+                    'start_time': start_time,
+                    'end_time': '12:50:10'
+                }
+
+                # When
+                response = self.client.post(self.upload_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+                # Then
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['message'], '잘못된 요청입니다.')
+        mock_s3_client.return_value.generate_presigned_post.assert_not_called()
+
+    @freeze_time("2024-11-14 12:50:00")
+    def test_web_cam_upload_url_start_time_greater_than_end_time(self):
+        '''
+        start_time이 end_time보다 클 때 - 400
+        '''
+        # Given
+        data = {
+            'start_time': '14:30:00',
+            'end_time': '13:30:00'
+        }
+
+        # When
+        response = self.client.post(self.upload_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['message'], '시작 시간이 종료 시간보다 클 수 없습니다.')
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.prepare_chunk_task')
+    @patch('takers.views.get_s3_client')
+    def test_web_cam_upload_complete(self, mock_s3_client, mock_prepare_chunk_task):
+        '''
+        업로드 완료 알림 - 200
+        '''
+        # Given
+        mock_s3_client.return_value.head_object.return_value = {'ContentType': 'video/webm', 'ContentLength': 1024}
+        data = {
+            'start_time': '12:50:00',
+            'end_time': '12:50:10'
+        }
+
+        # When
+        with self.settings(VIDEO_INCREMENTAL_NORMALIZE=True):
+            response = self.client.post(self.complete_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['message'], '웹캠 영상이 저장되었습니다.')
+        mock_prepare_chunk_task.delay.assert_called_once_with(self.taker.id, self.exam.id, self.key)
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.prepare_chunk_task')
+    @patch('takers.views.get_s3_client')
+    def test_web_cam_upload_complete_not_uploaded(self, mock_s3_client, mock_prepare_chunk_task):
+        '''
+        S3에 업로드된 파일이 없는 경우 - 404
+        '''
+        # Given
+        mock_s3_client.return_value.head_object.side_effect = ClientError(
+            {'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject'
+        )
+        data = {
+            'start_time': '12:50:00',
+            'end_time': '12:50:10'
+        }
+
+        # When
+        response = self.client.post(self.complete_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['message'], '업로드된 웹캠 영상이 없습니다.')
+        mock_prepare_chunk_task.delay.assert_not_called()
+
+    @freeze_time("2024-11-14 12:50:00")
+    @patch('takers.views.prepare_chunk_task')
+    @patch('takers.views.get_s3_client')
+    def test_web_cam_upload_complete_invalid_object(self, mock_s3_client, mock_prepare_chunk_task):
+        '''
+        업로드된 파일의 Content-Type이 다르거나 크기가 0 또는 제한을 넘는 경우 삭제 - 400
+        '''
+        for head in [
+            {'ContentType': 'text/html', 'ContentLength': 1024},
+            {'ContentType': 'video/webm', 'ContentLength': 0},
+            {'ContentType': 'video/webm', 'ContentLength': 2048},
+        ]:
+            with self.subTest(head=head):
+                # Given
+                mock_s3_client.return_value.head_object.return_value = head
+                data = {
+                    'start_time': '12:50:00',
+                    'end_time': '12:50:10'
+                }
+
+                # When
+                with self.settings(VIDEO_INCREMENTAL_NORMALIZE=True, WEBCAM_UPLOAD_MAX_SIZE=1024):
+                    response = self.client.post(self.complete_url, data, format='json', HTTP_AUTHORIZATION=f'Bearer {self.token}')
+
+                # Then
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['message'], '업로드된 웹캠 영상 형식이 올바르지 않습니다.')
+                mock_s3_client.return_value.delete_object.assert_called_with(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=self.key)
+        mock_prepare_chunk_task.delay.assert_not_called()
@@ -0,0 +1,174 @@
+import io
+import uuid
+import logging
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from rest_framework.exceptions import ParseError
+from proctormatic.utils import internal_server_error
+from takers.storage import get_s3_client
+
+
+class S3UploadedFile(UploadedFile):
+    # 본문은 이미 S3 임시 경로에 올라가 있고, 서버에는 key와 메타데이터만 남음
+    def __init__(self, key, name, content_type, size, charset, content_type_extra=None):
+        super().__init__(None, name, content_type, size, charset, content_type_extra)
+        self.key = key
+
+    def save_to(self, s3_client, key):
+        # S3 내부 복사로 최종 경로에 저장 (파일 내용이 다시 서버를 거치지 않음)
+        s3_client.copy_object(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=key,
+            CopySource={'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': self.key}
+        )
+        self.discard(s3_client)
+        return key
+
+    def discard(self, s3_client):
+        try:
+            s3_client.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=self.key)
+        except Exception as e:
+            logging.error(f"임시 업로드 파일 삭제 실패 {self.key}: {str(e)}")
+
+
+class S3StreamingUploadHandler(FileUploadHandler):
+    # multipart 요청의 파일 본문을 받는 즉시 S3 multipart upload의 part로 전송
+    # 요청당 메모리 사용량은 파일 크기와 관계없이 part 하나 크기로 제한됨
+    def __init__(self, request=None, key_prefix=None):
+        super().__init__(request)
+        self.key_prefix = key_prefix
+        self.part_size = max(settings.S3_STREAMING_UPLOAD_PART_SIZE, 5 * 1024 * 1024)
+        self.s3_client = None
+        self.key = None
+        self.upload_id = None
+        self.parts = []
+        self.buffer = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.s3_client = get_s3_client()
+        self.key = f"{self.key_prefix}/uploads/{uuid.uuid4().hex}" if self.key_prefix else f"uploads/{uuid.uuid4().hex}"
+        self.upload_id = None
+        self.parts = []
+        self.buffer = io.BytesIO()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.buffer.write(raw_data)
+        if self.buffer.tell() >= self.part_size:
+            self.flush_part()
+        # None을 반환해 다른 핸들러(메모리/임시 파일)로 데이터가 넘어가지 않도록 함
+        return None
+
+    def flush_part(self):
+        data = self.buffer.getvalue()
+        self.buffer = io.BytesIO()
+
+        try:
+            if self.upload_id is None:
+                self.upload_id = self.s3_client.create_multipart_upload(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Key=self.key,
+                    ContentType=self.content_type
+                )['UploadId']
+
+            part_number = len(self.parts) + 1
+            response = self.s3_client.upload_part(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Key=self.key,
+                UploadId=self.upload_id,
+                PartNumber=part_number,
+                Body=data
+            )
+            self.parts.append({'PartNumber': part_number, 'ETag': response['ETag']})
+        except Exception:
+            self.abort()
+            raise
+
+    def file_complete(self, file_size):
+        try:
+            if self.upload_id is None:
+                # part 하나 크기보다 작은 파일은 multipart 없이 한 번에 업로드
+                self.s3_client.put_object(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Key=self.key,
+                    Body=self.buffer.getvalue(),
+                    ContentType=self.content_type
+                )
+            else:
+                if self.buffer.tell():
+                    self.flush_part()
+                self.s3_client.complete_multipart_upload(
+                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                    Key=self.key,
+                    UploadId=self.upload_id,
+                    MultipartUpload={'Parts': self.parts}
+                )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self.buffer = None
+
+        return S3UploadedFile(
+            key=self.key,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra
+        )
+
+    def upload_interrupted(self):
+        self.abort()
+
+    def abort(self):
+        if self.upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Key=self.key,
+                UploadId=self.upload_id
+            )
+        except Exception as e:
+            logging.error(f"multipart upload 취소 실패 {self.key}: {str(e)}")
+        self.upload_id = None
+
+
+def use_s3_streaming_upload(request, key_prefix):
+    # request.data/FILES에 접근하기 전에 호출해야 파싱 시 핸들러가 적용됨
+    if settings.S3_STREAMING_UPLOAD:
+        request.upload_handlers = [S3StreamingUploadHandler(request, key_prefix)]
+
+
+def receive_uploaded_files(request, key_prefix):
+    # 설정 시 파일 본문을 서버에 버퍼링하지 않고 받는 즉시 S3로 전송
+    use_s3_streaming_upload(request, key_prefix)
+    try:
+        return request.FILES, None
+    except ParseError:
+        # 잘못된 multipart 요청은 DRF가 400으로 응답하도록 그대로 전달
+        raise
+    except Exception as e:
+        # 파일을 받는 도중 S3 전송이 실패한 경우
+        return None, internal_server_error(f'S3 업로드 실패: {str(e)}')
+
+
+def store_uploaded_file(s3_client, uploaded_file, s3_path):
+    if isinstance(uploaded_file, S3UploadedFile):
+        return uploaded_file.save_to(s3_client, s3_path)
+
+    s3_client.upload_fileobj(
+        uploaded_file,
+        settings.AWS_STORAGE_BUCKET_NAME,
+        s3_path,
+        ExtraArgs={'ContentType': uploaded_file.content_type}
+    )
+    return s3_path
+
+
+def discard_uploaded_files(s3_client, files):
+    for uploaded_file in files.values():
+        if isinstance(uploaded_file, S3UploadedFile):
+            uploaded_file.discard(s3_client)
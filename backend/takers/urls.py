@@ -6,5 +6,7 @@ urlpatterns = [
     path('email/', views.check_email),
     path('photo/', views.update_taker),
     path('webcam/', views.add_web_cam),
+    path('webcam/upload/', views.web_cam_upload_url),
+    path('webcam/complete/', views.web_cam_upload_complete),
     path('abnormal/', views.add_abnormal),
 ]
\ No newline at end of file
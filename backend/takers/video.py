@@ -0,0 +1,182 @@
+import os
+import logging
+import tempfile
+import ffmpeg
+
+if os.name == 'nt':  # Windows일 때
+    FFMPEG_PATH = r'C:\ffmpeg-7.1-essentials_build\bin\ffmpeg.exe'
+    FFPROBE_PATH = r'C:\ffmpeg-7.1-essentials_build\bin\ffprobe.exe'
+elif os.name == 'posix':  # Linux(우분투)일 때
+    FFMPEG_PATH = '/usr/bin/ffmpeg'
+    FFPROBE_PATH = '/usr/bin/ffprobe'
+else:
+    raise EnvironmentError("알 수 없는 운영체제 입니다.")
+# FFMPEG_PATH = '/usr/bin/ffmpeg'  # ffmpeg의 절대 경로 지정
+
+# 병합 영상의 기준 포맷 (모든 구간이 이 포맷이어야 -c copy로 이어붙일 수 있음)
+TARGET_WIDTH = 1280
+TARGET_HEIGHT = 720
+TARGET_VIDEO_CODEC = 'vp8'
+TARGET_AUDIO_CODEC = 'vorbis'
+TARGET_PIX_FMT = 'yuv420p'
+TARGET_SAMPLE_RATE = 44100
+TARGET_CHANNELS = 2
+
+ENCODE_OPTIONS = {
+    'vcodec': 'vp8',
+    'acodec': 'libvorbis',
+    'preset': 'medium',
+    'crf': 23,
+    'video_bitrate': '2000k',
+    'audio_bitrate': '192k',
+    's': f'{TARGET_WIDTH}x{TARGET_HEIGHT}',
+    'pix_fmt': TARGET_PIX_FMT,
+    'ar': TARGET_SAMPLE_RATE,
+    'ac': TARGET_CHANNELS,
+}
+
+
+def probe_video(video_path):
+    try:
+        return ffmpeg.probe(video_path, cmd=FFPROBE_PATH)
+    except ffmpeg.Error as e:
+        logging.warning(f"ffprobe 실패 {video_path}: {e.stderr.decode('utf-8', 'ignore') if e.stderr else str(e)}")
+        return None
+
+
+def get_video_duration(video_path, default=None):
+    # 컨테이너에 기록된 재생 길이(초), 확인할 수 없으면 default 반환
+    probe = probe_video(video_path)
+    try:
+        return float(probe['format']['duration'])
+    except (TypeError, KeyError, ValueError):
+        return default
+
+
+def is_target_format(probe):
+    # 영상 1개 + 음성 1개가 모두 기준 포맷과 같을 때만 스트림 복사 가능
+    if not probe:
+        return False
+
+    video_streams = [s for s in probe.get('streams', []) if s.get('codec_type') == 'video']
+    audio_streams = [s for s in probe.get('streams', []) if s.get('codec_type') == 'audio']
+    if len(video_streams) != 1 or len(audio_streams) != 1:
+        return False
+
+    video, audio = video_streams[0], audio_streams[0]
+    return (
+        video.get('codec_name') == TARGET_VIDEO_CODEC
+        and video.get('width') == TARGET_WIDTH
+        and video.get('height') == TARGET_HEIGHT
+        and video.get('pix_fmt') == TARGET_PIX_FMT
+        and audio.get('codec_name') == TARGET_AUDIO_CODEC
+        and int(audio.get('sample_rate', 0)) == TARGET_SAMPLE_RATE
+        and audio.get('channels') == TARGET_CHANNELS
+    )
+
+
+def has_audio_stream(probe):
+    if not probe:
+        return True
+    return any(s.get('codec_type') == 'audio' for s in probe.get('streams', []))
+
+
+def transcode_video(input_path, output_path, probe=None):
+    source = ffmpeg.input(input_path)
+
+    if has_audio_stream(probe):
+        stream = ffmpeg.output(source, output_path, **ENCODE_OPTIONS)
+    else:
+        # 웹캠 청크는 음성이 없으므로 무음 트랙을 붙여 모든 구간의 스트림 구성을 맞춤
+        silence = ffmpeg.input(f'anullsrc=r={TARGET_SAMPLE_RATE}:cl=stereo', f='lavfi')
+        stream = ffmpeg.output(source.video, silence.audio, output_path, shortest=None, **ENCODE_OPTIONS)
+
+    ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)  # 절대 경로 지정
+    return output_path
+
+
+def normalize_video(input_path, output_path, probe=None):
+    # 기준 포맷과 같으면 재인코딩 없이 리먹싱만, 다르면 해당 청크만 재인코딩
+    probe = probe or probe_video(input_path)
+
+    if is_target_format(probe):
+        stream = ffmpeg.output(ffmpeg.input(input_path), output_path, c='copy')
+        ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)
+        return output_path, False
+
+    return transcode_video(input_path, output_path, probe), True
+
+
+def create_black_video(duration, output_path):
+    stream = ffmpeg.input(f'color=c=black:s={TARGET_WIDTH}x{TARGET_HEIGHT}:d={duration}', f='lavfi')
+    audio = ffmpeg.input(f'anullsrc=r={TARGET_SAMPLE_RATE}:cl=stereo:d={duration}', f='lavfi')
+
+    stream = ffmpeg.output(stream, audio, output_path, **ENCODE_OPTIONS)
+
+    ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)  # 절대 경로 지정
+    return output_path
+
+
+def get_black_segment(duration, cache_dir):
+    # 같은 길이의 검은 화면은 한 번만 인코딩하고 로컬 캐시를 재사용
+    segment_path = os.path.join(cache_dir, f'black_{TARGET_WIDTH}x{TARGET_HEIGHT}_{duration}s.webm')
+    if os.path.exists(segment_path):
+        return segment_path
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.webm', dir=cache_dir)
+    os.close(fd)
+
+    try:
+        create_black_video(duration, tmp_path)
+        # 여러 워커가 동시에 만들어도 완성된 파일만 보이도록 rename으로 교체
+        os.replace(tmp_path, segment_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return segment_path
+
+
+def compose_black_segments(gap_duration, durations, cache_dir):
+    # 공백 길이를 표준 길이 조각(예: 60s, 30s, 5s, 1s)의 합으로 나누어 캐시된 구간으로 채움
+    segments = []
+    remaining = gap_duration
+
+    for duration in sorted(durations, reverse=True):
+        count, remaining = divmod(remaining, duration)
+        if count:
+            segments.extend([get_black_segment(duration, cache_dir)] * int(count))
+
+    # 표준 길이로 나누어 떨어지지 않는 나머지는 해당 길이로 생성(역시 캐시됨)
+    if remaining > 0:
+        segments.append(get_black_segment(remaining, cache_dir))
+
+    return segments
+
+
+def write_concat_file(video_paths, concat_file_path):
+    with open(concat_file_path, 'w', encoding='utf-8') as f:
+        for video_path in video_paths:
+            video_path = video_path.replace('\\', '/')
+            f.write(f"file '{video_path}'\n")
+    return concat_file_path
+
+
+def concat_videos(concat_file_path, output_path, stream_copy=True):
+    stream = ffmpeg.input(concat_file_path, format='concat', safe=0)
+
+    if stream_copy:
+        # 모든 구간이 기준 포맷으로 정규화되어 있으므로 재인코딩 없이 이어붙임
+        stream = ffmpeg.output(stream, output_path, c='copy')
+    else:
+        stream = ffmpeg.output(stream,
+                               output_path,
+                               vcodec='vp8',
+                               acodec='libvorbis',
+                               preset='medium',
+                               crf=23,
+                               pix_fmt='yuv420p')
+
+    ffmpeg.run(stream, cmd=FFMPEG_PATH, overwrite_output=True)  # 절대 경로 지정
+    return output_path
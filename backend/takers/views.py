@@ -13,13 +13,18 @@ from .authentication import CustomJWTAuthentication
 from .models import Taker, Logs
 from .serializers import TakerSerializer, UpdateTakerSerializer, TakerTokenSerializer, AbnormalSerializer
 from .swagger_schemas import add_taker_schema, check_email_schema, add_web_cam_schame, update_taker_schema, \
-    add_abnormal_schema
+    add_abnormal_schema, web_cam_upload_url_schema, web_cam_upload_complete_schema
 from django_redis import get_redis_connection
 from django.utils import timezone
 from datetime import datetime
 from django.conf import settings
-import boto3
-from takers.tasks import merge_videos_task
+from django.db import transaction, IntegrityError
+from botocore.exceptions import ClientError
+from takers.storage import get_s3_client
+from takers.upload_handlers import receive_uploaded_files, store_uploaded_file, discard_uploaded_files
+from takers.tasks import merge_videos_task, prepare_chunk_task, parse_chunk_time
+
+WEB_CAM_CONTENT_TYPE = 'video/webm'
 
 @add_taker_schema
 @api_view(['POST', 'PATCH'])
@@ -55,7 +60,12 @@ def add_taker(request):
             if exam.total_taker >= exam.expected_taker:
                 return too_many_requests_response('참가자 수를 초과했습니다.')
 
-            taker = serializer.save()
+            try:
+                with transaction.atomic():
+                    taker = serializer.save()
+            except IntegrityError:
+                # 같은 이메일로 동시에 입장한 경우 (exam, email) unique 제약에 걸림
+                return conflict_response('이미 입장한 응시자입니다.')
             access_token = TakerTokenSerializer.get_access_token(taker)
 
             exam.total_taker += 1
@@ -159,27 +169,27 @@ def update_taker(request):
     taker_id = request.auth['user_id']
     required_fields = ['id_photo', 'birth', 'verification_rate']
 
+    taker = Taker.objects.filter(id=taker_id).first()
+
+    s3_client = get_s3_client()
+
+    files, error_response = receive_uploaded_files(request, f"{taker.exam_id}/{taker_id}")
+    if error_response:
+        return error_response
+
     for field in required_fields:
         if field not in request.data:
+            discard_uploaded_files(s3_client, files)
             return bad_request_invalid_data_response()
 
-    taker = Taker.objects.filter(id=taker_id).first()
-
-    s3_client = boto3.client('s3')
-
-    if 'id_photo' in request.FILES:
-        id_photo_file = request.FILES['id_photo']
+    if 'id_photo' in files:
+        id_photo_file = files['id_photo']
         _, file_extension = os.path.splitext(id_photo_file.name)
         file_name = f"idPhoto{file_extension}"
         s3_path = f"{taker.exam_id}/{taker_id}/{file_name}"
 
         try:
-            s3_client.upload_fileobj(
-                id_photo_file,
-                settings.AWS_STORAGE_BUCKET_NAME,
-                s3_path,
-                ExtraArgs={'ContentType': id_photo_file.content_type}
-            )
+            store_uploaded_file(s3_client, id_photo_file, s3_path)
             s3_file_url = f"{settings.MEDIA_URL}{s3_path}"
 
         except Exception as e:
@@ -210,37 +220,128 @@ def add_web_cam(request):
     taker = Taker.objects.filter(id=taker_id).first()
     exam_id = taker.exam_id
 
-    if 'web_cam' not in request.FILES:
+    s3_client = get_s3_client()
+
+    files, error_response = receive_uploaded_files(request, f"{exam_id}/{taker_id}")
+    if error_response:
+        return error_response
+
+    if 'web_cam' not in files:
+        discard_uploaded_files(s3_client, files)
         return bad_request_invalid_data_response()
 
-    web_cam_file = request.FILES['web_cam']
+    web_cam_file = files['web_cam']
     start_time = request.data.get('start_time')
     end_time = request.data.get('end_time')
 
     if not start_time or not end_time:
+        discard_uploaded_files(s3_client, files)
         return bad_request_invalid_data_response()
 
     start_time = start_time.replace(":", "")
     end_time = end_time.replace(":", "")
 
     if start_time > end_time:
+        discard_uploaded_files(s3_client, files)
         return bad_request_response('시작 시간이 종료 시간보다 클 수 없습니다.')
 
-    s3_client = boto3.client('s3')
     _, file_extension = os.path.splitext(web_cam_file.name)
     file_name = f'webcam_{start_time}_{end_time}{file_extension}'
     s3_path = f"{exam_id}/{taker_id}/{file_name}"
 
     try:
-        s3_client.upload_fileobj(
-            web_cam_file,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            s3_path,
-            ExtraArgs={'ContentType': web_cam_file.content_type}
-        )
+        store_uploaded_file(s3_client, web_cam_file, s3_path)
 
     except Exception as e:
         return internal_server_error(f'S3 업로드 실패: {str(e)}')
+
+    # 시험 중에 청크를 미리 정규화해 퇴실 시 병합 부하를 줄임
+    if settings.VIDEO_INCREMENTAL_NORMALIZE:
+        prepare_chunk_task.delay(taker_id, exam_id, s3_path)
+
+    return ok_response('웹캠 영상이 저장되었습니다.')
+
+
+def get_web_cam_key(request):
+    # 업로드 경로는 토큰의 응시자 기준으로만 만들어 다른 응시자 경로에 쓰지 못하도록 함
+    # 시각은 HH:mm:ss(':' 제거 시 HHMMSS 6자리)만 허용하고 초 단위로 비교
+    start_time = (request.data.get('start_time') or '').replace(":", "")
+    end_time = (request.data.get('end_time') or '').replace(":", "")
+
+    try:
+        start_seconds, end_seconds = parse_chunk_time(start_time), parse_chunk_time(end_time)
+    except ValueError:
+        return None, None, bad_request_invalid_data_response()
+
+    if start_seconds > end_seconds:
+        return None, None, bad_request_response('시작 시간이 종료 시간보다 클 수 없습니다.')
+
+    taker = Taker.objects.filter(id=request.auth['user_id']).first()
+    return taker, f"{taker.exam_id}/{taker.id}/webcam_{start_time}_{end_time}.webm", None
+
+
+@web_cam_upload_url_schema
+@api_view(['POST'])
+@authentication_classes([CustomJWTAuthentication])
+def web_cam_upload_url(request):
+    _, s3_path, error_response = get_web_cam_key(request)
+    if error_response:
+        return error_response
+
+    s3_client = get_s3_client()
+    expires_in = settings.WEBCAM_UPLOAD_URL_EXPIRES
+
+    try:
+        # presigned PUT은 파일 크기를 제한할 수 없으므로 POST 정책으로만 발급해 Content-Type과 크기를 S3에서 검증
+        presigned_post = s3_client.generate_presigned_post(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+            Key=s3_path,
+            Fields={'Content-Type': WEB_CAM_CONTENT_TYPE},
+            Conditions=[
+                {'Content-Type': WEB_CAM_CONTENT_TYPE},
+                ['content-length-range', 1, settings.WEBCAM_UPLOAD_MAX_SIZE]
+            ],
+            ExpiresIn=expires_in
+        )
+
+    except Exception as e:
+        return internal_server_error(f'업로드 URL 발급 실패: {str(e)}')
+
+    return ok_with_data_response({
+        'url': presigned_post['url'],
+        'fields': presigned_post['fields'],
+        'key': s3_path,
+        'expires_in': expires_in
+    })
+
+
+@web_cam_upload_complete_schema
+@api_view(['POST'])
+@authentication_classes([CustomJWTAuthentication])
+def web_cam_upload_complete(request):
+    taker, s3_path, error_response = get_web_cam_key(request)
+    if error_response:
+        return error_response
+
+    s3_client = get_s3_client()
+
+    try:
+        uploaded = s3_client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_path)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return not_found_response('업로드된 웹캠 영상이 없습니다.')
+        return internal_server_error(f'S3 조회 실패: {str(e)}')
+
+    # 업로드 정책을 거치지 않고 올라온 객체는 정규화/병합 대상에서 제외되도록 삭제
+    content_length = uploaded.get('ContentLength', 0)
+    if uploaded.get('ContentType') != WEB_CAM_CONTENT_TYPE or not 0 < content_length <= settings.WEBCAM_UPLOAD_MAX_SIZE:
+        s3_client.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=s3_path)
+        return bad_request_response('업로드된 웹캠 영상 형식이 올바르지 않습니다.')
+
+    # 시험 중에 청크를 미리 정규화해 퇴실 시 병합 부하를 줄임
+    if settings.VIDEO_INCREMENTAL_NORMALIZE:
+        prepare_chunk_task.delay(taker.id, taker.exam_id, s3_path)
+
     return ok_response('웹캠 영상이 저장되었습니다.')
 
 
@@ -165,7 +165,8 @@ const TestDetail = () => {
                                 ? "var(--GRAY_700)"
                                 : taker.stored_state === "in_progress"
                                 ? "var(--SECONDARY)"
-                                : taker.stored_state === "done"
+                                : taker.stored_state === "done" ||
+                                  taker.stored_state === "analyzed"
                                 ? "var(--PRIMARY)"
                                 : "var(--BLACK)",
                           }}
@@ -176,6 +177,8 @@ const TestDetail = () => {
                             ? "업로드 중"
                             : taker.stored_state === "done"
                             ? "업로드 완료"
+                            : taker.stored_state === "analyzed"
+                            ? "분석 완료"
                             : taker.stored_state}
                         </div>
                       </td>
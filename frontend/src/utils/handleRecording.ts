@@ -1,6 +1,33 @@
 import { formatDateAndTime } from "@/utils/handleDateTimeChange";
 import axiosInstance from "@/utils/axios";
 
+// 영상은 presigned URL로 S3에 직접 올리고 서버에는 업로드 완료만 알림
+const uploadWebCam = async (
+  webmBlob: Blob,
+  startTime: string,
+  endTime: string
+) => {
+  const times = { start_time: startTime, end_time: endTime };
+  const { data } = await axiosInstance.post("/taker/webcam/upload/", times);
+
+  // presigned POST 정책의 fields를 먼저 넣고 파일은 마지막에 추가 (S3는 file 이후 항목을 무시함)
+  const formData = new FormData();
+  Object.entries(data.fields as Record<string, string>).forEach(
+    ([name, value]) => formData.append(name, value)
+  );
+  formData.append("file", webmBlob);
+
+  const uploadResponse = await fetch(data.url, {
+    method: "POST",
+    body: formData,
+  });
+  if (!uploadResponse.ok) {
+    throw new Error(`S3 업로드 실패: ${uploadResponse.status}`);
+  }
+
+  return axiosInstance.post("/taker/webcam/complete/", times);
+};
+
 export const startRecording = (
   mediaRecorder: MediaRecorder | null,
   setStartTime: React.Dispatch<React.SetStateAction<string | null>>,
@@ -51,19 +78,9 @@ export const stopRecording = (
           type: "video/webm",
         });
 
-        const formData = new FormData();
-        formData.append("web_cam", webmBlob, "recorded_video.webm");
-        formData.append("start_time", startTime || "");
-        formData.append("end_time", time || "");
-
         console.log(startTime, time);
 
-        axiosInstance
-          .post("/taker/webcam/", formData, {
-            headers: {
-              "Content-Type": "multipart/form-data",
-            },
-          })
+        uploadWebCam(webmBlob, startTime || "", time || "")
           .then((response) => {
             console.log("업로드 성공: ", response.data);
           })